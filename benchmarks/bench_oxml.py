@@ -0,0 +1,146 @@
+# encoding: utf-8
+
+"""
+Micro-benchmark of oxml element access: namespace-prefixed tag conversion
+and the properties generated for declared children and attributes.
+
+Each case is timed twice: through the current code, and through
+a reproduction of the code path it replaced, in which ``qn()`` computed the
+Clark name on every call and the generated properties called ``qn()`` and
+used ``find()``/``findall()`` on every access. The ratio of the two is the
+speed-up.
+
+Run from the repository root with ``python benchmarks/bench_oxml.py``.
+Prints the best of five timings of each case, in microseconds per call.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from docx.oxml import parse_xml  # noqa: E402
+from docx.oxml.exceptions import InvalidXmlError  # noqa: E402
+from docx.oxml.ns import nsdecls, nsmap, qn  # noqa: E402
+from docx.oxml.simpletypes import ST_HpsMeasure, ST_String  # noqa: E402
+
+NUMBER = 200000
+REPEAT = 5
+
+
+def _baseline_qn(tag):
+    """
+    ``qn()`` as it was before its results were memoized.
+    """
+    prefix, tagroot = tag.split(':')
+    uri = nsmap[prefix]
+    return '{%s}%s' % (uri, tagroot)
+
+
+class _BaselineRequiredAttribute(object):
+    """
+    Getter of a ``RequiredAttribute`` property as generated before Clark
+    names were computed once per class.
+    """
+    def __init__(self, attr_name, simple_type):
+        self._attr_name = attr_name
+        self._simple_type = simple_type
+
+    @property
+    def _clark_name(self):
+        if ':' in self._attr_name:
+            return _baseline_qn(self._attr_name)
+        return self._attr_name
+
+    def get(self, obj):
+        attr_str_value = obj.get(self._clark_name)
+        if attr_str_value is None:
+            raise InvalidXmlError(
+                "required '%s' attribute not present on element %s" %
+                (self._attr_name, obj.tag)
+            )
+        return self._simple_type.from_xml(attr_str_value)
+
+
+class _BaselineChild(object):
+    """
+    Getters of a child element property as generated before Clark names
+    were computed once per class.
+    """
+    def __init__(self, nsptagname):
+        self._nsptagname = nsptagname
+
+    def get(self, obj):
+        return obj.find(_baseline_qn(self._nsptagname))
+
+    def get_list(self, obj):
+        return obj.findall(_baseline_qn(self._nsptagname))
+
+
+def cases():
+    """
+    Return a list of ``(name, baseline, current)`` triples, one for each
+    case timed, where *baseline* and *current* are callables.
+    """
+    r = parse_xml(
+        '<w:r %s><w:rPr><w:rStyle w:val="Strong"/><w:b/><w:sz w:val="24"/>'
+        '</w:rPr><w:t>abc</w:t><w:tab/><w:t>def</w:t></w:r>' % nsdecls('w')
+    )
+    p = parse_xml(
+        '<w:p %s><w:pPr><w:pStyle w:val="Heading1"/></w:pPr>%s</w:p>'
+        % (nsdecls('w'), '<w:r><w:t>x</w:t></w:r>' * 20)
+    )
+    rPr = r.rPr
+    sz = rPr.sz
+
+    rPr_child, sz_child = _BaselineChild('w:rPr'), _BaselineChild('w:sz')
+    r_child = _BaselineChild('w:r')
+    pPr_child, pStyle_child = _BaselineChild('w:pPr'), _BaselineChild('w:pStyle')
+    sz_val = _BaselineRequiredAttribute('w:val', ST_HpsMeasure)
+    pStyle_val = _BaselineRequiredAttribute('w:val', ST_String)
+
+    def baseline_sz_val():
+        sz = sz_child.get(rPr)
+        if sz is None:
+            return None
+        return sz_val.get(sz)
+
+    def baseline_style():
+        pPr = pPr_child.get(p)
+        if pPr is None:
+            return None
+        pStyle = pStyle_child.get(pPr)
+        if pStyle is None:
+            return None
+        return pStyle_val.get(pStyle)
+
+    return [
+        ("qn('w:t')", lambda: _baseline_qn('w:t'), lambda: qn('w:t')),
+        ('r.rPr (ZeroOrOne get)', lambda: rPr_child.get(r), lambda: r.rPr),
+        ('rPr.sz_val (child + attr)', baseline_sz_val, lambda: rPr.sz_val),
+        ('sz.val (RequiredAttribute)', lambda: sz_val.get(sz), lambda: sz.val),
+        ('p.r_lst (20 runs)', lambda: r_child.get_list(p), lambda: p.r_lst),
+        ('p.style', baseline_style, lambda: p.style),
+    ]
+
+
+def _time(func):
+    """
+    Return the best time of *func* in microseconds per call.
+    """
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def main():
+    print('%-28s %9s %9s %8s' % ('', 'baseline', 'current', 'speed-up'))
+    for name, baseline, current in cases():
+        assert baseline() == current(), name
+        before, after = _time(baseline), _time(current)
+        print('%-28s %6.2f us %6.2f us %7.2fx' % (name, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# encoding: utf-8
+
+"""
+Benchmark of assigning text to runs and paragraphs: ``run.text = s``,
+``paragraph.add_run(s)`` and ``paragraph.text = s`` for 1 KB, 100 KB and 1 MB
+strings of prose (a newline every 600 characters) and of dense text (a tab and
+a newline every 64 characters).
+
+Run from the repository root with ``python benchmarks/bench_run_text.py``.
+Prints the best of three timings of each case, in milliseconds per call.
+Garbage collection stays enabled while timing, as it would in real use.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import docx  # noqa: E402
+
+REPEAT = 3
+
+LINES = (
+    ('prose', ('Clause text with some words in it, repeated for a contract. ' * 10) + '\n'),
+    ('dense', 'Clause text with some words in it, repeated for a contract.\t(x)\n'),
+)
+
+SIZES = (
+    ('1 KB', 1024, 100),
+    ('100 KB', 100 * 1024, 5),
+    ('1 MB', 1024 * 1024, 1),
+)
+
+
+def _text_of_size(line, size):
+    """
+    Return *line* repeated and truncated to exactly *size* characters.
+    """
+    return (line * (size // len(line) + 1))[:size]
+
+
+def _time(func, number):
+    """
+    Return the best time of *func* in milliseconds per call.
+    """
+    timer = timeit.Timer(func, setup='gc.enable()')
+    return min(timer.repeat(number=number, repeat=REPEAT)) / number * 1e3
+
+
+def main():
+    paragraph = docx.Document().add_paragraph()
+    print('%-14s %10s %10s %10s' % ('', 'run.text', 'add_run', 'p.text'))
+    for kind, line in LINES:
+        for label, size, number in SIZES:
+            text = _text_of_size(line, size)
+            run = paragraph.add_run()
+
+            def run_text():
+                run.text = text
+
+            def add_run():
+                paragraph.add_run(text)
+                paragraph._p.remove(paragraph._p.r_lst[-1])
+
+            def paragraph_text():
+                paragraph.text = text
+
+            times = tuple(
+                _time(func, number) for func in (run_text, add_run, paragraph_text)
+            )
+            paragraph.text = ''
+            print('%-14s %10.2f %10.2f %10.2f' % (('%s %s' % (kind, label),) + times))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 # encoding: utf-8
 
 from docx.api import Document  # noqa
+from docx.stream import StreamingDocument  # noqa
 
 print('bayoo-docx version 0.2.20,edited by xwy')
 __version__ = '0.2.20' 
@@ -39,7 +40,28 @@ PartFactory.part_type_for[CT.WML_SETTINGS] = SettingsPart
 PartFactory.part_type_for[CT.WML_STYLES] = StylesPart
 PartFactory.part_type_for[CT.WML_FOOTNOTES] = FootnotesPart
 
+
+# register block item proxy types with block item containers
+
+from docx.blkcntnr import BlockItemContainer
+from docx.oxml.ns import qn
+from docx.sdt import StructuredDocumentTag
+from docx.section import Section
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+
+def section_block_item(sectPr, parent):
+    return Section(sectPr, parent.part)
+
+
+BlockItemContainer.block_item_type_for[qn('w:p')] = Paragraph
+BlockItemContainer.block_item_type_for[qn('w:sdt')] = StructuredDocumentTag
+BlockItemContainer.block_item_type_for[qn('w:sectPr')] = section_block_item
+BlockItemContainer.block_item_type_for[qn('w:tbl')] = Table
+
 del (
+    BlockItemContainer,
     CT,
     CorePropertiesPart,
     DocumentPart,
@@ -48,8 +70,13 @@ del (
     FootnotesPart,
     CommentsPart,
     NumberingPart,
+    Paragraph,
     PartFactory,
     SettingsPart,
+    StructuredDocumentTag,
     StylesPart,
+    Table,
     part_class_selector,
+    qn,
+    section_block_item,
 )
@@ -14,15 +14,21 @@ from docx.opc.constants import CONTENT_TYPE as CT
 from docx.package import Package
 
 
-def Document(docx=None):
+def Document(docx=None, lazy=False):
     """
     Return a |Document| object loaded from *docx*, where *docx* can be
     either a path to a ``.docx`` file (a string) or a file-like object. If
     *docx* is missing or ``None``, the built-in default document "template"
     is loaded.
+
+    When *lazy* is |True|, only part names, content types and relationships
+    are read when the document is opened. Each part, including images and
+    embedded objects, is read and its XML parsed only when first accessed,
+    so a file-like *docx* must remain open while the document is in use.
+    A path *docx* is held open until :meth:`.Document.close` is called.
     """
     docx = _default_docx_path() if docx is None else docx
-    document_part = Package.open(docx).main_document_part
+    document_part = Package.open(docx, lazy).main_document_part
     if document_part.content_type != CT.WML_DOCUMENT_MAIN:
         tmpl = "file '%s' is not a Word file, content type is '%s'"
         raise ValueError(tmpl % (docx, document_part.content_type))
@@ -38,12 +44,12 @@ def _default_docx_path():
 
 
 def element(element, part):
-    if str(type(element)) == "<class 'docx.oxml.text.paragraph.CT_P'>":
-        from  .text.paragraph import  Paragraph
-        return Paragraph(element, part)
-    elif str(type(element)) == "<class 'docx.oxml.table.CT_Tbl'>":
-        from .table import Table
-        return Table(element, part)
-    elif str(type(element)) == "<class 'docx.oxml.section.CT_SectPr'>":
-        from .section import Section
-        return Section(element, part)
\ No newline at end of file
+    """
+    Return the block item proxy object for *element*, having *part* as its
+    parent, or |None| if *element* is not a block item.
+    """
+    from .blkcntnr import BlockItemContainer
+    block_item_type = BlockItemContainer.block_item_type_for.get(element.tag)
+    if block_item_type is None:
+        return None
+    return block_item_type(element, part)
\ No newline at end of file
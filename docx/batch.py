@@ -0,0 +1,262 @@
+# encoding: utf-8
+
+"""
+Batch processing of many documents, in parallel over a process pool.
+
+For example, to comment every occurrence of a term in a folder of documents
+using four worker processes::
+
+    def review(document):
+        for paragraph in document.paragraphs:
+            if 'legacy' in paragraph.text:
+                paragraph.add_comment_by_text('Please rephrase', query_text='legacy')
+
+    summary = process_documents(review, paths, 'reviewed', processes=4)
+    for result in summary.failures:
+        print(result.path, result.error)
+
+*review* is called in the worker processes, so it must be picklable, which
+in practice means a function defined at the top level of a module.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from multiprocessing import Pool
+import os
+import pickle
+import time
+import traceback
+
+from .api import Document
+
+
+def process_documents(func, paths, output_dir=None, processes=None,
+                      lazy=False, progress=None, maxtasksperchild=None,
+                      compress_level=None, store_media=False):
+    """
+    Return a |BatchSummary| of calling *func* on the document opened from
+    each path in *paths*, then saving it to *output_dir*, if given, under
+    the file name it was read from.
+
+    *func* is called with the |Document| object and its return value, which
+    must be picklable, is kept as the :attr:`BatchResult.value` of that
+    path. An exception raised while opening, processing or saving a document,
+    or pickling the value returned for it, is recorded in its result instead
+    of stopping the batch. Each document is closed once processed.
+
+    Documents are processed by a pool of *processes* worker processes,
+    defaulting to one per CPU, each holding one document at a time. Workers
+    are replaced after *maxtasksperchild* documents when it is not |None|,
+    releasing memory a long run accumulates. When *processes* is 0, documents
+    are processed one after another in the calling process.
+
+    *progress*, when given, is called in the calling process as each
+    document is done, with the |BatchResult| of that document, the number of
+    documents done so far and the total number of documents. Results arrive
+    in order of completion; the results of the summary are in the order of
+    *paths*. *lazy* is passed to |Document| and *compress_level* and
+    *store_media* to :meth:`Document.save`.
+    """
+    paths = list(paths)
+    if output_dir is not None:
+        _check_output_names(paths)
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+    jobs = [
+        (func, idx, path, _output_path(output_dir, path), lazy,
+         compress_level, store_media)
+        for idx, path in enumerate(paths)
+    ]
+    results = [None] * len(jobs)
+    done = [0]
+    start = time.time()
+
+    def collect(idx, result):
+        results[idx] = result
+        done[0] += 1
+        if progress is not None:
+            progress(result, done[0], len(jobs))
+
+    if processes == 0:
+        for job in jobs:
+            collect(*_process_one(job))
+    else:
+        pool = Pool(processes, maxtasksperchild=maxtasksperchild)
+        try:
+            for idx, result in pool.imap_unordered(_process_one, jobs):
+                collect(idx, result)
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+    return BatchSummary(results, time.time() - start)
+
+
+class BatchResult(object):
+    """
+    Outcome of processing one document in a batch.
+    """
+    def __init__(self, path, output_path, value, error, seconds):
+        super(BatchResult, self).__init__()
+        self._path = path
+        self._output_path = output_path
+        self._value = value
+        self._error = error
+        self._seconds = seconds
+
+    @property
+    def error(self):
+        """
+        Formatted traceback of the exception that stopped processing of this
+        document, or |None| if it was processed successfully.
+        """
+        return self._error
+
+    @property
+    def ok(self):
+        """
+        True if this document was processed, and saved if an output
+        directory was given, without error.
+        """
+        return self._error is None
+
+    @property
+    def output_path(self):
+        """
+        Path the processed document is saved to, or |None| when the batch
+        has no output directory.
+        """
+        return self._output_path
+
+    @property
+    def path(self):
+        """
+        Path the document was read from.
+        """
+        return self._path
+
+    @property
+    def seconds(self):
+        """
+        Wall-clock time, in seconds, spent opening, processing and saving
+        this document.
+        """
+        return self._seconds
+
+    @property
+    def value(self):
+        """
+        Value returned by the batch function for this document, or |None| if
+        processing failed.
+        """
+        return self._value
+
+
+class BatchSummary(object):
+    """
+    Results of a batch run, in the order the input paths were given, along
+    with throughput figures for the run as a whole.
+    """
+    def __init__(self, results, seconds):
+        super(BatchSummary, self).__init__()
+        self._results = results
+        self._seconds = seconds
+
+    def __iter__(self):
+        return iter(self._results)
+
+    def __len__(self):
+        return len(self._results)
+
+    def __str__(self):
+        return '%d documents (%d failed) in %.2fs, %.1f documents/s' % (
+            len(self), len(self.failures), self.seconds,
+            self.documents_per_second
+        )
+
+    @property
+    def documents_per_second(self):
+        """
+        Documents processed per second of wall-clock time over the run.
+        """
+        if not self._seconds:
+            return 0.0
+        return len(self._results) / self._seconds
+
+    @property
+    def failures(self):
+        """
+        List of the |BatchResult| object of each document that failed.
+        """
+        return [r for r in self._results if not r.ok]
+
+    @property
+    def results(self):
+        """
+        List of the |BatchResult| object of each document, in input order.
+        """
+        return list(self._results)
+
+    @property
+    def seconds(self):
+        """
+        Wall-clock time, in seconds, the run took.
+        """
+        return self._seconds
+
+    @property
+    def succeeded(self):
+        """
+        Number of documents processed without error.
+        """
+        return len(self._results) - len(self.failures)
+
+
+def _check_output_names(paths):
+    """
+    Raise |ValueError| if two of *paths* would be saved to the same output
+    file name.
+    """
+    seen = {}
+    for path in paths:
+        name = os.path.basename(path)
+        if name in seen:
+            raise ValueError(
+                "'%s' and '%s' would both be saved as '%s'"
+                % (seen[name], path, name)
+            )
+        seen[name] = path
+
+
+def _output_path(output_dir, path):
+    if output_dir is None:
+        return None
+    return os.path.join(output_dir, os.path.basename(path))
+
+
+def _process_one(job):
+    """
+    Return a 2-tuple `(idx, result)` for the document of batch *job*. Runs
+    in a worker process, so exceptions are returned formatted rather than
+    raised.
+    """
+    func, idx, path, output_path, lazy, compress_level, store_media = job
+    start = time.time()
+    value, error = None, None
+    try:
+        document = Document(path, lazy=lazy)
+        try:
+            value = func(document)
+            # ---a value that cannot be pickled would fail the whole batch
+            #    when the pool sends it back, so fail this document instead---
+            pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            if output_path is not None:
+                document.save(output_path, compress_level, store_media)
+        finally:
+            document.close()
+    except Exception:
+        value, error = None, traceback.format_exc()
+    return idx, BatchResult(path, output_path, value, error, time.time() - start)
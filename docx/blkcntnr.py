@@ -12,7 +12,7 @@ from docx.oxml.table import CT_Tbl
 from docx.oxml.ns import  qn
 from docx.shared import Parented
 from docx.text.paragraph import Paragraph
-from docx.api import element
+from docx.textindex import DocumentTextIndex
 
 class BlockItemContainer(Parented):
     """Base class for proxy objects that can contain block items.
@@ -22,6 +22,12 @@ class BlockItemContainer(Parented):
     a paragraph or table.
     """
 
+    #: maps the tag of a block item element to the proxy type for it, called
+    #: with the element and its container; see :meth:`iter_block_items`
+    block_item_type_for = {}
+
+    _text_index = None
+
     def __init__(self, element, parent):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
@@ -49,14 +55,36 @@ class BlockItemContainer(Parented):
         from .table import Table
         tbl = CT_Tbl.new_tbl(rows, cols, width)
         self._element._insert_tbl(tbl)
+        self._paragraphs_changed()
         return Table(tbl, self)
 
+    def add_table_from_data(self, data, width, style=None):
+        """
+        Return a table of *width* newly appended to the content in this
+        container, having a row for each sequence of cell values in *data*
+        and table style *style*. Each value is converted to text in a single
+        run, |None| giving an empty cell; the table has as many columns as
+        the longest row. The table XML is built in a single step, which is
+        much faster than adding rows and setting cell text one by one.
+        """
+        from .table import Table
+        tbl = CT_Tbl.new_tbl_from_rows(data, width)
+        self._element._insert_tbl(tbl)
+        self._paragraphs_changed()
+        table = Table(tbl, self)
+        if style is not None:
+            table.style = style
+        return table
+
     @property
     def paragraphs(self):
         """
         A list containing the paragraphs in this container, in document
-        order. Read-only.
+        order. Read-only. Once :attr:`text_index` is created these are the
+        paragraph objects it holds.
         """
+        if self._text_index is not None:
+            return list(self._text_index.paragraphs)
         return [Paragraph(p, self) for p in self._element.p_lst]
 
     @property
@@ -71,10 +99,42 @@ class BlockItemContainer(Parented):
     def elements(self):
         """
         A list containing the elements in this container (paragraph and tables), in document order.
+        Children that are not block items appear as |None|.
+        """
+        part = self.part
+        block_item_type_for = self.block_item_type_for
+        elements = []
+        for child in self._element.iterchildren():
+            block_item_type = block_item_type_for.get(child.tag)
+            elements.append(None if block_item_type is None else block_item_type(child, part))
+        return elements
+
+    def iter_block_items(self):
+        """
+        Generate a proxy object for each block item in this container, in
+        document order; a |Paragraph|, |Table|, |StructuredDocumentTag| or,
+        for the document body, the |Section| of its final section
+        properties. Child elements of other types, such as bookmarks, are
+        skipped unless a proxy type is registered for their tag in
+        :attr:`block_item_type_for`.
         """
-        return [element(item,self.part) for item in self._element.getchildren()]
+        block_item_type_for = self.block_item_type_for
+        for child in self._element.iterchildren():
+            block_item_type = block_item_type_for.get(child.tag)
+            if block_item_type is not None:
+                yield block_item_type(child, self)
     
     
+    @property
+    def text_index(self):
+        """
+        |DocumentTextIndex| object for the paragraphs in this container,
+        created on first use.
+        """
+        if self._text_index is None:
+            self._text_index = DocumentTextIndex(self)
+        return self._text_index
+
     @property
     def abstractNumIds(self):
         return [numId for numId in self.part.numbering_part.element.iterchildren(qn('w:abstractNum'))]
@@ -85,5 +145,15 @@ class BlockItemContainer(Parented):
         Return a paragraph newly added to the end of the content in this
         container.
         """
-        return Paragraph(self._element.add_p(), self)
+        p = self._element.add_p()
+        self._paragraphs_changed()
+        return Paragraph(p, self)
+
+    def _paragraphs_changed(self):
+        """
+        Let the text index of this container know block items were added or
+        removed.
+        """
+        if self._text_index is not None:
+            self._text_index._paragraphs_changed()
 
@@ -10,10 +10,10 @@ from __future__ import (
 
 from ..enum.dml import MSO_COLOR_TYPE
 from ..oxml.simpletypes import ST_HexColorAuto
-from ..shared import ElementProxy
+from ..shared import FormatProxy
 
 
-class ColorFormat(ElementProxy):
+class ColorFormat(FormatProxy):
     """
     Provides access to color settings such as RGB color, theme color, and
     luminance adjustments.
@@ -21,8 +21,8 @@ class ColorFormat(ElementProxy):
 
     __slots__ = ()
 
-    def __init__(self, rPr_parent):
-        super(ColorFormat, self).__init__(rPr_parent)
+    def __init__(self, rPr_parent, parent=None):
+        super(ColorFormat, self).__init__(rPr_parent, parent)
 
     @property
     def rgb(self):
@@ -11,6 +11,8 @@ from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
 from docx.section import Section, Sections
 from docx.shared import ElementProxy, Emu
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
 
 
 class Document(ElementProxy):
@@ -27,6 +29,12 @@ class Document(ElementProxy):
         self._part = part
         self.__body = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def add_heading(self, text="", level=1):
         """Return a heading paragraph newly added to the end of the document.
 
@@ -68,7 +76,9 @@ class Document(ElementProxy):
         preserving the aspect ratio of the image. The native size of the
         picture is calculated using the dots-per-inch (dpi) value specified
         in the image file, defaulting to 72 dpi if no value is specified, as
-        is often the case.
+        is often the case. *image_path_or_stream* may also be an |Image|
+        object, e.g. ``Image.from_file(path, keep_file=True)`` to read the
+        image file only when the document is saved.
         """
         run = self.add_paragraph().add_run()
         return run.add_picture(image_path_or_stream, width, height)
@@ -81,6 +91,7 @@ class Document(ElementProxy):
         ``WD_SECTION.NEW_PAGE`` if not provided.
         """
         new_sectPr = self._element.body.add_section_break()
+        self._body._paragraphs_changed()
         new_sectPr.start_type = start_type
         return Section(new_sectPr, self._part)
 
@@ -95,40 +106,44 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    def add_table_from_data(self, data, style=None):
+        """
+        Add a table having a row for each sequence of cell values in *data*
+        and table style *style*. Values are placed in cells as for
+        :meth:`BlockItemContainer.add_table_from_data` and the table spans
+        the page between the margins, as for :meth:`add_table`.
+        """
+        return self._body.add_table_from_data(data, self._block_width, style)
+
     def add_comment(self, author, initials, date,query_text,comment_text):
         """
-        add comment by range or by text
-        """
-        full_text  = "".join([para.text for para in self.paragraphs])
-        text_splited_by_para = [para.text for para in self.paragraphs]
-        # 
-        text_range_in_para = []
-        text_begin_idx = 0
-        text_end_idx = 0
-        for text_idx , text in enumerate(text_splited_by_para):
-            text_begin_idx = text_end_idx 
-            text_end_idx = len(text) + text_begin_idx
-            text_range_in_para.append([
-                text_begin_idx,text_end_idx
-            ])
-        
-        if query_text not in full_text:
+        Add a comment having *comment_text* anchored to the first occurrence
+        of *query_text* in the document text, which may span paragraphs.
+        Raises |IndexError| if *query_text* does not appear in the document.
+        """
+        span = self.text_index.find(query_text)
+        if span is None:
             raise IndexError
-        else:
-            text_begin_idx = full_text.find(query_text)
-            text_end_idx = full_text.find(query_text) + len(query_text)
-        for idx , text_range in enumerate(text_range_in_para):
-            if text_begin_idx >= text_range[0] and text_begin_idx < text_range[1]:
-                para_begin_idx = idx
-            if text_end_idx >= text_range[0] and text_end_idx < text_range[1]:
-                para_end_idx = idx
-        para_begin = self.paragraphs[para_begin_idx]
-        para_end = self.paragraphs[para_end_idx]
-        comment, comment_id = para_begin._p.add_cross_paragraph_comment_start(author, para_begin.part._comments_part._element, initials, date, comment_text, text_begin_idx)
-        para_end._p.pull_overflow_comment(comment_id,rangeEnd=text_end_idx)
-
-        
-        
+        return self.text_index.add_comment(
+            span[0], span[1], comment_text, author, initials, date
+        )
+
+    def add_comment_by_range(self, text, author='Wayen', initials='W', dtime=None, rangeStart=0, rangeEnd=0):
+        """
+        Add a comment having *text* anchored to the document text between
+        offsets *rangeStart* and *rangeEnd* of :attr:`text_index`.
+        """
+        return self.text_index.add_comment(
+            rangeStart, rangeEnd, text, author, initials, dtime
+        )
+
+    def add_insert_by_range(self, text, author='Wayen', initials='W', dtime=None, ins_index=0):
+        """
+        Add an ``<w:ins>`` revision containing *text* at offset *ins_index*
+        of :attr:`text_index`.
+        """
+        return self.text_index.add_insert(ins_index, text, author, initials, dtime)
+
     @property
     def core_properties(self):
         """
@@ -154,6 +169,24 @@ class Document(ElementProxy):
     #     return self.part._footnotes_part
 
 
+    def iter_footnote_references(self):
+        """
+        Generate a ``(run, footnote)`` pair for each footnote reference in
+        the document body, in document order, including those in tables.
+        *run* is the |Run| holding the ``<w:footnoteReference>`` element and
+        *footnote* is the ``<w:footnote>`` element it refers to, or |None|
+        if the footnotes part has no footnote with that id.
+        """
+        footnotes_part = self._part._footnotes_part
+        paragraph = None
+        for ref in self._element.body.iter(qn('w:footnoteReference')):
+            r = ref.getparent()
+            p = next(r.iterancestors(qn('w:p')))
+            if paragraph is None or paragraph._p is not p:
+                paragraph = Paragraph(p, self._body)
+            footnote = footnotes_part.get_footnote_by_id(int(ref.get(qn('w:id'))))
+            yield Run(r, paragraph), footnote
+
     @property
     def inline_shapes(self):
         """
@@ -164,6 +197,20 @@ class Document(ElementProxy):
         """
         return self._part.inline_shapes
 
+    def normalize_runs(self):
+        """
+        Apply :meth:`Paragraph.normalize_runs` to every paragraph in the
+        document body, including those in tables, and return the total
+        number of runs merged away.
+        """
+        merged = 0
+        for p in self._element.body.iter(qn('w:p')):
+            merged += p.normalize_runs()
+        text_index = self._body._text_index
+        if text_index is not None:
+            text_index._runs_changed()
+        return merged
+
     @property
     def paragraphs(self):
         """
@@ -180,12 +227,39 @@ class Document(ElementProxy):
         """
         return self._part
 
-    def save(self, path_or_stream):
+    def close(self):
+        """
+        Release the file a document opened with ``lazy=True`` reads its parts
+        from. Parts not accessed before closing can no longer be read, so
+        save the document first. A document is closed on leaving a ``with``
+        block using it, e.g. ``with docx.Document(path, lazy=True) as
+        document:``. Does nothing for a document not opened lazily.
+        """
+        self._part.package.close()
+
+    def iter_save_chunks(self, compress_level=None, store_media=False):
+        """
+        Return an iterator over the bytes of this document as :meth:`save`
+        would write them, in chunks produced as each part is written. Suits
+        sending a document as it is generated, e.g. as an HTTP response body,
+        without first holding the whole file in memory. *compress_level* and
+        *store_media* are as for :meth:`save`.
+        """
+        return self._part.iter_save_chunks(compress_level, store_media)
+
+    def save(self, path_or_stream, compress_level=None, store_media=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object. The file-like
+        object need not be seekable, so a pipe or socket file will do.
+
+        *compress_level* is the zlib level, 0 (fastest) to 9 (smallest), at
+        which parts are deflated; the zlib default is used when |None|. When
+        *store_media* is |True|, already-compressed parts such as JPEG and
+        PNG pictures and embedded Office packages are stored without
+        compression, saving the CPU time of deflating them again.
         """
-        self._part.save(path_or_stream)
+        self._part.save(path_or_stream, compress_level, store_media)
 
     @property
     def sections(self):
@@ -235,6 +309,16 @@ class Document(ElementProxy):
         val = last.attrib.get(qn('w:abstractNumId'))
         return  last, val
     
+    @property
+    def text_index(self):
+        """
+        |DocumentTextIndex| object mapping offsets in the concatenated text
+        of the paragraphs in the document body to those paragraphs. Once it
+        is created, :attr:`paragraphs` returns the paragraph objects held by
+        the index so edits made through them keep it up to date.
+        """
+        return self._body.text_index
+
     @property
     def _block_width(self):
         """
@@ -272,4 +356,5 @@ class _Body(BlockItemContainer):
         preserved.
         """
         self._body.clear_content()
+        self._paragraphs_changed()
         return self
@@ -7,8 +7,10 @@ size, as a required step in including them in a document.
 
 from __future__ import absolute_import, division, print_function
 
+from collections import OrderedDict
 import hashlib
 import os
+import threading
 
 from ..compat import BytesIO, is_string
 from .exceptions import UnrecognizedImageError
@@ -20,11 +22,12 @@ class Image(object):
     Graphical image stream such as JPEG, PNG, or GIF with properties and
     methods required by ImagePart.
     """
-    def __init__(self, blob, filename, image_header):
+    def __init__(self, blob, filename, image_header, blob_path=None):
         super(Image, self).__init__()
         self._blob = blob
         self._filename = filename
         self._image_header = image_header
+        self._blob_path = blob_path
 
     @classmethod
     def from_blob(cls, blob):
@@ -36,31 +39,52 @@ class Image(object):
         return cls._from_stream(stream, blob)
 
     @classmethod
-    def from_file(cls, image_descriptor):
+    def from_file(cls, image_descriptor, keep_file=False):
         """
         Return a new |Image| subclass instance loaded from the image file
         identified by *image_descriptor*, a path or file-like object.
+
+        The format, dimensions and dpi are parsed from the file itself, which
+        reads only as far as the image header. When *keep_file* is |True|
+        and *image_descriptor* is a path, the image bytes are not held in
+        memory at all: the file is hashed in chunks and read again whenever
+        :attr:`blob` is needed, for a picture in a document when the document
+        is saved, so the file must not change until then.
         """
-        if is_string(image_descriptor):
-            path = image_descriptor
-            with open(path, 'rb') as f:
-                blob = f.read()
-                stream = BytesIO(blob)
-            filename = os.path.basename(path)
-        else:
+        if not is_string(image_descriptor):
             stream = image_descriptor
             stream.seek(0)
             blob = stream.read()
-            filename = None
-        return cls._from_stream(stream, blob, filename)
+            return cls._from_stream(stream, blob)
+        path = image_descriptor
+        filename = os.path.basename(path)
+        with open(path, 'rb') as f:
+            image_header = _ImageHeaderFactory(f)
+            if keep_file:
+                return cls(None, filename, image_header, path)
+            f.seek(0)
+            blob = f.read()
+        return cls(blob, filename, image_header)
 
     @property
     def blob(self):
         """
-        The bytes of the image 'file'
+        The bytes of the image 'file'. Read from the file on each access
+        when the image was loaded with *keep_file*, see :attr:`blob_path`.
         """
+        if self._blob_path is not None:
+            with open(self._blob_path, 'rb') as f:
+                return f.read()
         return self._blob
 
+    @property
+    def blob_path(self):
+        """
+        Path of the file :attr:`blob` is read from on each access, or |None|
+        when the image bytes are held in memory.
+        """
+        return self._blob_path
+
     @property
     def content_type(self):
         """
@@ -165,6 +189,8 @@ class Image(object):
         """
         SHA1 hash digest of the image blob
         """
+        if self._blob_path is not None:
+            return _file_sha1(self._blob_path)
         return hashlib.sha1(self._blob).hexdigest()
 
     @classmethod
@@ -179,6 +205,105 @@ class Image(object):
         return cls(blob, filename, image_header)
 
 
+class ImageCache(object):
+    """
+    Process-wide, least-recently-used cache of |Image| objects, so an image
+    inserted into many documents is parsed and hashed only once. An image
+    loaded from a path is keyed by the absolute path, size and modification
+    time of the file, so the file is not read at all on a hit. An image
+    loaded from a stream is keyed by the SHA1 digest of its bytes; the stream
+    is still read and hashed, but the header is not parsed again.
+
+    Holds at most *max_images* images and *max_bytes* bytes of image data;
+    an image larger than *max_bytes* is not cached. Setting either limit to
+    0 disables the cache. The limits may be changed at any time, taking
+    effect on the next insertion.
+    """
+    def __init__(self, max_images=64, max_bytes=32 * 1024 * 1024):
+        super(ImageCache, self).__init__()
+        self.max_images = max_images
+        self.max_bytes = max_bytes
+        self._images = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._images)
+
+    def clear(self):
+        """
+        Remove all images from the cache.
+        """
+        with self._lock:
+            self._images.clear()
+            self._nbytes = 0
+
+    def image_for(self, image_descriptor):
+        """
+        Return the |Image| for *image_descriptor*, a path or file-like
+        object, from the cache when present, otherwise loaded with
+        :meth:`Image.from_file` and cached.
+        """
+        if is_string(image_descriptor):
+            path = os.path.abspath(image_descriptor)
+            st = os.stat(path)
+            key = ('path', path, st.st_size, st.st_mtime)
+            image = self._get(key)
+            if image is None:
+                image = Image.from_file(image_descriptor)
+                image.sha1
+                self._put(key, image)
+            return image
+        stream = image_descriptor
+        stream.seek(0)
+        blob = stream.read()
+        sha1 = hashlib.sha1(blob).hexdigest()
+        key = ('sha1', sha1)
+        image = self._get(key)
+        if image is None:
+            image = Image._from_stream(stream, blob)
+            image._sha1 = sha1
+            self._put(key, image)
+        return image
+
+    def _get(self, key):
+        with self._lock:
+            image = self._images.pop(key, None)
+            if image is not None:
+                self._images[key] = image
+            return image
+
+    def _put(self, key, image):
+        nbytes = len(image._blob)
+        with self._lock:
+            if nbytes > self.max_bytes or key in self._images:
+                return
+            self._images[key] = image
+            self._nbytes += nbytes
+            while self._images and (
+                len(self._images) > self.max_images
+                or self._nbytes > self.max_bytes
+            ):
+                _, evicted = self._images.popitem(last=False)
+                self._nbytes -= len(evicted._blob)
+
+
+#: the |ImageCache| consulted when adding a picture by path or stream
+image_cache = ImageCache()
+
+
+def _file_sha1(path, chunk_size=1 << 16):
+    """
+    Return the SHA1 hash digest of the file at *path*, read in chunks of
+    *chunk_size* bytes.
+    """
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
 def _ImageHeaderFactory(stream):
     """
     Return a |BaseImageHeader| subclass instance that knows how to parse the
@@ -25,6 +25,9 @@ class OpcPackage(object):
 
     def __init__(self):
         super(OpcPackage, self).__init__()
+        self._pkg_reader = None
+        self._partname_index = None
+        self._indexed_parts = None
 
     def after_unmarshal(self):
         """
@@ -48,8 +51,7 @@ class OpcPackage(object):
         Generate exactly one reference to each relationship in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
+        def walk_rels(source, visited):
             for rel in source.rels.values():
                 yield rel
                 if rel.is_external:
@@ -57,12 +59,12 @@ class OpcPackage(object):
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 new_source = part
                 for rel in walk_rels(new_source, visited):
                     yield rel
 
-        for rel in walk_rels(self):
+        for rel in walk_rels(self, set()):
             yield rel
 
     def iter_parts(self):
@@ -70,21 +72,7 @@ class OpcPackage(object):
         Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_parts(source, visited=list()):
-            for rel in source.rels.values():
-                if rel.is_external:
-                    continue
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.append(part)
-                yield part
-                new_source = part
-                for part in walk_parts(new_source, visited):
-                    yield part
-
-        for part in walk_parts(self):
-            yield part
+        return _walk_parts(self, set())
 
     def load_rel(self, reltype, target, rId, is_external=False):
         """
@@ -95,7 +83,10 @@ class OpcPackage(object):
         methods exist for adding a new relationship to the package during
         processing.
         """
-        return self.rels.add_relationship(reltype, target, rId, is_external)
+        rel = self.rels.add_relationship(reltype, target, rId, is_external)
+        if not is_external:
+            self._rel_added(self, target)
+        return rel
 
     @property
     def main_document_part(self):
@@ -115,21 +106,37 @@ class OpcPackage(object):
         containing a single replacement item, a '%d' to be used to insert the integer
         portion of the partname. Example: "/word/header%d.xml"
         """
-        partnames = {part.partname for part in self.iter_parts()}
+        partnames = self._parts_by_partname
         for n in range(1, len(partnames) + 2):
             candidate_partname = template % n
             if candidate_partname not in partnames:
                 return PackURI(candidate_partname)
 
+    def close(self):
+        """
+        Release the package file a package opened lazily reads its parts
+        from. Parts not yet read can no longer be read, or saved, once it is
+        closed. Does nothing for a package read in full when opened.
+        """
+        pkg_reader = self._pkg_reader
+        if pkg_reader is None:
+            return
+        self._pkg_reader = None
+        pkg_reader.close()
+
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, lazy=False):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
+        *pkg_file*. When *lazy* is |True|, *pkg_file* is kept open and each
+        part is read, and its XML parsed, only when first accessed. Parts
+        never accessed are saved as they were read.
         """
-        pkg_reader = PackageReader.from_file(pkg_file)
+        pkg_reader = PackageReader.from_file(pkg_file, lazy)
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        if pkg_reader.is_lazy:
+            package._pkg_reader = pkg_reader
         return package
 
     def part_related_by(self, reltype):
@@ -154,6 +161,7 @@ class OpcPackage(object):
         relationship if there is one, otherwise a newly created one.
         """
         rel = self.rels.get_or_add(reltype, part)
+        self._rel_added(self, part)
         return rel.rId
 
     @lazyproperty
@@ -164,14 +172,75 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def iter_save_chunks(self, compress_level=None, store_media=False):
         """
-        Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        Return an iterator over the bytes of this package as :meth:`save`
+        would write them, in chunks of roughly one part each.
         """
-        for part in self.parts:
+        parts = self.parts
+        for part in parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        return PackageWriter.iter_chunks(self.rels, parts, compress_level, store_media)
+
+    def save(self, pkg_file, compress_level=None, store_media=False):
+        """
+        Save this package to *pkg_file*, where *file* can be either a path to
+        a file (a string) or a file-like object, which need not be seekable.
+        *compress_level* and *store_media* are as for
+        :meth:`PackageWriter.write`.
+        """
+        parts = self.parts
+        if self._pkg_reader is not None and self._pkg_reader.reads_from(pkg_file):
+            # ---read every part not yet read before its source is overwritten,
+            #    which also stops it being copied from there as unmodified---
+            for part in parts:
+                part._blob = part._blob
+        for part in parts:
+            part.before_marshal()
+        PackageWriter.write(pkg_file, self.rels, parts, compress_level, store_media)
+
+    def _rel_added(self, source, target_part):
+        """
+        Called after a relationship from *source*, this package or one of its
+        parts, to *target_part* is added. When the partname index is built
+        and *source* is reachable, *target_part* and the parts newly
+        reachable through it are added to the index.
+        """
+        indexed_parts = self._indexed_parts
+        if indexed_parts is None or target_part in indexed_parts:
+            return
+        if source is not self and source not in indexed_parts:
+            return
+        index = self._partname_index
+        indexed_parts.add(target_part)
+        index[target_part.partname] = target_part
+        for part in _walk_parts(target_part, indexed_parts):
+            index[part.partname] = part
+
+    def _parts_changed(self):
+        """
+        Called after a relationship is dropped or a part is renamed, either
+        of which may leave the partname index stale. The index is rebuilt on
+        next use.
+        """
+        self._partname_index = None
+        self._indexed_parts = None
+
+    @property
+    def _parts_by_partname(self):
+        """
+        dict mapping the partname of each part in this package to the part.
+        Built by a traversal of the rels graph on first use, then kept in
+        step with relationships added and dropped through the package and
+        part APIs.
+        """
+        if self._partname_index is None:
+            indexed_parts = set()
+            self._partname_index = dict(
+                (part.partname, part) for part in _walk_parts(self, indexed_parts)
+            )
+            self._indexed_parts = indexed_parts
+        return self._partname_index
 
     @property
     def _core_properties_part(self):
@@ -213,6 +282,23 @@ class OpcPackage(object):
             return  footnotes_part
 
 
+def _walk_parts(source, visited):
+    """
+    Generate each part reachable from *source*, a package or part, that is
+    not in the set *visited*, adding it to *visited*, in depth-first order.
+    """
+    for rel in source.rels.values():
+        if rel.is_external:
+            continue
+        part = rel.target_part
+        if part in visited:
+            continue
+        visited.add(part)
+        yield part
+        for part in _walk_parts(part, visited):
+            yield part
+
+
 class Unmarshaller(object):
     """Hosts static methods for unmarshalling a package from a |PackageReader|."""
 
@@ -239,6 +325,13 @@ class Unmarshaller(object):
         *pkg_reader* is constructed using *part_factory*.
         """
         parts = {}
+        if pkg_reader.is_lazy:
+            deferred_sparts = pkg_reader.iter_deferred_sparts()
+            for partname, content_type, reltype, load_blob in deferred_sparts:
+                parts[partname] = part_factory(
+                    partname, content_type, reltype, None, package, load_blob
+                )
+            return parts
         for partname, content_type, reltype, blob in pkg_reader.iter_sparts():
             parts[partname] = part_factory(
                 partname, content_type, reltype, blob, package
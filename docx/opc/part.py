@@ -22,6 +22,8 @@ class Part(object):
     intended to be subclassed in client code to implement specific part
     behaviors.
     """
+    _blob_source = None
+
     def __init__(self, partname, content_type, blob=None, package=None):
         super(Part, self).__init__()
         self._partname = partname
@@ -73,11 +75,24 @@ class Part(object):
         """
         if self._rel_ref_count(rId) < 2:
             del self.rels[rId]
+            if self._package is not None:
+                self._package._parts_changed()
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
 
+    @classmethod
+    def load_deferred(cls, partname, content_type, load_blob, package):
+        """
+        Return a part loaded as by :meth:`load`, except that its blob is not
+        read from the package until first needed, when it is obtained by
+        calling *load_blob* with no arguments.
+        """
+        part = cls.load(partname, content_type, None, package)
+        part._blob_source = load_blob
+        return part
+
     def load_rel(self, reltype, target, rId, is_external=False):
         """
         Return newly added |_Relationship| instance of *reltype* between this
@@ -87,7 +102,10 @@ class Part(object):
         methods exist for adding a new relationship to a part when
         manipulating a part.
         """
-        return self.rels.add_relationship(reltype, target, rId, is_external)
+        rel = self.rels.add_relationship(reltype, target, rId, is_external)
+        if not is_external and self._package is not None:
+            self._package._rel_added(self, target)
+        return rel
 
     @property
     def package(self):
@@ -110,6 +128,8 @@ class Part(object):
             tmpl = "partname must be instance of PackURI, got '%s'"
             raise TypeError(tmpl % type(partname).__name__)
         self._partname = partname
+        if self._package is not None:
+            self._package._parts_changed()
 
     def part_related_by(self, reltype):
         """
@@ -129,6 +149,8 @@ class Part(object):
             return self.rels.get_or_add_ext_rel(reltype, target)
         else:
             rel = self.rels.get_or_add(reltype, target)
+            if self._package is not None:
+                self._package._rel_added(self, target)
             return rel.rId
 
     @property
@@ -155,6 +177,31 @@ class Part(object):
         rel = self.rels[rId]
         return rel.target_ref
 
+    @property
+    def _blob(self):
+        """
+        The bytes this part was loaded with, read from the package on first
+        access when loading was deferred.
+        """
+        if self._blob_bytes is None and self._blob_source is not None:
+            self._blob_bytes = self._blob_source()
+        return self._blob_bytes
+
+    @_blob.setter
+    def _blob(self, blob):
+        self._blob_bytes = blob
+        self._blob_source = None
+
+    @property
+    def _is_modified(self):
+        """
+        True unless this part was loaded deferred and its content has not
+        changed since, in which case its *_blob_source* can copy it unchanged
+        from the source package. Replacing the blob, or parsing the XML of an
+        XML part, counts as a change.
+        """
+        return self._blob_source is None
+
     def _rel_ref_count(self, rId):
         """
         Return the count of references in this part's XML to the relationship
@@ -181,13 +228,18 @@ class PartFactory(object):
     part_type_for = {}
     default_part_type = Part
 
-    def __new__(cls, partname, content_type, reltype, blob, package):
+    def __new__(cls, partname, content_type, reltype, blob, package,
+                load_blob=None):
         PartClass = None
         if cls.part_class_selector is not None:
             part_class_selector = cls_method_fn(cls, 'part_class_selector')
             PartClass = part_class_selector(content_type, reltype)
         if PartClass is None:
             PartClass = cls._part_cls_for(content_type)
+        if load_blob is not None:
+            return PartClass.load_deferred(
+                partname, content_type, load_blob, package
+            )
         return PartClass.load(partname, content_type, blob, package)
 
     @classmethod
@@ -217,6 +269,12 @@ class XmlPart(Part):
 
     @property
     def blob(self):
+        """
+        The XML of this part serialized, or the bytes it was loaded with,
+        unchanged, if loading was deferred and its XML has not been parsed.
+        """
+        if self._xml_element is None and self._is_unparsed:
+            return self._blob
         return serialize_part_xml(self._element)
 
     @property
@@ -231,6 +289,16 @@ class XmlPart(Part):
         element = parse_xml(blob)
         return cls(partname, content_type, element, package)
 
+    @classmethod
+    def load_deferred(cls, partname, content_type, load_blob, package):
+        """
+        Return a part whose XML is read from the package and parsed on first
+        access to its element, by calling *load_blob* with no arguments.
+        """
+        part = cls(partname, content_type, None, package)
+        part._blob_source = load_blob
+        return part
+
     @property
     def part(self):
         """
@@ -239,3 +307,25 @@ class XmlPart(Part):
         chain of delegation ends here for child objects.
         """
         return self
+
+    @property
+    def _element(self):
+        """
+        Root element of the XML of this part, parsed on first access when
+        loading was deferred.
+        """
+        if self._xml_element is None and self._is_unparsed:
+            self._xml_element = parse_xml(self._blob)
+            self._blob = None
+        return self._xml_element
+
+    @_element.setter
+    def _element(self, element):
+        self._xml_element = element
+
+    @property
+    def _is_unparsed(self):
+        """
+        True if this part was loaded deferred and its XML is not yet parsed.
+        """
+        return self._blob_source is not None or self._blob_bytes is not None
@@ -6,9 +6,15 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import copy
 import os
+import shutil
+import struct
+import time
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from zipfile import (
+    ZipFile, ZipInfo, is_zipfile, ZIP64_LIMIT, ZIP_DEFLATED, ZIP_STORED
+)
 
 from .compat import is_string
 from .exceptions import PackageNotFoundError
@@ -40,7 +46,7 @@ class PhysPkgWriter(object):
     """
     Factory for physical package writer objects.
     """
-    def __new__(cls, pkg_file):
+    def __new__(cls, pkg_file, compress_level=None):
         return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
 
 
@@ -56,6 +62,14 @@ class _DirPkgReader(PhysPkgReader):
         super(_DirPkgReader, self).__init__()
         self._path = os.path.abspath(path)
 
+    def reads_from(self, pkg_file):
+        """
+        True if *pkg_file* is a path inside the package directory.
+        """
+        if not is_string(pkg_file):
+            return False
+        return os.path.abspath(pkg_file).startswith(self._path + os.sep)
+
     def blob_for(self, pack_uri):
         """
         Return contents of file corresponding to *pack_uri* in package
@@ -73,6 +87,13 @@ class _DirPkgReader(PhysPkgReader):
         """
         pass
 
+    def stream_for(self, pack_uri):
+        """
+        Return a binary file object open on the file corresponding to
+        *pack_uri* in the package directory, to be closed by the caller.
+        """
+        return open(os.path.join(self._path, pack_uri.membername), 'rb')
+
     @property
     def content_types_xml(self):
         """
@@ -96,10 +117,26 @@ class _ZipPkgReader(PhysPkgReader):
     """
     Implements |PhysPkgReader| interface for a zip file OPC package.
     """
+    _LOCAL_HEADER = struct.Struct('<4s22xHH')
+    _LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+    _CHUNK_SIZE = 1 << 20
+
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
+        self._pkg_file = pkg_file
         self._zipf = ZipFile(pkg_file, 'r')
 
+    def reads_from(self, pkg_file):
+        """
+        True if *pkg_file* is the path or file-like object this archive is
+        read from.
+        """
+        if pkg_file is self._pkg_file:
+            return True
+        if not (is_string(pkg_file) and is_string(self._pkg_file)):
+            return False
+        return os.path.exists(pkg_file) and os.path.samefile(pkg_file, self._pkg_file)
+
     def blob_for(self, pack_uri):
         """
         Return blob corresponding to *pack_uri*. Raises |ValueError| if no
@@ -113,6 +150,52 @@ class _ZipPkgReader(PhysPkgReader):
         """
         self._zipf.close()
 
+    def iter_raw_member(self, pack_uri):
+        """
+        Return a 2-tuple `(zinfo, chunks)` for the member corresponding to
+        *pack_uri*, where *chunks* generates the member data as stored in
+        the archive, still compressed. Returns |None| if the member cannot
+        be read that way, e.g. when it is encrypted or the archive is closed.
+        """
+        zipf = self._zipf
+        zinfo = zipf.getinfo(pack_uri.membername)
+        if zipf.fp is None or zinfo.flag_bits & 0x01:
+            return None
+        with zipf._lock:
+            zipf.fp.seek(zinfo.header_offset)
+            header = zipf.fp.read(self._LOCAL_HEADER.size)
+        if len(header) != self._LOCAL_HEADER.size:
+            return None
+        signature, name_len, extra_len = self._LOCAL_HEADER.unpack(header)
+        if signature != self._LOCAL_HEADER_SIGNATURE:
+            return None
+        offset = zinfo.header_offset + len(header) + name_len + extra_len
+        return zinfo, self._iter_chunks(offset, zinfo.compress_size)
+
+    def _iter_chunks(self, offset, size):
+        """
+        Generate the *size* bytes of the archive starting at *offset* in
+        chunks of at most |_CHUNK_SIZE| bytes.
+        """
+        zipf = self._zipf
+        while size > 0:
+            with zipf._lock:
+                zipf.fp.seek(offset)
+                chunk = zipf.fp.read(min(size, self._CHUNK_SIZE))
+            if not chunk:
+                raise IOError('unexpected end of zip archive')
+            offset += len(chunk)
+            size -= len(chunk)
+            yield chunk
+
+    def stream_for(self, pack_uri):
+        """
+        Return a binary file object reading the member corresponding to
+        *pack_uri*, decompressing as it is read, to be closed by the caller.
+        Raises |KeyError| if no matching member is present in zip archive.
+        """
+        return self._zipf.open(pack_uri.membername)
+
     @property
     def content_types_xml(self):
         """
@@ -136,9 +219,15 @@ class _ZipPkgWriter(PhysPkgWriter):
     """
     Implements |PhysPkgWriter| interface for a zip file OPC package.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, compress_level=None):
+        """
+        *compress_level* is the zlib compression level, 0 to 9, of deflated
+        members; |None| uses the zlib default.
+        """
         super(_ZipPkgWriter, self).__init__()
-        self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        self._zipf = ZipFile(
+            pkg_file, 'w', compression=ZIP_DEFLATED, compresslevel=compress_level
+        )
 
     def close(self):
         """
@@ -147,9 +236,96 @@ class _ZipPkgWriter(PhysPkgWriter):
         """
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
+    def copy_member(self, phys_reader, src_uri, pack_uri):
+        """
+        Copy the member corresponding to *src_uri* in *phys_reader* to this
+        zip package as the member corresponding to *pack_uri*, without
+        decompressing and recompressing it. This relies on |ZipFile|
+        internals; where those are missing, as they may be in another Python
+        version, the member is recompressed a chunk at a time instead.
+        Returns |False|, writing nothing, if the member cannot be copied, in
+        which case the caller writes its blob instead.
+        """
+        if not isinstance(phys_reader, _ZipPkgReader):
+            return False
+        if not (_has_zipfile_internals(phys_reader._zipf) and
+                _has_zipfile_internals(self._zipf)):
+            return self._recompress_member(phys_reader, src_uri, pack_uri)
+        raw_member = phys_reader.iter_raw_member(src_uri)
+        if raw_member is None:
+            return False
+        src_info, chunks = raw_member
+        zinfo = copy.copy(src_info)
+        zinfo.filename = pack_uri.membername
+        # ---sizes and CRC go in the local header, not a data descriptor---
+        zinfo.flag_bits &= ~0x08
+        zipf = self._zipf
+        with zipf._lock:
+            zipf._writecheck(zinfo)
+            zipf._didModify = True
+            if zipf._seekable:
+                zipf.fp.seek(zipf.start_dir)
+            zinfo.header_offset = zipf.fp.tell()
+            zipf.fp.write(zinfo.FileHeader())
+            for chunk in chunks:
+                zipf.fp.write(chunk)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+            zipf.start_dir = zipf.fp.tell()
+        return True
+
+    def stream_for(self, pack_uri):
+        """
+        Return a writable binary file object for a new member corresponding
+        to *pack_uri*, compressed as it is written. No other member can be
+        written until it is closed.
+        """
+        return self._zipf.open(pack_uri.membername, 'w')
+
+    def write(self, pack_uri, blob, store=False):
         """
         Write *blob* to this zip package with the membername corresponding to
-        *pack_uri*.
+        *pack_uri*. The member is stored uncompressed when *store* is |True|.
         """
-        self._zipf.writestr(pack_uri.membername, blob)
+        if store:
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=ZIP_STORED)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob)
+
+    def _recompress_member(self, phys_reader, src_uri, pack_uri):
+        """
+        Copy the member corresponding to *src_uri* in zip *phys_reader* to
+        this zip package as the member corresponding to *pack_uri* using only
+        the public |ZipFile| interface, decompressing it a chunk at a time
+        and compressing it again. A stored member stays stored. Returns
+        |False|, writing nothing, if the member is encrypted.
+        """
+        src_info = phys_reader._zipf.getinfo(src_uri.membername)
+        if src_info.flag_bits & 0x01:
+            return False
+        if src_info.compress_type == ZIP_STORED:
+            member = ZipInfo(pack_uri.membername, time.localtime()[:6])
+            member.compress_type = ZIP_STORED
+        else:
+            member = pack_uri.membername
+        force_zip64 = src_info.file_size > ZIP64_LIMIT
+        with phys_reader.stream_for(src_uri) as src:
+            with self._zipf.open(member, 'w', force_zip64=force_zip64) as dst:
+                shutil.copyfileobj(src, dst, _ZipPkgReader._CHUNK_SIZE)
+        return True
+
+
+#: attributes of |ZipFile|, private to the zipfile module, used to copy a
+#: member still compressed; checked for before each copy
+_ZIPFILE_INTERNALS = (
+    'fp', 'filelist', 'NameToInfo', 'start_dir', '_didModify', '_lock',
+    '_seekable', '_writecheck',
+)
+
+
+def _has_zipfile_internals(zipf):
+    """
+    True if *zipf* has all the |ZipFile| internals a member is copied with
+    without recompressing it.
+    """
+    return all(hasattr(zipf, name) for name in _ZIPFILE_INTERNALS)
@@ -19,25 +19,66 @@ class PackageReader(object):
     Provides access to the contents of a zip-format OPC package via its
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes.
     """
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(self, content_types, pkg_srels, sparts, phys_reader=None):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._phys_reader = phys_reader
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, lazy=False):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
+        When *lazy* is |True|, only the content types and relationships are
+        read up front; *pkg_file* is kept open and the blob of each part is
+        read from it when first needed.
         """
         phys_reader = PhysPkgReader(pkg_file)
         content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+        pkg_srels = PackageReader.srels_for(phys_reader, PACKAGE_URI)
         sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+            phys_reader, pkg_srels, content_types, lazy
         )
+        if lazy:
+            return PackageReader(content_types, pkg_srels, sparts, phys_reader)
         phys_reader.close()
         return PackageReader(content_types, pkg_srels, sparts)
 
+    def close(self):
+        """
+        Release the package file a lazy reader reads part blobs from. Does
+        nothing when the reader is not lazy, its file being closed once
+        read.
+        """
+        if self._phys_reader is not None:
+            self._phys_reader.close()
+
+    @property
+    def is_lazy(self):
+        """
+        True if part blobs are read on demand, see :meth:`iter_deferred_sparts`.
+        """
+        return self._phys_reader is not None
+
+    def iter_deferred_sparts(self):
+        """
+        Generate a 4-tuple `(partname, content_type, reltype, load_blob)` for
+        each of the serialized parts in a lazy package, where *load_blob* is
+        a |_PartBlobSource| object, called with no arguments to read the
+        part blob.
+        """
+        phys_reader = self._phys_reader
+        for s in self._sparts:
+            load_blob = _PartBlobSource(phys_reader, s.partname)
+            yield (s.partname, s.content_type, s.reltype, load_blob)
+
+    def reads_from(self, pkg_file):
+        """
+        True if this is a lazy reader still reading from *pkg_file*, such
+        that overwriting *pkg_file* would lose the content of unread parts.
+        """
+        return self.is_lazy and self._phys_reader.reads_from(pkg_file)
+
     def iter_sparts(self):
         """
         Generate a 4-tuple `(partname, content_type, reltype, blob)` for each
@@ -58,14 +99,28 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def srels_for(phys_reader, source_uri):
+        """
+        Return |_SerializedRelationships| instance populated with
+        relationships for source identified by *source_uri* in
+        *phys_reader*, empty when the source has no rels item.
+        """
+        rels_xml = phys_reader.rels_xml_for(source_uri)
+        return _SerializedRelationships.load_from_xml(
+            source_uri.baseURI, rels_xml)
+
+    @staticmethod
+    def _load_serialized_parts(phys_reader, pkg_srels, content_types, lazy=False):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
-        starting with *pkg_srels*.
+        starting with *pkg_srels*. Part blobs are not read when *lazy* is
+        |True|.
         """
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, lazy=lazy
+        )
         for partname, blob, reltype, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(
@@ -75,21 +130,11 @@ class PackageReader(object):
         return tuple(sparts)
 
     @staticmethod
-    def _srels_for(phys_reader, source_uri):
-        """
-        Return |_SerializedRelationships| instance populated with
-        relationships for source identified by *source_uri*.
-        """
-        rels_xml = phys_reader.rels_xml_for(source_uri)
-        return _SerializedRelationships.load_from_xml(
-            source_uri.baseURI, rels_xml)
-
-    @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(phys_reader, srels, visited_partnames=None, lazy=False):
         """
         Generate a 4-tuple `(partname, blob, reltype, srels)` for each of the
         parts in *phys_reader* by walking the relationship graph rooted at
-        srels.
+        srels. *blob* is |None| when *lazy* is |True|.
         """
         if visited_partnames is None:
             visited_partnames = []
@@ -101,16 +146,39 @@ class PackageReader(object):
                 continue
             visited_partnames.append(partname)
             reltype = srel.reltype
-            part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
+            part_srels = PackageReader.srels_for(phys_reader, partname)
+            blob = None if lazy else phys_reader.blob_for(partname)
             yield (partname, blob, reltype, part_srels)
             next_walker = PackageReader._walk_phys_parts(
-                phys_reader, part_srels, visited_partnames
+                phys_reader, part_srels, visited_partnames, lazy
             )
             for partname, blob, reltype, srels in next_walker:
                 yield (partname, blob, reltype, srels)
 
 
+class _PartBlobSource(object):
+    """
+    Callable reading the blob of the part at *partname* from *phys_reader*.
+    Also copies the serialized part unchanged to a physical package writer,
+    for a part not modified since it was loaded.
+    """
+    def __init__(self, phys_reader, partname):
+        super(_PartBlobSource, self).__init__()
+        self._phys_reader = phys_reader
+        self._partname = partname
+
+    def __call__(self):
+        return self._phys_reader.blob_for(self._partname)
+
+    def copy_to(self, phys_writer, pack_uri):
+        """
+        Copy the serialized part to *phys_writer* as the member for
+        *pack_uri*, without decompressing it where possible. Returns |False|,
+        writing nothing, when *phys_writer* cannot copy from this source.
+        """
+        return phys_writer.copy_member(self._phys_reader, self._partname, pack_uri)
+
+
 class _ContentTypeMap(object):
     """
     Value type providing dictionary semantics for looking up content type by
@@ -18,22 +18,57 @@ from .spec import default_content_types
 class PackageWriter(object):
     """
     Writes a zip-format OPC package to *pkg_file*, where *pkg_file* can be
-    either a path to a zip file (a string) or a file-like object. Its single
-    API method, :meth:`write`, is static, so this class is not intended to
-    be instantiated.
+    either a path to a zip file (a string) or a file-like object, which
+    need not be seekable. Its API methods, :meth:`write` and
+    :meth:`iter_chunks`, are static, so this class is not intended to be
+    instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, compress_level=None, store_media=False):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. Members are deflated at zlib level
+        *compress_level*, or the zlib default when |None|. When *store_media*
+        is |True|, parts whose content type is already compressed, such as
+        JPEG and PNG images and embedded packages, are stored uncompressed.
+        """
+        phys_writer = PhysPkgWriter(pkg_file, compress_level)
+        for _ in PackageWriter._iter_write(phys_writer, pkg_rels, parts, store_media):
+            pass
+        phys_writer.close()
+
+    @staticmethod
+    def iter_chunks(pkg_rels, parts, compress_level=None, store_media=False):
+        """
+        Generate the bytes of the physical package :meth:`write` would write
+        for the same arguments, in chunks. A chunk is produced as each
+        member is written, so the whole package is never held in memory.
+        """
+        sink = _ChunkSink()
+        phys_writer = PhysPkgWriter(sink, compress_level)
+        for _ in PackageWriter._iter_write(phys_writer, pkg_rels, parts, store_media):
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+        phys_writer.close()
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _iter_write(phys_writer, pkg_rels, parts, store_media):
+        """
+        Write the members of the package to *phys_writer*, yielding |None|
+        after each member or part is written.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
         PackageWriter._write_content_types_stream(phys_writer, parts)
+        yield
         PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
-        phys_writer.close()
+        yield
+        for part in parts:
+            PackageWriter._write_part(phys_writer, part, store_media)
+            yield
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -45,15 +80,22 @@ class PackageWriter(object):
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
-        """
-        Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
-        """
-        for part in parts:
-            phys_writer.write(part.partname, part.blob)
-            if len(part._rels):
-                phys_writer.write(part.partname.rels_uri, part._rels.xml)
+    def _write_part(phys_writer, part, store_media=False):
+        """
+        Write the blob of *part* to the package, along with a rels item for
+        its relationships if and only if it has any. A part not modified
+        since it was loaded from a lazily read package is copied from that
+        package as-is when possible. A part of a compressed content type is
+        stored uncompressed when *store_media* is |True|.
+        """
+        source = None if part._is_modified else part._blob_source
+        if source is None or not source.copy_to(phys_writer, part.partname):
+            # ---read an unmodified blob from its source without keeping it---
+            blob = part.blob if source is None else source()
+            store = store_media and part.content_type in _COMPRESSED_CONTENT_TYPES
+            phys_writer.write(part.partname, blob, store)
+        if len(part._rels):
+            phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
@@ -64,6 +106,38 @@ class PackageWriter(object):
         phys_writer.write(PACKAGE_URI.rels_uri, pkg_rels.xml)
 
 
+#: content types of parts holding data already compressed, which deflating
+#: again does not make appreciably smaller
+_COMPRESSED_CONTENT_TYPES = frozenset((
+    CT.GIF, CT.JPEG, CT.MS_PHOTO, CT.PNG, CT.OFC_PACKAGE, CT.SML_SHEET,
+    CT.WML_DOCUMENT,
+))
+
+
+class _ChunkSink(object):
+    """
+    Write-only, non-seekable file-like object accumulating the bytes written
+    to it until they are taken with :meth:`drain`.
+    """
+    def __init__(self):
+        self._chunks = []
+
+    def drain(self):
+        """
+        Return the bytes written since the last call, as a single chunk.
+        """
+        chunk = b''.join(self._chunks)
+        self._chunks = []
+        return chunk
+
+    def flush(self):
+        pass
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+
 class _ContentTypesItem(object):
     """
     Service class that composes a content types item ([Content_Types].xml)
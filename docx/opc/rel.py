@@ -14,11 +14,33 @@ from .oxml import CT_Relationships
 class Relationships(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+
+    Relationships are indexed by reltype and by reltype and target, and the
+    lowest free rId number is tracked, so looking up or adding
+    a relationship does not scan the collection. Every dict method that adds
+    or removes a relationship keeps the indexes in step.
     """
     def __init__(self, baseURI):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_reltype = {}
+        self._rels_by_target = {}
+        self._rId_floor = 1
+
+    def __delitem__(self, rId):
+        self.pop(rId)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __setitem__(self, rId, rel):
+        replaced = self.get(rId)
+        if replaced is not None:
+            self._unindex(rId, replaced)
+        super(Relationships, self).__setitem__(rId, rel)
+        self._index(rId, rel, replaced is not None)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -26,10 +48,15 @@ class Relationships(dict):
         """
         rel = _Relationship(rId, reltype, target, self._baseURI, is_external)
         self[rId] = rel
-        if not is_external:
-            self._target_parts_by_rId[rId] = target
         return rel
 
+    def clear(self):
+        super(Relationships, self).clear()
+        self._target_parts_by_rId.clear()
+        self._rels_by_reltype.clear()
+        self._rels_by_target.clear()
+        self._rId_floor = 1
+
     def get_or_add(self, reltype, target_part):
         """
         Return relationship of *reltype* to *target_part*, newly added if not
@@ -54,6 +81,31 @@ class Relationships(dict):
             )
         return rel.rId
 
+    def pop(self, rId, *default):
+        """
+        Remove the relationship identified by *rId* and return it, or return
+        *default* if given and there is no such relationship.
+        """
+        if rId not in self:
+            return super(Relationships, self).pop(rId, *default)
+        rel = super(Relationships, self).pop(rId)
+        self._removed(rId, rel)
+        return rel
+
+    def popitem(self):
+        rId, rel = super(Relationships, self).popitem()
+        self._removed(rId, rel)
+        return rId, rel
+
+    def setdefault(self, rId, rel=None):
+        if rId not in self:
+            self[rId] = rel
+        return self[rId]
+
+    def update(self, *args, **kwargs):
+        for rId, rel in dict(*args, **kwargs).items():
+            self[rId] = rel
+
     def part_with_reltype(self, reltype):
         """
         Return target part of rel with matching *reltype*, raising |KeyError|
@@ -89,20 +141,10 @@ class Relationships(dict):
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        matching = self._rels_by_target.get((reltype, target, is_external))
+        if not matching:
+            return None
+        return next(iter(matching.values()))
 
     def _get_rel_of_type(self, reltype):
         """
@@ -110,14 +152,14 @@ class Relationships(dict):
         Raises |KeyError| if no matching relationship is found. Raises
         |ValueError| if more than one matching relationship is found.
         """
-        matching = [rel for rel in self.values() if rel.reltype == reltype]
-        if len(matching) == 0:
+        matching = self._rels_by_reltype.get(reltype)
+        if not matching:
             tmpl = "no relationship of type '%s' in collection"
             raise KeyError(tmpl % reltype)
         if len(matching) > 1:
             tmpl = "multiple relationships of type '%s' in collection"
             raise ValueError(tmpl % reltype)
-        return matching[0]
+        return next(iter(matching.values()))
 
     @property
     def _next_rId(self):
@@ -125,10 +167,74 @@ class Relationships(dict):
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        for n in range(1, len(self)+2):
-            rId_candidate = 'rId%d' % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        n = self._rId_floor
+        while 'rId%d' % n in self:
+            n += 1
+        # ---every rId below n is in use; only a pop can free one---
+        self._rId_floor = n
+        return 'rId%d' % n  # like 'rId19'
+
+    def _index(self, rId, rel, replacing=False):
+        """
+        Add *rel*, identified by *rId*, to the indexes of this collection.
+        When *replacing* a relationship under the same rId, *rel* keeps the
+        place of the one replaced in the indexes as in the collection.
+        """
+        if not rel.is_external:
+            self._target_parts_by_rId[rId] = rel._target
+        indexes = (
+            (self._rels_by_reltype, rel.reltype),
+            (self._rels_by_target, (rel.reltype, rel._target, rel.is_external)),
+        )
+        for index, key in indexes:
+            rels = index.setdefault(key, {})
+            rels[rId] = rel
+            if replacing:
+                # ---a replaced rel keeps its place in the collection, so
+                #    restore collection order among the rels under key---
+                index[key] = dict((k, rels[k]) for k in self if k in rels)
+
+    def _removed(self, rId, rel):
+        """
+        Remove *rel*, just removed from the collection, from its indexes and
+        make its rId available again.
+        """
+        self._unindex(rId, rel)
+        n = _rId_number(rId)
+        if n is not None and n < self._rId_floor:
+            self._rId_floor = n
+
+    def _unindex(self, rId, rel):
+        """
+        Remove *rel*, identified by *rId*, from the indexes of this
+        collection.
+        """
+        self._target_parts_by_rId.pop(rId, None)
+        _remove_indexed(self._rels_by_reltype, rel.reltype, rId)
+        _remove_indexed(
+            self._rels_by_target, (rel.reltype, rel._target, rel.is_external), rId
+        )
+
+
+def _remove_indexed(index, key, rId):
+    """
+    Remove the relationship identified by *rId* from those indexed under
+    *key* in *index*, dropping the key when none is left under it.
+    """
+    rels = index[key]
+    del rels[rId]
+    if not rels:
+        del index[key]
+
+
+def _rId_number(rId):
+    """
+    Return the number of an rId of the form 'rId19', or |None| for an rId
+    of any other form.
+    """
+    if rId.startswith('rId') and rId[3:].isdigit():
+        return int(rId[3:])
+    return None
 
 
 class _Relationship(object):
@@ -104,6 +104,10 @@ register_element_cls("w:pgSz", CT_PageSz)
 register_element_cls("w:sectPr", CT_SectPr)
 register_element_cls("w:type", CT_SectType)
 
+from .sdt import CT_Sdt, CT_SdtContent  # noqa
+register_element_cls("w:sdt", CT_Sdt)
+register_element_cls("w:sdtContent", CT_SdtContent)
+
 from .settings import CT_Settings  # noqa
 register_element_cls("w:settings", CT_Settings)
 
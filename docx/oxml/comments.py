@@ -58,8 +58,12 @@ class CT_Comments(BaseOxmlElement):
 	"""
 	comment = ZeroOrMore ('w:comment', successors=('w:comments',))
 
-	def add_comment(self,author, initials, date):
-		_next_id = self._next_commentId
+	def add_comment(self,author, initials, date, _id=None):
+		"""
+		Return a newly added ``<w:comment>`` element having id *_id*, or the
+		next id following those present when *_id* is |None|.
+		"""
+		_next_id = self._next_commentId if _id is None else _id
 		comment = CT_Com.new(initials, _next_id, date, author)
 		comment = self._insert_comment(comment)
 
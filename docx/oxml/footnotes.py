@@ -26,8 +26,12 @@ class CT_Footnotes(BaseOxmlElement):
 
         return int(ids[-1]) + 1
     
-    def add_footnote(self):
-        _next_id = self._next_id
+    def add_footnote(self, _id=None):
+        """
+        Return a newly added ``<w:footnote>`` element having id *_id*, or
+        the id following the last footnote when *_id* is |None|.
+        """
+        _next_id = self._next_id if _id is None else _id
         footnote = CT_Footnote.new(_next_id)
         footnote = self._insert_footnote(footnote)
         return footnote
@@ -108,7 +108,17 @@ def qn(tag):
     Stands for "qualified name", a utility function to turn a namespace
     prefixed tag name into a Clark-notation qualified tag name for lxml. For
     example, ``qn('p:cSld')`` returns ``'{http://schemas.../main}cSld'``.
+    Each Clark name is computed once and the same string object returned on
+    each later call for that tag.
     """
-    prefix, tagroot = tag.split(':')
-    uri = nsmap[prefix]
-    return '{%s}%s' % (uri, tagroot)
+    try:
+        return _clark_names[tag]
+    except KeyError:
+        prefix, tagroot = tag.split(':')
+        uri = nsmap[prefix]
+        clark_name = _clark_names[tag] = '{%s}%s' % (uri, tagroot)
+        return clark_name
+
+
+# ---memo of qn(), mapping a namespace-prefixed tag to its Clark name---
+_clark_names = {}
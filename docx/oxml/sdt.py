@@ -0,0 +1,45 @@
+# encoding: utf-8
+
+"""
+Custom element classes for structured document tags (content controls).
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from .xmlchemy import BaseOxmlElement, ZeroOrMore, ZeroOrOne
+
+
+class CT_Sdt(BaseOxmlElement):
+    """
+    ``<w:sdt>`` element, a content control wrapping its content in
+    a ``<w:sdtContent>`` child.
+    """
+    sdtPr = ZeroOrOne('w:sdtPr', successors=('w:sdtEndPr', 'w:sdtContent'))
+    sdtContent = ZeroOrOne('w:sdtContent', successors=())
+
+    @property
+    def alias_val(self):
+        """
+        Value of the ``w:val`` attribute of the ``<w:alias>`` property, the
+        friendly name of the content control, or |None| if not present.
+        """
+        vals = self.xpath('./w:sdtPr/w:alias/@w:val')
+        return vals[0] if vals else None
+
+    @property
+    def tag_val(self):
+        """
+        Value of the ``w:val`` attribute of the ``<w:tag>`` property, or
+        |None| if not present.
+        """
+        vals = self.xpath('./w:sdtPr/w:tag/@w:val')
+        return vals[0] if vals else None
+
+
+class CT_SdtContent(BaseOxmlElement):
+    """
+    ``<w:sdtContent>`` element, the content of a content control. At block
+    level it holds paragraphs and tables.
+    """
+    p = ZeroOrMore('w:p', successors=())
+    tbl = ZeroOrMore('w:tbl', successors=())
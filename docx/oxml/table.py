@@ -6,12 +6,15 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from xml.sax.saxutils import escape
+
 from . import parse_xml
 from . import OxmlElement
 from ..enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from ..exceptions import InvalidSpanError
 from .ns import nsdecls, qn, nsmap
 from ..shared import Emu, Twips
+from .text.run import _RUN_TEXT_SPLIT
 from .simpletypes import (
     ST_Merge, ST_TblLayoutType, ST_TblWidth, ST_TwipsMeasure, XsdInt, ST_String 
 )
@@ -158,6 +161,44 @@ class CT_Tbl(BaseOxmlElement):
         """
         return parse_xml(cls._tbl_xml(rows, cols, width))
 
+    @classmethod
+    def new_tbl_from_rows(cls, rows, width):
+        """
+        Return a new `w:tbl` element having a row for each sequence of cell
+        values in *rows*, with *width* distributed evenly between the
+        columns. The table has as many columns as the longest row; shorter
+        rows are padded with empty cells. Each value other than |None| is
+        converted to text and placed in a single run of the cell paragraph,
+        with tab and line break characters translated as for run text. The
+        XML for the whole table is generated and parsed in a single step.
+        """
+        rows = [list(row) for row in rows]
+        cols = max(len(row) for row in rows) if rows else 0
+        col_width = Emu(width/cols) if cols > 0 else Emu(0)
+        tc_open = (
+            '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="%d"/></w:tcPr>'
+            % col_width.twips
+        )
+        xml = [
+            '<w:tbl %s>'
+            '<w:tblPr>'
+            '<w:tblW w:type="auto" w:w="0"/>'
+            '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0"'
+            ' w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+            '</w:tblPr>' % nsdecls('w'),
+            cls._tblGrid_xml(cols, col_width),
+        ]
+        for row in rows:
+            xml.append('<w:tr>')
+            for value in row:
+                xml.append(tc_open)
+                xml.append(cls._cell_p_xml(value))
+                xml.append('</w:tc>')
+            xml.append((tc_open + '<w:p/></w:tc>') * (cols - len(row)))
+            xml.append('</w:tr>')
+        xml.append('</w:tbl>')
+        return parse_xml(''.join(xml))
+
     @property
     def tblStyle_val(self):
         """
@@ -201,6 +242,28 @@ class CT_Tbl(BaseOxmlElement):
             cls._trs_xml(rows, cols, col_width)
         )
 
+    @classmethod
+    def _cell_p_xml(cls, value):
+        """
+        Return the XML of a `w:p` element holding *value* as text in a single
+        run, or an empty paragraph when *value* is |None| or empty.
+        """
+        if value is None:
+            return '<w:p/>'
+        text = value if isinstance(value, str) else str(value)
+        if not text:
+            return '<w:p/>'
+        content = []
+        for piece in _RUN_TEXT_SPLIT.split(text):
+            if piece == '\t':
+                content.append('<w:tab/>')
+            elif piece in ('\n', '\r'):
+                content.append('<w:br/>')
+            elif piece:
+                space = ' xml:space="preserve"' if piece != piece.strip() else ''
+                content.append('<w:t%s>%s</w:t>' % (space, escape(piece)))
+        return '<w:p><w:r>%s</w:r></w:p>' % ''.join(content)
+
     @classmethod
     def _tblGrid_xml(cls, col_count, col_width):
         xml = '  <w:tblGrid>\n'
@@ -4,9 +4,49 @@
 Custom element classes related to paragraphs (CT_P).
 """
 
-from ..ns import qn
+from lxml import etree
+
+from ..ns import nsmap, qn
 from ..xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
 from ..comments import  CT_Com
+from .run import _RUN_CONTENT_TEXT
+
+# ---run content that can be moved into an adjacent run of the same format---
+_MERGEABLE_RUN_CONTENT = frozenset(
+    qn(tag) for tag in (
+        'w:t', 'w:delText', 'w:tab', 'w:br', 'w:cr', 'w:noBreakHyphen',
+        'w:softHyphen', 'w:lastRenderedPageBreak'
+    )
+)
+_TEXT_TAGS = frozenset((qn('w:t'), qn('w:delText')))
+
+# ---elements whose direct-child runs are normalized along with the
+# ---paragraph's own---
+_RUN_CONTAINERS = frozenset(
+    qn(tag) for tag in ('w:hyperlink', 'w:ins', 'w:del', 'w:smartTag')
+)
+
+_PROOF_ERR, _R, _RPR = qn('w:proofErr'), qn('w:r'), qn('w:rPr')
+_LAST_RENDERED_PAGE_BREAK = qn('w:lastRenderedPageBreak')
+_RSID_PREFIX = qn('w:rsid')
+
+
+def _run_content_xpath(runs):
+    """
+    Return a compiled XPath selecting, in document order, the ``<w:t>`` text
+    nodes and the other text-bearing run content elements of the runs
+    selected by location path *runs*.
+    """
+    steps = ['w:t/text()', 'w:tab', 'w:br', 'w:cr', 'w:noBreakHyphen']
+    return etree.XPath(
+        ' | '.join('%s/%s' % (runs, step) for step in steps),
+        namespaces=nsmap, smart_strings=False
+    )
+
+
+_RUN_CONTENT = _run_content_xpath('w:r')
+_ALL_RUN_CONTENT = _run_content_xpath('.//w:r[not(ancestor::w:r)]')
+
 
 class CT_P(BaseOxmlElement):
     """
@@ -116,6 +156,15 @@ class CT_P(BaseOxmlElement):
                 continue
             self.remove(child)
 
+    def normalize_runs(self):
+        """
+        Merge each run into the preceding run when the two are adjacent and
+        have the same ``<w:rPr>``, after removing ``<w:proofErr>`` elements
+        and rsid attributes. Only runs holding text, tabs and breaks are
+        merged. Return the number of runs merged away.
+        """
+        return _normalize_runs(self)
+
     def set_sectPr(self, sectPr):
         """
         Unconditionally replace or add *sectPr* as a grandchild in the
@@ -136,6 +185,23 @@ class CT_P(BaseOxmlElement):
             return None
         return pPr.style
     
+    @property
+    def text(self):
+        """
+        The text of the ``<w:r>`` children of this paragraph, as the
+        concatenated |CT_R.text| of each, without building the runs one by
+        one.
+        """
+        return _content_text(_RUN_CONTENT(self))
+
+    @property
+    def full_text(self):
+        """
+        Like :attr:`text`, but including runs nested in hyperlinks,
+        revisions and other run containers at any depth.
+        """
+        return _content_text(_ALL_RUN_CONTENT(self))
+
     @property
     def comment_id(self):
         _id = self.xpath('./w:commentRangeStart/@w:id')    
@@ -157,3 +223,114 @@ class CT_P(BaseOxmlElement):
     def style(self, style):
         pPr = self.get_or_add_pPr()
         pPr.style = style
+
+
+def _content_text(nodes):
+    """
+    Return the text of *nodes*, the result of a run content XPath, mapping
+    each element to the character it stands for.
+    """
+    return ''.join([
+        _RUN_CONTENT_TEXT[node.tag] if isinstance(node, etree._Element) else node
+        for node in nodes
+    ])
+
+
+def _normalize_runs(parent):
+    """
+    Normalize the runs that are children of *parent* in a single pass, then
+    those of its run container children, returning the number of runs
+    merged away.
+    """
+    _strip_rsids(parent)
+    merged = 0
+    group, group_key = [], None
+    for child in list(parent):
+        tag = child.tag
+        if tag == _PROOF_ERR:
+            parent.remove(child)
+            continue
+        if tag in _RUN_CONTAINERS:
+            merged += _normalize_runs(child)
+        key = None
+        if tag == _R:
+            _strip_rsids(child)
+            key = _merge_key(child)
+        if key is not None and key == group_key:
+            group.append(child)
+            continue
+        merged += _merge_runs(parent, group)
+        group, group_key = ([child], key) if key is not None else ([], None)
+    merged += _merge_runs(parent, group)
+    return merged
+
+
+def _merge_key(r):
+    """
+    Return a tuple of the tags and attributes within the ``<w:rPr>`` of
+    *r*, which runs must share to be merged, or |None| if *r* has content
+    that prevents merging.
+    """
+    key = ()
+    for child in r:
+        if child.tag == _RPR:
+            key = tuple((e.tag, tuple(e.attrib.items())) for e in child.iter())
+        elif child.tag not in _MERGEABLE_RUN_CONTENT:
+            return None
+    return key
+
+
+def _merge_runs(parent, runs):
+    """
+    Move the content of the second and later of adjacent *runs* into the
+    first and remove them from *parent*, joining adjacent ``<w:t>`` or
+    ``<w:delText>`` elements into one. Only the first
+    ``<w:lastRenderedPageBreak>``, a hint left by the last layout of the
+    document, is kept. Return the number of runs removed.
+    """
+    if len(runs) < 2:
+        return 0
+    target_r = runs[0]
+    last = target_r[-1] if len(target_r) else None
+    page_break = target_r.find(_LAST_RENDERED_PAGE_BREAK) is not None
+    texts = []
+    for r in runs[1:]:
+        for child in list(r):
+            tag = child.tag
+            if tag == _RPR:
+                continue
+            if tag == _LAST_RENDERED_PAGE_BREAK:
+                if page_break:
+                    continue
+                page_break = True
+            if last is not None and tag in _TEXT_TAGS and tag == last.tag:
+                texts.append(child.text or '')
+                continue
+            _join_text(last, texts)
+            target_r.append(child)
+            texts, last = [], child
+        parent.remove(r)
+    _join_text(last, texts)
+    return len(runs) - 1
+
+
+def _join_text(t, texts):
+    """
+    Append the strings in *texts* to the text of ``<w:t>`` or
+    ``<w:delText>`` element *t*.
+    """
+    if not texts:
+        return
+    text = ''.join([t.text or ''] + texts)
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(qn('xml:space'), 'preserve')
+
+
+def _strip_rsids(elm):
+    """
+    Remove the revision save id (``w:rsid*``) attributes of *elm*.
+    """
+    for name in elm.attrib.keys():
+        if name.startswith(_RSID_PREFIX):
+            del elm.attrib[name]
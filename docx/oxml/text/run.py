@@ -4,6 +4,8 @@
 Custom element classes related to text runs (CT_R).
 """
 
+import re
+
 from ..ns import qn
 from ..simpletypes import ST_BrClear, ST_BrType, ST_DecimalNumber, ST_String
 
@@ -14,6 +16,18 @@ from ..xmlchemy import (
 
 from .. import OxmlElement
 
+# ---text standing for each run content element other than <w:t>---
+_RUN_CONTENT_TEXT = {
+    qn('w:tab'): '\t',
+    qn('w:br'): '\n',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+_T = qn('w:t')
+
+# ---splits run text on the characters mapped to run content elements---
+_RUN_TEXT_SPLIT = re.compile(r'(\t|\n|\r)')
+
 
 class CT_Br(BaseOxmlElement):
     """
@@ -57,6 +71,19 @@ class CT_R(BaseOxmlElement):
         if len(text.strip()) < len(text):
             t.set(qn('xml:space'), 'preserve')
         return t
+    def convert_t_to_dele_t(self):
+        """
+        Replace each ``<w:t>`` child with a ``<w:delText>`` element holding
+        the same text, as required for a run inside a ``<w:del>`` element.
+        """
+        for t in self.t_lst:
+            dele_t = OxmlElement('w:delText')
+            dele_t.text = t.text
+            space = t.get(qn('xml:space'))
+            if space is not None:
+                dele_t.set(qn('xml:space'), space)
+            self.replace(t, dele_t)
+
     def add_drawing(self, inline_or_anchor):
         """
         Return a newly appended ``CT_Drawing`` (``<w:drawing>``) child
@@ -162,18 +189,16 @@ class CT_R(BaseOxmlElement):
         child elements like ``<w:tab/>`` translated to their Python
         equivalent.
         """
-        text = ''
-        for child in self:
-            if child.tag == qn('w:t'):
+        pieces = []
+        for child in self.iterchildren():
+            tag = child.tag
+            if tag == _T:
                 t_text = child.text
-                text += t_text if t_text is not None else ''
-            elif child.tag == qn('w:tab'):
-                text += '\t'
-            elif child.tag in (qn('w:br'), qn('w:cr')):
-                text += '\n'
-            elif child.tag == qn('w:noBreakHyphen'):
-                text += '-'
-        return text
+                if t_text:
+                    pieces.append(t_text)
+            elif tag in _RUN_CONTENT_TEXT:
+                pieces.append(_RUN_CONTENT_TEXT[tag])
+        return ''.join(pieces)
 
     @text.setter
     def text(self, text):
@@ -255,10 +280,15 @@ class _RunContentAppender(object):
     def add_text(self, text):
         """
         Append the run content elements corresponding to *text* to the
-        ``<w:r>`` element of this instance.
+        ``<w:r>`` element of this instance. The text between tab and line
+        break characters is buffered a segment at a time rather than
+        character by character.
         """
-        for char in text:
-            self.add_char(char)
+        for segment in _RUN_TEXT_SPLIT.split(text):
+            if len(segment) == 1:
+                self.add_char(segment)
+            elif segment:
+                self._bfr.append(segment)
         self.flush()
 
     def add_char(self, char):
@@ -93,7 +93,9 @@ class XmlString(Unicode):
 
 class MetaOxmlElement(type):
     """
-    Metaclass for BaseOxmlElement
+    Metaclass for BaseOxmlElement. The properties and methods generated for
+    the child elements and attributes declared on a class look up the Clark
+    name of their tag, computed once here as the class is constructed.
     """
     def __init__(cls, clsname, bases, clsdict):
         dispatchable = (
@@ -121,6 +123,9 @@ class BaseAttribute(object):
         """
         self._element_cls = element_cls
         self._prop_name = prop_name
+        self._clark_name = (
+            qn(self._attr_name) if ':' in self._attr_name else self._attr_name
+        )
 
         self._add_attr_property()
 
@@ -134,12 +139,6 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
-    def _clark_name(self):
-        if ':' in self._attr_name:
-            return qn(self._attr_name)
-        return self._attr_name
-
 
 class OptionalAttribute(BaseAttribute):
     """
@@ -157,11 +156,14 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -184,13 +186,15 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+
         def set_attr_value(obj, value):
-            if value is None or value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value is None or value == default:
+                if clark_name in obj.attrib:
+                    del obj.attrib[clark_name]
                 return
             str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -209,14 +213,17 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" %
                     (self._attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -237,9 +244,11 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def set_attr_value(obj, value):
             str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -371,8 +380,10 @@ class _BaseChildElement(object):
         descriptor. This default getter returns the child element with
         matching tag name or |None| if not present.
         """
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return next(obj.iterchildren(clark_name), None)
         get_child_element.__doc__ = (
             '``<%s>`` child element or |None| if not present.'
             % self._nsptagname
@@ -389,8 +400,10 @@ class _BaseChildElement(object):
         Return a function object suitable for the "get" side of a list
         property descriptor.
         """
+        clark_name = qn(self._nsptagname)
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return list(obj.iterchildren(clark_name))
         get_child_element_list.__doc__ = (
             'A list containing each of the ``<%s>`` child elements, in the o'
             'rder they appear.' % self._nsptagname
@@ -507,8 +520,10 @@ class OneAndOnlyOne(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        clark_name = qn(self._nsptagname)
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = next(obj.iterchildren(clark_name), None)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" %
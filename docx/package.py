@@ -4,7 +4,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from docx.image.image import Image
+from docx.image.image import Image, image_cache
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
@@ -36,25 +36,39 @@ class Package(OpcPackage):
         return ImageParts()
 
     def _gather_image_parts(self):
-        """Load the image part collection with all the image parts in package."""
+        """Load the image part collection with all the image parts in package.
+
+        Image parts are indexed by number as they are added and by SHA1 digest when
+        first looked up, so image blobs of a lazily loaded package are not read here.
+        """
+        image_parts = self.image_parts
         for rel in self.iter_rels():
             if rel.is_external:
                 continue
             if rel.reltype != RT.IMAGE:
                 continue
-            if rel.target_part in self.image_parts:
+            if rel.target_part in image_parts:
                 continue
-            self.image_parts.append(rel.target_part)
+            image_parts.append(rel.target_part)
 
 
 class ImageParts(object):
-    """Collection of |ImagePart| objects corresponding to images in the package"""
+    """Collection of |ImagePart| objects corresponding to images in the package
+
+    Indexes its image parts by SHA1 digest and tracks the image numbers in use, so
+    looking up an image and allocating a partname do not scan the collection.
+    """
 
     def __init__(self):
         self._image_parts = []
+        self._image_part_set = set()
+        self._by_sha1 = {}
+        self._unhashed = []
+        self._used_numbers = set()
+        self._next_number = 1
 
     def __contains__(self, item):
-        return self._image_parts.__contains__(item)
+        return item in self._image_part_set
 
     def __iter__(self):
         return self._image_parts.__iter__()
@@ -64,14 +78,22 @@ class ImageParts(object):
 
     def append(self, item):
         self._image_parts.append(item)
+        self._image_part_set.add(item)
+        self._unhashed.append(item)
+        self._used_numbers.add(item.partname.idx)
 
     def get_or_add_image_part(self, image_descriptor):
         """Return |ImagePart| object containing image identified by *image_descriptor*.
 
-        The image-part is newly created if a matching one is not present in the
-        collection.
+        *image_descriptor* is a path or file-like object, looked up in the process-wide
+        |ImageCache| ``docx.image.image.image_cache``, or an |Image| object, such as one
+        loaded with ``Image.from_file(path, keep_file=True)``. The image-part is newly
+        created if a matching one is not present in the collection.
         """
-        image = Image.from_file(image_descriptor)
+        if isinstance(image_descriptor, Image):
+            image = image_descriptor
+        else:
+            image = image_cache.image_for(image_descriptor)
         matching_image_part = self._get_by_sha1(image.sha1)
         if matching_image_part is not None:
             return matching_image_part
@@ -90,12 +112,16 @@ class ImageParts(object):
     def _get_by_sha1(self, sha1):
         """
         Return the image part in this collection having a SHA1 hash matching
-        *sha1*, or |None| if not found.
+        *sha1*, or |None| if not found. Parts appended since the last lookup
+        are hashed and indexed first; the first of parts with equal digests
+        is the one found.
         """
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        if self._unhashed:
+            by_sha1 = self._by_sha1
+            for image_part in self._unhashed:
+                by_sha1.setdefault(image_part.sha1, image_part)
+            self._unhashed = []
+        return self._by_sha1.get(sha1)
 
     def _next_image_partname(self, ext):
         """
@@ -104,10 +130,10 @@ class ImageParts(object):
         partname is unique by number, without regard to the extension. *ext*
         does not include the leading period.
         """
-        def image_partname(n):
-            return PackURI('/word/media/image%d.%s' % (n, ext))
-        used_numbers = [image_part.partname.idx for image_part in self]
-        for n in range(1, len(self)+1):
-            if n not in used_numbers:
-                return image_partname(n)
-        return image_partname(len(self)+1)
+        used_numbers = self._used_numbers
+        n = self._next_number
+        while n in used_numbers:
+            n += 1
+        # ---numbers are never released, so no lower number can become free---
+        self._next_number = n
+        return PackURI('/word/media/image%d.%s' % (n, ext))
@@ -1,16 +1,36 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import os
+from itertools import count
 
 from docx.opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 
 from docx.oxml import parse_xml
 from ..opc.part import XmlPart
+from ..shared import lazyproperty
 
 class CommentsPart(XmlPart):
     """Definition of Comments Part"""
 
+    def add_comment(self, author, initials, date):
+        """
+        Return a newly added ``<w:comment>`` element having the next
+        available comment id. Ids are allocated from a counter seeded once
+        from the existing comments rather than by re-reading them.
+        """
+        _id = next(self._comment_ids)
+        comment = self.element.add_comment(author, initials, date, _id)
+        self._comment_by_id[_id] = comment
+        return comment
+
+    def get_comment_by_id(self, _id):
+        """
+        Return the ``<w:comment>`` element having *_id*, or |None| if there
+        is no such comment.
+        """
+        return self._comment_by_id.get(_id)
+
     @classmethod
     def default(cls, package):
         partname = PackURI("/word/comments.xml")
@@ -18,6 +38,25 @@ class CommentsPart(XmlPart):
         element = parse_xml(cls._default_comments_xml())
         return cls(partname, content_type, element, package)
     
+    @lazyproperty
+    def _comment_by_id(self):
+        """
+        Dict mapping each comment id to its ``<w:comment>`` element, built
+        from the comments in this part on first use.
+        """
+        return dict((comment._id, comment) for comment in self.element.comment_lst)
+
+    @lazyproperty
+    def _comment_ids(self):
+        """
+        Iterator producing the id of each comment added. Ids keep the rule
+        ``CT_Comments`` applies, starting at 0 in a part having no comments
+        and otherwise at two more than the largest id in use, then rising in
+        steps of two.
+        """
+        comment_by_id = self._comment_by_id
+        return count(max(comment_by_id) + 2 if comment_by_id else 0, 2)
+
     @classmethod
     def _default_comments_xml(cls):
         path = os.path.join(os.path.split(__file__)[0], '..', 'templates', 'default-comments.xml')
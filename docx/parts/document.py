@@ -4,8 +4,10 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from itertools import count
+
 from docx.document import Document
-from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from docx.parts.hdrftr import FooterPart, HeaderPart
 from docx.parts.numbering import NumberingPart
 from docx.parts.settings import SettingsPart
@@ -61,6 +63,14 @@ class DocumentPart(BaseStoryPart):
         """Return |FooterPart| related by *rId*."""
         return self.related_parts[rId]
 
+    @property
+    def formatting_cascade(self):
+        """
+        |FormattingCascade| object resolving the effective formatting of the
+        runs and paragraphs in this document from its styles.
+        """
+        return self._styles_part.formatting_cascade
+
     def get_style(self, style_id, style_type):
         """
         Return the style in this document matching *style_id*. Returns the
@@ -91,6 +101,14 @@ class DocumentPart(BaseStoryPart):
         """
         return InlineShapes(self._element.body, self)
 
+    def next_revision_id(self):
+        """
+        Return the next available ``w:id`` value for a ``<w:ins>`` or
+        ``<w:del>`` revision mark anywhere in this document, its headers,
+        footers, footnotes, endnotes and comments included.
+        """
+        return next(self._revision_ids)
+
     @lazyproperty
     def numbering_part(self):
         """
@@ -107,12 +125,19 @@ class DocumentPart(BaseStoryPart):
     
     
 
-    def save(self, path_or_stream):
+    def iter_save_chunks(self, compress_level=None, store_media=False):
+        """
+        Return an iterator over the bytes of this document as saved, in
+        chunks.
+        """
+        return self.package.iter_save_chunks(compress_level, store_media)
+
+    def save(self, path_or_stream, compress_level=None, store_media=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
         a filesystem location (a string) or a file-like object.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, compress_level, store_media)
 
     @property
     def settings(self):
@@ -185,4 +210,26 @@ class DocumentPart(BaseStoryPart):
         except KeyError:
             footnotes_part = FootnotesPart.default(self)
             self.relate_to(footnotes_part, RT.FOOTNOTES)
-            return  footnotes_part
\ No newline at end of file
+            return  footnotes_part
+
+    @lazyproperty
+    def _revision_ids(self):
+        """
+        Iterator producing the id of each revision mark added, seeded once
+        from the revision marks in every part that can hold them, starting at
+        one more than the largest id in use, or 1 when there are none.
+        """
+        used_ids = []
+        for part in self.package.iter_parts():
+            if part.content_type not in _REVISION_CONTENT_TYPES:
+                continue
+            id_str_lst = part.element.xpath('//w:ins/@w:id | //w:del/@w:id')
+            used_ids.extend(int(id_str) for id_str in id_str_lst if id_str.isdigit())
+        return count(max(used_ids) + 1 if used_ids else 1)
+
+
+#: content types of the parts whose text can carry revision marks
+_REVISION_CONTENT_TYPES = frozenset((
+    CT.WML_COMMENTS, CT.WML_DOCUMENT_MAIN, CT.WML_ENDNOTES, CT.WML_FOOTER,
+    CT.WML_FOOTNOTES, CT.WML_HEADER,
+))
@@ -4,13 +4,49 @@ from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
 from ..oxml import parse_xml
+from ..shared import lazyproperty
 
+from itertools import count
 import os
 
 class FootnotesPart(XmlPart):
     """
     Definition of Footnotes Part
     """
+    def add_footnote(self):
+        """
+        Return a newly added ``<w:footnote>`` element having the next
+        available footnote id, allocated from a counter seeded once from the
+        existing footnotes.
+        """
+        _id = next(self._footnote_ids)
+        footnote = self.element.add_footnote(_id)
+        self._footnote_by_id[_id] = footnote
+        return footnote
+
+    def delete_footnote(self, _id):
+        """
+        Remove the ``<w:footnote>`` element having *_id* from this part.
+        Raises |KeyError| if there is no such footnote. References to it in
+        the document are not removed.
+        """
+        footnote = self._footnote_by_id.pop(_id)
+        self.element.remove(footnote)
+
+    def get_footnote_by_id(self, _id):
+        """
+        Return the ``<w:footnote>`` element having *_id*, or |None| if there
+        is no such footnote.
+        """
+        return self._footnote_by_id.get(_id)
+
+    def next_revision_id(self):
+        """
+        Return the next available ``w:id`` value for a ``<w:ins>`` or
+        ``<w:del>`` revision mark, unique across the document.
+        """
+        return self.package.main_document_part.next_revision_id()
+
     @classmethod
     def default(cls, package):
         partname = PackURI("/word/footnotes.xml")
@@ -18,6 +54,22 @@ class FootnotesPart(XmlPart):
         element = parse_xml(cls._default_footnotes_xml())
         return cls(partname, content_type, element, package)
 
+    @lazyproperty
+    def _footnote_by_id(self):
+        """
+        Dict mapping each footnote id to its ``<w:footnote>`` element, built
+        from the footnotes in this part on first use.
+        """
+        return dict((fn._id, fn) for fn in self.element.footnote_lst)
+
+    @lazyproperty
+    def _footnote_ids(self):
+        """
+        Iterator producing the id of each footnote added, starting at one
+        more than the largest id in use.
+        """
+        return count(max(self._footnote_by_id) + 1 if self._footnote_by_id else 0)
+
     @classmethod
     def _default_footnotes_xml(cls):
         path = os.path.join(os.path.split(__file__)[0], '..', 'templates', 'default-footnotes.xml')
@@ -23,6 +23,7 @@ class ImagePart(Part):
     def __init__(self, partname, content_type, blob, image=None):
         super(ImagePart, self).__init__(partname, content_type, blob)
         self._image = image
+        self._sha1 = None if image is None else image.sha1
 
     @property
     def default_cx(self):
@@ -63,9 +64,14 @@ class ImagePart(Part):
     def from_image(cls, image, partname):
         """
         Return an |ImagePart| instance newly created from *image* and
-        assigned *partname*.
+        assigned *partname*. The blob of an image kept as a file reference
+        is read from the file only when the part is written.
         """
-        return ImagePart(partname, image.content_type, image.blob, image)
+        if image.blob_path is None:
+            return ImagePart(partname, image.content_type, image.blob, image)
+        image_part = ImagePart(partname, image.content_type, None, image)
+        image_part._blob_source = _ImageFileBlobSource(image)
+        return image_part
 
     @property
     def image(self):
@@ -84,6 +90,25 @@ class ImagePart(Part):
     @property
     def sha1(self):
         """
-        SHA1 hash digest of the blob of this image part.
+        SHA1 hash digest of the blob of this image part. Computed once, on
+        first access, since the blob of an image part does not change.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._sha1 is None:
+            self._sha1 = hashlib.sha1(self._blob).hexdigest()
+        return self._sha1
+
+
+class _ImageFileBlobSource(object):
+    """
+    Blob source of an image part created from an |Image| kept as a file
+    reference; reads the image file when called. Has nothing to copy as-is.
+    """
+    def __init__(self, image):
+        super(_ImageFileBlobSource, self).__init__()
+        self._image = image
+
+    def __call__(self):
+        return self._image.blob
+
+    def copy_to(self, phys_writer, pack_uri):
+        return False
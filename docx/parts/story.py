@@ -30,6 +30,11 @@ class BaseStoryPart(XmlPart):
         rId = self.relate_to(image_part, RT.IMAGE)
         return rId, image_part.image
 
+    @property
+    def formatting_cascade(self):
+        """|FormattingCascade| resolving effective formatting from the document styles."""
+        return self._document_part.formatting_cascade
+
     def get_style(self, style_id, style_type):
         """Return the style in this document matching *style_id*.
 
@@ -72,7 +77,15 @@ class BaseStoryPart(XmlPart):
             return 1
         return max(used_ids) + 1
 
+    def next_revision_id(self):
+        """Return the next available `w:id` value for a `w:ins` or `w:del` revision mark.
+
+        Ids are allocated by the document part, so they are unique across the document.
+        """
+        return self._document_part.next_revision_id()
+
     @lazyproperty
     def _document_part(self):
         """|DocumentPart| object for this package."""
         return self.package.main_document_part
+
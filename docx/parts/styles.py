@@ -14,7 +14,9 @@ from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
 from ..oxml import parse_xml
-from ..styles.styles import Styles
+from ..shared import lazyproperty
+from ..styles.cascade import FormattingCascade
+from ..styles.styles import StyleIndex, Styles
 
 
 class StylesPart(XmlPart):
@@ -39,7 +41,23 @@ class StylesPart(XmlPart):
         The |_Styles| instance containing the styles (<w:style> element
         proxies) for this styles part.
         """
-        return Styles(self.element)
+        return Styles(self.element, self)
+
+    @lazyproperty
+    def style_index(self):
+        """
+        |StyleIndex| object indexing the styles in this part by style id and
+        name, shared by every |Styles| object of this part.
+        """
+        return StyleIndex(self.element)
+
+    @lazyproperty
+    def formatting_cascade(self):
+        """
+        |FormattingCascade| object resolving the effective formatting of
+        runs and paragraphs from the styles in this part.
+        """
+        return FormattingCascade(self.element, self.style_index)
 
     @classmethod
     def _default_styles_xml(cls):
@@ -0,0 +1,65 @@
+# encoding: utf-8
+
+"""
+The |StructuredDocumentTag| object, proxy for a block-level content control.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from .blkcntnr import BlockItemContainer
+from .oxml import OxmlElement
+
+
+class StructuredDocumentTag(BlockItemContainer):
+    """
+    Proxy for a ``<w:sdt>`` element holding block items, such as a content
+    control wrapping a table of contents. Its paragraphs, tables and other
+    block items are those of its content.
+
+    Reading a content control having no ``<w:sdtContent>`` child leaves it
+    unchanged; the child is added only when a block item is added.
+    """
+    def __init__(self, sdt, parent):
+        sdtContent = sdt.sdtContent
+        if sdtContent is None:
+            sdtContent = OxmlElement('w:sdtContent')
+        super(StructuredDocumentTag, self).__init__(sdtContent, parent)
+        self._sdt = sdt
+
+    def add_table(self, rows, cols, width):
+        self._add_sdtContent()
+        return super(StructuredDocumentTag, self).add_table(rows, cols, width)
+
+    def add_table_from_data(self, data, width, style=None):
+        self._add_sdtContent()
+        return super(StructuredDocumentTag, self).add_table_from_data(
+            data, width, style
+        )
+
+    @property
+    def alias(self):
+        """
+        Friendly name of this content control, or |None| if it has none.
+        """
+        return self._sdt.alias_val
+
+    @property
+    def tag(self):
+        """
+        Tag identifying this content control to applications, or |None| if
+        it has none.
+        """
+        return self._sdt.tag_val
+
+    def _add_paragraph(self):
+        self._add_sdtContent()
+        return super(StructuredDocumentTag, self)._add_paragraph()
+
+    def _add_sdtContent(self):
+        """
+        Make the ``<w:sdtContent>`` child of this content control the element
+        block items are added to, adding it if not present. Until then an
+        empty stand-in element is read in its place.
+        """
+        if self._element.getparent() is not self._sdt:
+            self._element = self._sdt.get_or_add_sdtContent()
@@ -231,6 +231,31 @@ class ElementProxy(object):
         return self._parent.part
 
 
+class FormatProxy(ElementProxy):
+    """
+    Base class for proxies of formatting properties, such as |Font|, that
+    report each property assignment to their parent. A proxy for the
+    formatting of a style has the style as parent, so changing the style's
+    formatting discards the formatting resolved from it.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        super(FormatProxy, self).__setattr__(name, value)
+        if not name.startswith('_'):
+            self._formatting_changed()
+
+    def _formatting_changed(self):
+        """
+        Report a change made through this proxy to its parent, if the parent
+        takes such reports.
+        """
+        formatting_changed = getattr(self._parent, '_formatting_changed', None)
+        if formatting_changed is not None:
+            formatting_changed()
+
+
 class Parented(object):
     """
     Provides common services for document elements that occur below a part
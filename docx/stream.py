@@ -0,0 +1,567 @@
+# encoding: utf-8
+
+"""
+Streaming access to documents too large to comfortably hold in memory.
+
+|StreamReader| reads the document part straight from the package with
+``lxml.etree.iterparse`` and produces lightweight records for its paragraphs
+and tables, discarding the XML of each block once its record is produced.
+Memory use is bounded by the largest top-level block rather than by the
+size of the document, and no |Document| object or oxml element classes are
+involved::
+
+    with StreamReader('contract.docx') as reader:
+        for block in reader.iter_blocks():
+            if isinstance(block, ParagraphRecord):
+                index(block.text)
+        comments = dict((c.id, c.text) for c in reader.iter_comments())
+
+|StreamingDocument| is the append-only counterpart, writing each paragraph
+and table to the package as soon as the next one is added::
+
+    with StreamingDocument('report.docx') as document:
+        document.add_heading('Results', level=1)
+        for row in rows:
+            document.add_paragraph(format_row(row))
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from lxml import etree
+
+from .api import Document
+from .enum.text import WD_BREAK
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .opc.packuri import PACKAGE_URI
+from .opc.phys_pkg import PhysPkgReader, PhysPkgWriter
+from .opc.pkgreader import PackageReader, _ContentTypeMap
+from .opc.pkgwriter import PackageWriter
+from .oxml import OxmlElement
+from .oxml.ns import qn
+from .oxml.table import CT_Tbl
+from .oxml.text.run import _RUN_CONTENT_TEXT
+from .table import Table
+from .text.paragraph import Paragraph
+
+
+_W_P = qn('w:p')
+_W_R = qn('w:r')
+_W_TBL = qn('w:tbl')
+_W_TR = qn('w:tr')
+_W_TC = qn('w:tc')
+_W_VAL = qn('w:val')
+_W_ID = qn('w:id')
+
+
+class StreamReader(object):
+    """
+    Read-only reader of the document at *pkg_file*, a path to a ``.docx``
+    file or a file-like object. The package stays open until :meth:`close`
+    is called, or the ``with`` block the reader is used in ends.
+
+    Each of the iterator methods parses its part afresh when called, so
+    each may be iterated any number of times, but not concurrently with
+    itself.
+    """
+    def __init__(self, pkg_file):
+        super(StreamReader, self).__init__()
+        self._phys_reader = phys_reader = PhysPkgReader(pkg_file)
+        try:
+            content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
+            pkg_srels = PackageReader.srels_for(phys_reader, PACKAGE_URI)
+            self._document_partname = _target_partname(pkg_srels, RT.OFFICE_DOCUMENT)
+            if self._document_partname is None:
+                raise KeyError('no main document part in package')
+            content_type = content_types[self._document_partname]
+            if content_type != CT.WML_DOCUMENT_MAIN:
+                tmpl = "file '%s' is not a Word file, content type is '%s'"
+                raise ValueError(tmpl % (pkg_file, content_type))
+            document_srels = PackageReader.srels_for(
+                phys_reader, self._document_partname
+            )
+            self._comments_partname = _target_partname(document_srels, RT.COMMENTS)
+            self._footnotes_partname = _target_partname(document_srels, RT.FOOTNOTES)
+        except Exception:
+            phys_reader.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the package, after which records can no longer be read.
+        """
+        self._phys_reader.close()
+
+    def iter_blocks(self):
+        """
+        Generate a |ParagraphRecord| or |TableRecord| for each paragraph and
+        table in the document body, in document order. Paragraphs inside
+        content controls are included; a table is produced whole, with the
+        paragraphs and nested tables of its cells.
+        """
+        for elm in self._iter_top_level(self._document_partname, (_W_P, _W_TBL)):
+            yield _block_record(elm)
+
+    def iter_paragraphs(self):
+        """
+        Generate a |ParagraphRecord| for each paragraph in the document body,
+        including those in table cells, in document order.
+        """
+        for block in self.iter_blocks():
+            if isinstance(block, TableRecord):
+                for paragraph in block.iter_paragraphs():
+                    yield paragraph
+            else:
+                yield block
+
+    def iter_comments(self):
+        """
+        Generate a |CommentRecord| for each comment in the document, in the
+        order they appear in the comments part.
+        """
+        if self._comments_partname is None:
+            return
+        for elm in self._iter_top_level(self._comments_partname, (qn('w:comment'),)):
+            yield CommentRecord(
+                elm.get(_W_ID), elm.get(qn('w:author')),
+                elm.get(qn('w:initials')), elm.get(qn('w:date')),
+                _paragraph_records(elm)
+            )
+
+    def iter_footnotes(self):
+        """
+        Generate a |FootnoteRecord| for each footnote in the document,
+        including the separator footnotes Word adds, which have a *type*.
+        """
+        if self._footnotes_partname is None:
+            return
+        for elm in self._iter_top_level(self._footnotes_partname, (qn('w:footnote'),)):
+            yield FootnoteRecord(
+                elm.get(_W_ID), elm.get(qn('w:type')), _paragraph_records(elm)
+            )
+
+    def _iter_top_level(self, partname, tags):
+        """
+        Generate each element in part *partname* having one of *tags* and
+        not inside another such element, fully parsed. The element and
+        everything before it are discarded when the next one is requested.
+        """
+        stream = self._phys_reader.stream_for(partname)
+        try:
+            events = etree.iterparse(
+                stream, events=('start', 'end'), remove_blank_text=True,
+                resolve_entities=False
+            )
+            depth = 0
+            for event, elm in events:
+                if elm.tag not in tags:
+                    continue
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth:
+                    continue
+                yield elm
+                elm.clear()
+                parent = elm.getparent()
+                while elm.getprevious() is not None:
+                    del parent[0]
+        finally:
+            stream.close()
+
+
+class StreamingDocument(object):
+    """
+    Append-only document written to *path_or_stream* as it is built, for
+    generating documents too long to hold in memory. *template* is the path
+    or file-like object of a document providing styles, sections, headers
+    and footers; the default template is used when it is |None|. Content
+    already in the body of *template* starts the document.
+
+    Only the most recently added paragraph or table is held in memory; it
+    is written to the document part as soon as another block is added, so
+    a block must not be changed after the next one is added. All other
+    parts stay in memory as usual and are available through
+    :attr:`document`, for example to add comments or change the page
+    setup of the last section. They are written by :meth:`close`, which is
+    called when the ``with`` block the object is used in ends without an
+    exception. *compress_level* and *store_media* are as for
+    :meth:`Document.save`.
+    """
+    def __init__(self, path_or_stream, template=None, compress_level=None,
+                 store_media=False):
+        super(StreamingDocument, self).__init__()
+        self._document = Document(template)
+        self._store_media = store_media
+        self._pending = None
+        self._phys_writer = PhysPkgWriter(path_or_stream, compress_level)
+        try:
+            self._member = self._phys_writer.stream_for(self._document.part.partname)
+            self._writer = self._write_document_xml(self._member)
+            next(self._writer)
+        except Exception:
+            self._phys_writer.close()
+            raise
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif not self._closed:
+            # ---leave the incomplete package, just release the output---
+            self._closed = True
+            self._writer.close()
+            self._member.close()
+            self._phys_writer.close()
+
+    def add_heading(self, text='', level=1):
+        """
+        Return a heading paragraph newly added to the end of the document,
+        styled as by :meth:`Document.add_heading`.
+        """
+        if not 0 <= level <= 9:
+            raise ValueError("level must be in range 0-9, got %d" % level)
+        style = "Title" if level == 0 else "Heading %d" % level
+        return self.add_paragraph(text, style)
+
+    def add_page_break(self):
+        """
+        Return a newly added |Paragraph| object containing only a page break.
+        """
+        paragraph = self.add_paragraph()
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        return paragraph
+
+    def add_paragraph(self, text='', style=None):
+        """
+        Return a paragraph newly added to the end of the document, populated
+        with *text* and having paragraph style *style*, as for
+        :meth:`Document.add_paragraph`.
+        """
+        paragraph = Paragraph(self._add_block(OxmlElement('w:p')), self._body)
+        if text:
+            paragraph.add_run(text)
+        if style is not None:
+            paragraph.style = style
+        return paragraph
+
+    def add_table(self, rows, cols, style=None):
+        """
+        Return a table newly added to the end of the document, having *rows*
+        rows, *cols* columns and table style *style*, as for
+        :meth:`Document.add_table`.
+        """
+        tbl = CT_Tbl.new_tbl(rows, cols, self._document._block_width)
+        table = Table(self._add_block(tbl), self._body)
+        table.style = style
+        return table
+
+    def add_table_from_data(self, data, style=None):
+        """
+        Return a table newly added to the end of the document, having a row
+        for each sequence of cell values in *data* and table style *style*,
+        as for :meth:`Document.add_table_from_data`.
+        """
+        tbl = CT_Tbl.new_tbl_from_rows(data, self._document._block_width)
+        table = Table(self._add_block(tbl), self._body)
+        table.style = style
+        return table
+
+    def close(self):
+        """
+        Write the last block and the remaining parts and close the package.
+        Nothing can be added afterwards.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._flush_pending()
+        try:
+            self._writer.send(self._body._element.sectPr)
+            self._writer.send(None)
+        except StopIteration:
+            pass
+        self._member.close()
+        self._write_other_parts()
+        self._phys_writer.close()
+
+    @property
+    def document(self):
+        """
+        The in-memory |Document| object holding the parts other than the
+        document body, such as styles, sections, comments and settings.
+        Body content must be added through the methods of the streaming
+        document rather than through this object.
+        """
+        return self._document
+
+    def _add_block(self, elm):
+        """
+        Return *elm* after making it the pending block, writing the
+        previously pending block.
+        """
+        if self._closed:
+            raise ValueError('cannot add to a closed StreamingDocument')
+        self._flush_pending()
+        self._pending = elm
+        return elm
+
+    @property
+    def _body(self):
+        return self._document._body
+
+    def _flush_pending(self):
+        if self._pending is not None:
+            self._writer.send(self._pending)
+            self._pending = None
+
+    def _write_document_xml(self, stream):
+        """
+        Generator writing the document part to *stream*. Each block element
+        sent to it is written into the body, after the content of the
+        template body; sending |None| ends the body and document.
+        """
+        document_elm = self._document.element
+        body = document_elm.body
+        template_blocks = [child for child in body if child is not body.sectPr]
+        with etree.xmlfile(stream, encoding='UTF-8') as xf:
+            xf.write_declaration(standalone=True)
+            with xf.element(document_elm.tag, dict(document_elm.attrib),
+                            nsmap=document_elm.nsmap):
+                for child in document_elm:
+                    if child is body:
+                        break
+                    xf.write(child)
+                with xf.element(body.tag, dict(body.attrib)):
+                    for child in template_blocks:
+                        xf.write(child)
+                        body.remove(child)
+                    while True:
+                        elm = yield
+                        if elm is None:
+                            break
+                        xf.write(elm)
+                for child in body.itersiblings():
+                    xf.write(child)
+
+    def _write_other_parts(self):
+        """
+        Write the content types, the relationships and every part except
+        the already-written document part.
+        """
+        phys_writer = self._phys_writer
+        document_part = self._document.part
+        package = document_part.package
+        parts = list(package.parts)
+        for part in parts:
+            part.before_marshal()
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, package.rels)
+        for part in parts:
+            if part is not document_part:
+                PackageWriter._write_part(phys_writer, part, self._store_media)
+            elif len(part._rels):
+                phys_writer.write(part.partname.rels_uri, part._rels.xml)
+
+
+class RunRecord(object):
+    """
+    Text and basic character formatting of a run. *bold* and *italic* are
+    |True| or |False| when set directly on the run and |None| otherwise.
+    """
+    __slots__ = ('text', 'style_id', 'bold', 'italic')
+
+    def __init__(self, text, style_id, bold, italic):
+        self.text = text
+        self.style_id = style_id
+        self.bold = bold
+        self.italic = italic
+
+
+class ParagraphRecord(object):
+    """
+    Text, style id and runs of a paragraph, along with the ids of the
+    comments and footnotes referenced from it. The text includes that of
+    runs in hyperlinks and inserted revisions.
+    """
+    __slots__ = ('style_id', 'runs', 'comment_ids', 'footnote_ids')
+
+    def __init__(self, style_id, runs, comment_ids, footnote_ids):
+        self.style_id = style_id
+        self.runs = runs
+        self.comment_ids = comment_ids
+        self.footnote_ids = footnote_ids
+
+    @property
+    def text(self):
+        return ''.join([run.text for run in self.runs])
+
+
+class TableRecord(object):
+    """
+    Table as a list of rows, each a list of |CellRecord| objects. Merged
+    cells are not expanded, so rows may differ in length.
+    """
+    __slots__ = ('rows',)
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def iter_paragraphs(self):
+        """
+        Generate each |ParagraphRecord| in the cells of this table, row by
+        row, including those in nested tables.
+        """
+        for row in self.rows:
+            for cell in row:
+                for block in cell.blocks:
+                    if isinstance(block, TableRecord):
+                        for paragraph in block.iter_paragraphs():
+                            yield paragraph
+                    else:
+                        yield block
+
+
+class CellRecord(object):
+    """
+    Table cell as a list of |ParagraphRecord| and |TableRecord| blocks.
+    """
+    __slots__ = ('blocks',)
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+
+    @property
+    def text(self):
+        """
+        Text of the paragraphs directly in this cell, separated by newlines.
+        """
+        return '\n'.join(
+            [b.text for b in self.blocks if isinstance(b, ParagraphRecord)]
+        )
+
+
+class CommentRecord(object):
+    """
+    Id, author, initials, date string and paragraphs of a comment.
+    """
+    __slots__ = ('id', 'author', 'initials', 'date', 'paragraphs')
+
+    def __init__(self, id, author, initials, date, paragraphs):
+        self.id = id
+        self.author = author
+        self.initials = initials
+        self.date = date
+        self.paragraphs = paragraphs
+
+    @property
+    def text(self):
+        return '\n'.join([p.text for p in self.paragraphs])
+
+
+class FootnoteRecord(object):
+    """
+    Id, type and paragraphs of a footnote. *type* is |None| for a regular
+    footnote and e.g. ``'separator'`` for the separators Word adds.
+    """
+    __slots__ = ('id', 'type', 'paragraphs')
+
+    def __init__(self, id, type, paragraphs):
+        self.id = id
+        self.type = type
+        self.paragraphs = paragraphs
+
+    @property
+    def text(self):
+        return '\n'.join([p.text for p in self.paragraphs])
+
+
+def _block_record(elm):
+    if elm.tag == _W_TBL:
+        return _table_record(elm)
+    return _paragraph_record(elm)
+
+
+def _block_records(elm):
+    """
+    Return a record for each paragraph and table in *elm*, looking into
+    content controls but not into the paragraphs and tables found.
+    """
+    records = []
+    for child in elm.iterchildren():
+        if child.tag in (_W_P, _W_TBL):
+            records.append(_block_record(child))
+        elif child.tag == qn('w:sdt'):
+            sdt_content = child.find(qn('w:sdtContent'))
+            if sdt_content is not None:
+                records.extend(_block_records(sdt_content))
+    return records
+
+
+def _on_off(rPr, tag):
+    """
+    Value of the on/off property *tag* in *rPr*; |None| when not present.
+    """
+    if rPr is None:
+        return None
+    elm = rPr.find(tag)
+    if elm is None:
+        return None
+    return elm.get(_W_VAL) not in ('0', 'false', 'off')
+
+
+def _paragraph_record(p):
+    pPr = p.find(qn('w:pPr'))
+    pStyle = None if pPr is None else pPr.find(qn('w:pStyle'))
+    style_id = None if pStyle is None else pStyle.get(_W_VAL)
+    runs, comment_ids, footnote_ids = [], [], []
+    for r in p.iter(_W_R):
+        text = []
+        for child in r.iterchildren():
+            tag = child.tag
+            if tag == qn('w:t'):
+                text.append(child.text or '')
+            elif tag in _RUN_CONTENT_TEXT:
+                text.append(_RUN_CONTENT_TEXT[tag])
+            elif tag == qn('w:commentReference'):
+                comment_ids.append(child.get(_W_ID))
+            elif tag == qn('w:footnoteReference'):
+                footnote_ids.append(child.get(_W_ID))
+        rPr = r.find(qn('w:rPr'))
+        rStyle = None if rPr is None else rPr.find(qn('w:rStyle'))
+        runs.append(RunRecord(
+            ''.join(text), None if rStyle is None else rStyle.get(_W_VAL),
+            _on_off(rPr, qn('w:b')), _on_off(rPr, qn('w:i'))
+        ))
+    return ParagraphRecord(style_id, runs, comment_ids, footnote_ids)
+
+
+def _paragraph_records(elm):
+    return [_paragraph_record(p) for p in elm.iterchildren(_W_P)]
+
+
+def _table_record(tbl):
+    return TableRecord([
+        [CellRecord(_block_records(tc)) for tc in tr.iterchildren(_W_TC)]
+        for tr in tbl.iterchildren(_W_TR)
+    ])
+
+
+def _target_partname(srels, reltype):
+    """
+    Partname of the first internal relationship of *reltype* in *srels*, or
+    |None| if there is none.
+    """
+    for srel in srels:
+        if srel.reltype == reltype and not srel.is_external:
+            return srel.target_partname
+    return None
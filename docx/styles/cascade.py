@@ -0,0 +1,249 @@
+# encoding: utf-8
+
+"""
+|FormattingCascade| object, resolving the effective character and paragraph
+formatting of runs and paragraphs from the style hierarchy.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from copy import deepcopy
+
+from lxml import etree
+
+from ..enum.style import WD_STYLE_TYPE
+from ..oxml import OxmlElement
+from ..oxml.ns import qn
+
+
+# ---properties whose attributes are merged one by one down the cascade,
+# ---rather than the element as a whole replacing the inherited one---
+_MERGED_ATTRIBUTES = frozenset(
+    qn(tag) for tag in ('w:rFonts', 'w:lang', 'w:spacing', 'w:ind')
+)
+
+# ---formatting of the element itself rather than properties to inherit---
+_SKIPPED_RPR = frozenset(qn(tag) for tag in ('w:rStyle', 'w:rPrChange'))
+_SKIPPED_PPR = frozenset(
+    qn(tag) for tag in ('w:pStyle', 'w:rPr', 'w:sectPr', 'w:pPrChange')
+)
+
+# ---toggle properties, which a character style switches off again when the
+# ---paragraph style already switches them on---
+_TOGGLES = frozenset(
+    qn(tag) for tag in (
+        'w:b', 'w:bCs', 'w:caps', 'w:emboss', 'w:i', 'w:iCs', 'w:imprint',
+        'w:outline', 'w:shadow', 'w:smallCaps', 'w:strike', 'w:vanish'
+    )
+)
+
+
+class FormattingCascade(object):
+    """
+    Resolves the formatting in effect for a run or paragraph by merging, in
+    increasing order of precedence, the document defaults, the paragraph
+    style and the styles it is based on, the character style and the
+    styles it is based on, and direct formatting.
+
+    Resolved formatting is memoized by style id and the XML of the direct
+    formatting, so the many runs and paragraphs of a document sharing the
+    same styles and direct formatting resolve only once. The memo is
+    discarded by :meth:`reset`, which is called when a style is added,
+    deleted, renamed or re-based and when the formatting of a style is
+    changed through its |Font| or |ParagraphFormat|, including their color
+    and tab stops. Changes to style formatting made by other means, such as
+    editing the style XML directly, require a call to :meth:`reset`.
+
+    Table styles, numbering-level formatting and theme fonts are not part
+    of the cascade.
+    """
+    def __init__(self, styles_elm, style_index):
+        super(FormattingCascade, self).__init__()
+        self._styles_elm = styles_elm
+        self._style_index = style_index
+        self.reset()
+
+    def paragraph_properties(self, p):
+        """
+        Return a detached ``<w:p>`` element whose ``<w:pPr>`` child holds
+        the paragraph formatting in effect for paragraph element *p*. The
+        element is shared between paragraphs and must not be changed.
+        """
+        pPr = p.pPr
+        style_id = None if pPr is None else pPr.style
+        key = (style_id, None if pPr is None else etree.tostring(pPr))
+        resolved = self._paragraphs.get(key)
+        if resolved is None:
+            merged = deepcopy(self._style_pPr(self._paragraph_style(style_id)))
+            if pPr is not None:
+                _merge(merged, pPr, _SKIPPED_PPR)
+            resolved = OxmlElement('w:p')
+            resolved.append(merged)
+            self._paragraphs[key] = resolved
+        return resolved
+
+    def reset(self):
+        """
+        Discard all resolved formatting, causing it to be resolved again on
+        next use.
+        """
+        self._runs = {}
+        self._paragraphs = {}
+        self._style_rPrs = {}
+        self._style_pPrs = {}
+        self._defaults = None
+
+    def run_properties(self, r):
+        """
+        Return a detached ``<w:r>`` element whose ``<w:rPr>`` child holds
+        the character formatting in effect for run element *r*. The element
+        is shared between runs and must not be changed.
+        """
+        p = next(r.iterancestors(qn('w:p')), None)
+        pPr = None if p is None else p.pPr
+        p_style_id = None if pPr is None else pPr.style
+        rPr = r.rPr
+        r_style_id = None if rPr is None else rPr.style
+        key = (
+            p_style_id, r_style_id, None if rPr is None else etree.tostring(rPr)
+        )
+        resolved = self._runs.get(key)
+        if resolved is None:
+            resolved = OxmlElement('w:r')
+            resolved.append(self._resolve_rPr(p_style_id, r_style_id, rPr))
+            self._runs[key] = resolved
+        return resolved
+
+    def _character_style(self, style_id):
+        return self._style_of_type(style_id, WD_STYLE_TYPE.CHARACTER)
+
+    @property
+    def _default_properties(self):
+        """
+        The ``(rPr, pPr)`` pair of document default formatting, each an
+        empty element when no default is defined.
+        """
+        if self._defaults is None:
+            rPr, pPr = OxmlElement('w:rPr'), OxmlElement('w:pPr')
+            docDefaults = self._styles_elm.docDefaults
+            if docDefaults is not None:
+                rPrDefault, pPrDefault = docDefaults.rPrDefault, docDefaults.pPrDefault
+                if rPrDefault is not None and rPrDefault.rPr is not None:
+                    _merge(rPr, rPrDefault.rPr, _SKIPPED_RPR)
+                if pPrDefault is not None and pPrDefault.pPr is not None:
+                    _merge(pPr, pPrDefault.pPr, _SKIPPED_PPR)
+            self._defaults = (rPr, pPr)
+        return self._defaults
+
+    def _paragraph_style(self, style_id):
+        return self._style_of_type(style_id, WD_STYLE_TYPE.PARAGRAPH)
+
+    def _resolve_rPr(self, p_style_id, r_style_id, rPr):
+        """
+        Return a new ``<w:rPr>`` element holding the result of applying the
+        styles having *p_style_id* and *r_style_id* and direct formatting
+        *rPr* over the document defaults.
+        """
+        merged = deepcopy(self._default_properties[0])
+        paragraph_rPr = self._style_rPr(self._paragraph_style(p_style_id))
+        _merge(merged, paragraph_rPr, _SKIPPED_RPR)
+        character_rPr = self._style_rPr(self._character_style(r_style_id))
+        for child in character_rPr:
+            inherited = paragraph_rPr.find(child.tag)
+            if child.tag in _TOGGLES and inherited is not None:
+                toggled = deepcopy(child)
+                if _is_on(inherited) == _is_on(child):
+                    toggled.set(qn('w:val'), '0')
+                else:
+                    toggled.attrib.pop(qn('w:val'), None)
+                _merge_child(merged, toggled)
+            else:
+                _merge_child(merged, child)
+        if rPr is not None:
+            _merge(merged, rPr, _SKIPPED_RPR)
+        return merged
+
+    def _style_chain(self, style):
+        """
+        Generate *style* followed by the style it is based on, and so on, up
+        to the style at the root of its hierarchy.
+        """
+        seen = set()
+        while style is not None and style not in seen:
+            yield style
+            seen.add(style)
+            based_on = style.basedOn_val
+            style = None if based_on is None else self._style_index.get_by_id(based_on)
+
+    def _style_of_type(self, style_id, style_type):
+        """
+        Return the ``<w:style>`` element having *style_id* when it is of
+        *style_type*, and the default style of *style_type* otherwise.
+        """
+        if style_id is not None:
+            style = self._style_index.get_by_id(style_id)
+            if style is not None and style.type == style_type:
+                return style
+        return self._style_index.default_for(style_type)
+
+    def _style_pPr(self, style):
+        """
+        Return the ``<w:pPr>`` element holding the paragraph formatting
+        of the document defaults overlaid with that of *style* and the
+        styles it is based on.
+        """
+        key = None if style is None else style.styleId
+        pPr = self._style_pPrs.get(key)
+        if pPr is None:
+            pPr = deepcopy(self._default_properties[1])
+            for based_style in reversed(list(self._style_chain(style))):
+                if based_style.pPr is not None:
+                    _merge(pPr, based_style.pPr, _SKIPPED_PPR)
+            self._style_pPrs[key] = pPr
+        return pPr
+
+    def _style_rPr(self, style):
+        """
+        Return a ``<w:rPr>`` element holding the character formatting of
+        *style* and the styles it is based on, without document defaults.
+        """
+        key = None if style is None else style.styleId
+        rPr = self._style_rPrs.get(key)
+        if rPr is None:
+            rPr = OxmlElement('w:rPr')
+            for based_style in reversed(list(self._style_chain(style))):
+                if based_style.rPr is not None:
+                    _merge(rPr, based_style.rPr, _SKIPPED_RPR)
+            self._style_rPrs[key] = rPr
+        return rPr
+
+
+def _is_on(onoff):
+    val = onoff.get(qn('w:val'))
+    return val not in ('0', 'false', 'off')
+
+
+def _merge(target, source, skipped):
+    """
+    Overlay the property children of *source* onto *target*, skipping
+    children having a tag in *skipped*.
+    """
+    for child in source:
+        if child.tag in skipped or not isinstance(child.tag, str):
+            continue
+        _merge_child(target, child)
+
+
+def _merge_child(target, child):
+    """
+    Overlay a copy of property element *child* onto *target*, replacing
+    the same property inherited from further up the cascade.
+    """
+    inherited = target.find(child.tag)
+    if inherited is None:
+        target.append(deepcopy(child))
+    elif child.tag in _MERGED_ATTRIBUTES:
+        for name, value in child.attrib.items():
+            inherited.set(name, value)
+    else:
+        target.replace(inherited, deepcopy(child))
@@ -15,10 +15,12 @@ from ..text.font import Font
 from ..text.parfmt import ParagraphFormat
 
 
-def StyleFactory(style_elm):
+def StyleFactory(style_elm, parent=None):
     """
     Return a style object of the appropriate |BaseStyle| subclass, according
-    to the type of *style_elm*.
+    to the type of *style_elm*. *parent* is the styles part the style
+    belongs to, if known; the style index of that part is reset when the
+    style is renamed or deleted.
     """
     style_cls = {
         WD_STYLE_TYPE.PARAGRAPH: _ParagraphStyle,
@@ -27,7 +29,7 @@ def StyleFactory(style_elm):
         WD_STYLE_TYPE.LIST:      _NumberingStyle
     }[style_elm.type]
 
-    return style_cls(style_elm)
+    return style_cls(style_elm, parent)
 
 
 class BaseStyle(ElementProxy):
@@ -59,6 +61,7 @@ class BaseStyle(ElementProxy):
         """
         self._element.delete()
         self._element = None
+        self._style_index_changed()
 
     @property
     def hidden(self):
@@ -102,6 +105,7 @@ class BaseStyle(ElementProxy):
     @name.setter
     def name(self, value):
         self._element.name_val = value
+        self._style_index_changed()
 
     @property
     def priority(self):
@@ -141,6 +145,7 @@ class BaseStyle(ElementProxy):
     @style_id.setter
     def style_id(self, value):
         self._element.styleId = value
+        self._style_index_changed()
 
     @property
     def type(self):
@@ -167,6 +172,36 @@ class BaseStyle(ElementProxy):
     def unhide_when_used(self, value):
         self._element.unhideWhenUsed_val = value
 
+    def _style_elm_by_id(self, style_id):
+        """
+        Return the ``<w:style>`` element having *style_id* in the same
+        styles part as this style, or |None| if not found. Uses the style
+        index of the styles part when known.
+        """
+        style_index = getattr(self._parent, 'style_index', None)
+        if style_index is not None:
+            return style_index.get_by_id(style_id)
+        return self._element.getparent().get_by_id(style_id)
+
+    def _formatting_changed(self):
+        """
+        Discard the formatting resolved from the styles of the styles part,
+        if known, when the formatting of this style may change.
+        """
+        formatting_cascade = getattr(self._parent, 'formatting_cascade', None)
+        if formatting_cascade is not None:
+            formatting_cascade.reset()
+
+    def _style_index_changed(self):
+        """
+        Reset the style index of the styles part, if known, after this style
+        is renamed, re-keyed or deleted.
+        """
+        style_index = getattr(self._parent, 'style_index', None)
+        if style_index is not None:
+            style_index.reset()
+        self._formatting_changed()
+
 
 class _CharacterStyle(BaseStyle):
     """
@@ -183,15 +218,19 @@ class _CharacterStyle(BaseStyle):
         Style object this style inherits from or |None| if this style is
         not based on another style.
         """
-        base_style = self._element.base_style
+        basedOn_val = self._element.basedOn_val
+        if basedOn_val is None:
+            return None
+        base_style = self._style_elm_by_id(basedOn_val)
         if base_style is None:
             return None
-        return StyleFactory(base_style)
+        return StyleFactory(base_style, self._parent)
 
     @base_style.setter
     def base_style(self, style):
         style_id = style.style_id if style is not None else None
         self._element.basedOn_val = style_id
+        self._formatting_changed()
 
     @property
     def font(self):
@@ -199,7 +238,7 @@ class _CharacterStyle(BaseStyle):
         The |Font| object providing access to the character formatting
         properties for this style, such as font name and size.
         """
-        return Font(self._element)
+        return Font(self._element, self)
 
 
 class _ParagraphStyle(_CharacterStyle):
@@ -222,12 +261,15 @@ class _ParagraphStyle(_CharacterStyle):
         |None| or *self* removes the setting such that new paragraphs are
         created using this same style.
         """
-        next_style_elm = self._element.next_style
+        next_elm = self._element.next
+        if next_elm is None:
+            return self
+        next_style_elm = self._style_elm_by_id(next_elm.val)
         if next_style_elm is None:
             return self
         if next_style_elm.type != WD_STYLE_TYPE.PARAGRAPH:
             return self
-        return StyleFactory(next_style_elm)
+        return StyleFactory(next_style_elm, self._parent)
 
     @next_paragraph_style.setter
     def next_paragraph_style(self, style):
@@ -242,7 +284,7 @@ class _ParagraphStyle(_CharacterStyle):
         The |ParagraphFormat| object providing access to the paragraph
         formatting properties for this style such as indentation.
         """
-        return ParagraphFormat(self._element)
+        return ParagraphFormat(self._element, self)
 
 
 class _TableStyle(_ParagraphStyle):
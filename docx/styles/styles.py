@@ -26,10 +26,7 @@ class Styles(ElementProxy):
         Enables `in` operator on style name.
         """
         internal_name = BabelFish.ui2internal(name)
-        for style in self._element.style_lst:
-            if style.name_val == internal_name:
-                return True
-        return False
+        return self._lookup.get_by_name(internal_name) is not None
 
     def __getitem__(self, key):
         """
@@ -37,23 +34,23 @@ class Styles(ElementProxy):
         deprecated, triggers a warning, and will be removed in a near-future
         release.
         """
-        style_elm = self._element.get_by_name(BabelFish.ui2internal(key))
+        style_elm = self._lookup.get_by_name(BabelFish.ui2internal(key))
         if style_elm is not None:
-            return StyleFactory(style_elm)
+            return StyleFactory(style_elm, self._parent)
 
-        style_elm = self._element.get_by_id(key)
+        style_elm = self._lookup.get_by_id(key)
         if style_elm is not None:
             msg = (
                 'style lookup by style_id is deprecated. Use style name as '
                 'key instead.'
             )
             warn(msg, UserWarning, stacklevel=2)
-            return StyleFactory(style_elm)
+            return StyleFactory(style_elm, self._parent)
 
         raise KeyError("no style with name '%s'" % key)
 
     def __iter__(self):
-        return (StyleFactory(style) for style in self._element.style_lst)
+        return (StyleFactory(style, self._parent) for style in self._element.style_lst)
 
     def __len__(self):
         return len(self._element.style_lst)
@@ -70,17 +67,18 @@ class Styles(ElementProxy):
         style = self._element.add_style_of_type(
             style_name, style_type, builtin
         )
-        return StyleFactory(style)
+        _reset_style_index(self._parent)
+        return StyleFactory(style, self._parent)
 
     def default(self, style_type):
         """
         Return the default style for *style_type* or |None| if no default is
         defined for that type (not common).
         """
-        style = self._element.default_for(style_type)
+        style = self._lookup.default_for(style_type)
         if style is None:
             return None
-        return StyleFactory(style)
+        return StyleFactory(style, self._parent)
 
     def get_by_id(self, style_id, style_type):
         """Return the style of *style_type* matching *style_id*.
@@ -124,10 +122,22 @@ class Styles(ElementProxy):
         default for *style_type* if *style_id* is not found or if the style
         having *style_id* is not of *style_type*.
         """
-        style = self._element.get_by_id(style_id)
+        style = self._lookup.get_by_id(style_id)
         if style is None or style.type != style_type:
             return self.default(style_type)
-        return StyleFactory(style)
+        return StyleFactory(style, self._parent)
+
+    @property
+    def _lookup(self):
+        """
+        The |StyleIndex| of the styles part these styles belong to, or the
+        ``<w:styles>`` element itself, which provides the same lookup
+        methods by XPath, when there is no styles part.
+        """
+        style_index = getattr(self._parent, 'style_index', None)
+        if style_index is None:
+            return self._element
+        return style_index
 
     def _get_style_id_from_name(self, style_name, style_type):
         """
@@ -151,3 +161,112 @@ class Styles(ElementProxy):
         if style == self.default(style_type):
             return None
         return style.style_id
+
+
+class StyleIndex(object):
+    """
+    Index of the ``<w:style>`` children of *styles_elm* by style id and by
+    name, and of the default style of each style type. Provides the style
+    lookup methods of ``CT_Styles`` with a dictionary lookup in place of an
+    XPath query over all the styles.
+
+    The index is built on first use and rebuilt on first use after
+    :meth:`reset`, which is called when a style is added, deleted or
+    renamed through the |Styles| API. Changes made by editing the XML
+    directly are detected in part: a looked-up style found to have been
+    removed or re-keyed causes a rebuild, as does a change in the number of
+    children of *styles_elm*, such as a ``<w:style>`` element inserted or
+    removed. A style given a new id, name or default flag by editing its XML
+    is not found under the new key until :meth:`reset` is called.
+    """
+    def __init__(self, styles_elm):
+        super(StyleIndex, self).__init__()
+        self._styles_elm = styles_elm
+        self._by_id = None
+        self._by_name = None
+        self._default_for = None
+        self._child_count = None
+
+    def default_for(self, style_type):
+        """
+        Return the last ``<w:style>`` element of *style_type* marked as its
+        default, or |None| if there is none.
+        """
+        style = self._tables[2].get(style_type)
+        if style is not None and not (
+            self._is_current(style) and style.type == style_type and style.default
+        ):
+            self.reset()
+            style = self._tables[2].get(style_type)
+        return style
+
+    def get_by_id(self, styleId):
+        """
+        Return the first ``<w:style>`` element having *styleId*, or |None|
+        if not found.
+        """
+        style = self._tables[0].get(styleId)
+        if style is not None and not (
+            self._is_current(style) and style.styleId == styleId
+        ):
+            self.reset()
+            style = self._tables[0].get(styleId)
+        return style
+
+    def get_by_name(self, name):
+        """
+        Return the first ``<w:style>`` element having internal style name
+        *name*, or |None| if not found.
+        """
+        style = self._tables[1].get(name)
+        if style is not None and not (
+            self._is_current(style) and style.name_val == name
+        ):
+            self.reset()
+            style = self._tables[1].get(name)
+        return style
+
+    def reset(self):
+        """
+        Discard the index, causing it to be rebuilt on next use.
+        """
+        self._by_id = self._by_name = self._default_for = None
+
+    def _is_current(self, style):
+        return style.getparent() is self._styles_elm
+
+    @property
+    def _tables(self):
+        """
+        The ``(by_id, by_name, default_for)`` dictionaries, built in a single
+        pass over the styles when not yet built or when the number of
+        children of the styles element has changed since.
+        """
+        child_count = len(self._styles_elm)
+        if self._by_id is None or child_count != self._child_count:
+            self._child_count = child_count
+            by_id, by_name, default_for = {}, {}, {}
+            for style in self._styles_elm.style_lst:
+                style_id, name = style.styleId, style.name_val
+                if style_id is not None and style_id not in by_id:
+                    by_id[style_id] = style
+                if name is not None and name not in by_name:
+                    by_name[name] = style
+                if style.default:
+                    # ---spec calls for last default in document order---
+                    default_for[style.type] = style
+            self._by_id, self._by_name, self._default_for = by_id, by_name, default_for
+        return self._by_id, self._by_name, self._default_for
+
+
+def _reset_style_index(styles_part):
+    """
+    Reset the |StyleIndex| and |FormattingCascade| of *styles_part*, if
+    any, after a change to the style definitions.
+    """
+    style_index = getattr(styles_part, 'style_index', None)
+    if style_index is not None:
+        style_index.reset()
+    formatting_cascade = getattr(styles_part, 'formatting_cascade', None)
+    if formatting_cascade is not None:
+        formatting_cascade.reset()
@@ -19,6 +19,8 @@ class Table(Parented):
     def __init__(self, tbl, parent):
         super(Table, self).__init__(parent)
         self._element = self._tbl = tbl
+        self._cell_grid = None
+        self._cell_grid_cols = None
 
     def add_column(self, width):
         """
@@ -31,6 +33,7 @@ class Table(Parented):
         for tr in self._tbl.tr_lst:
             tc = tr.add_tc()
             tc.width = width
+        self._cell_grid = None
         return _Column(gridCol, self)
 
     def add_row(self):
@@ -42,6 +45,8 @@ class Table(Parented):
         for gridCol in tbl.tblGrid.gridCol_lst:
             tc = tr.add_tc()
             tc.width = gridCol.w
+        if self._cell_grid is not None:
+            self._cell_grid.extend(_Cell(tc, self) for tc in tr.tc_lst)
         return _Row(tr, self)
 
     @property
@@ -79,9 +84,20 @@ class Table(Parented):
         """
         Return |_Cell| instance correponding to table cell at *row_idx*,
         *col_idx* intersection, where (0, 0) is the top, left-most cell.
-        """
-        cell_idx = col_idx + (row_idx * self._column_count)
-        return self._cells[cell_idx]
+        Cells are looked up in a grid index built on first use, which is
+        rebuilt when the cell found no longer belongs to this table.
+        """
+        if self._cell_grid is not None:
+            try:
+                cell = self._cell_grid[col_idx + row_idx * self._cell_grid_cols]
+            except IndexError:
+                cell = None
+            if cell is not None and cell._tc.getparent() is not None and (
+                cell._tc.getparent().getparent() is self._tbl
+            ):
+                return cell
+            self._cell_grid = None
+        return self._cells[col_idx + row_idx * self._cell_grid_cols]
 
     def column_cells(self, column_idx):
         """
@@ -91,6 +107,28 @@ class Table(Parented):
         idxs = range(column_idx, len(cells), self._column_count)
         return [cells[idx] for idx in idxs]
 
+    def iter_rows_values(self):
+        """
+        Generate a tuple of the text of each cell in each row of this table,
+        top to bottom, as :attr:`_Cell.text` would report it. A cell
+        spanning several grid columns or rows reports its text at each
+        position it covers, as :meth:`row_cells` does. The text is read
+        directly from the XML without creating cell or paragraph objects.
+        """
+        col_count = self._column_count
+        values, previous = [], ()
+        for tr in self._tbl.tr_lst:
+            for tc in tr.tc_lst:
+                if tc.vMerge == ST_Merge.CONTINUE:
+                    idx = len(values)
+                    text = previous[idx] if idx < len(previous) else ''
+                else:
+                    text = '\n'.join([p.text for p in tc.p_lst])
+                values.extend([text] * tc.grid_span)
+            previous = tuple(values[:col_count])
+            yield previous
+            values = []
+
     @lazyproperty
     def columns(self):
         """
@@ -166,9 +204,19 @@ class Table(Parented):
         """
         A sequence of |_Cell| objects, one for each cell of the layout grid.
         If the table contains a span, one or more |_Cell| object references
-        are repeated.
+        are repeated. The sequence is kept as the grid index of this table
+        until the layout is changed through this object.
         """
-        col_count = self._column_count
+        if self._cell_grid is None:
+            self._cell_grid = self._build_cell_grid()
+        return self._cell_grid
+
+    def _build_cell_grid(self):
+        """
+        Return a new list of the |_Cell| object for each position of the
+        layout grid, left to right and top to bottom.
+        """
+        col_count = self._cell_grid_cols = self._column_count
         cells = []
         for tc in self._tbl.iter_tcs():
             for grid_span_idx in range(tc.grid_span):
@@ -180,6 +228,12 @@ class Table(Parented):
                     cells.append(_Cell(tc, self))
         return cells
 
+    def _layout_changed(self):
+        """
+        Discard the grid index after cells are merged or split.
+        """
+        self._cell_grid = None
+
     @property
     def _column_count(self):
         """
@@ -225,6 +279,18 @@ class _Cell(BlockItemContainer):
         self.add_paragraph()
         return table
 
+    def add_table_from_data(self, data, style=None):
+        """
+        Return a table newly added to this cell after any existing cell
+        content, having a row for each sequence of cell values in *data*, as
+        for :meth:`BlockItemContainer.add_table_from_data`. An empty
+        paragraph is added after the table, as for :meth:`add_table`.
+        """
+        width = self.width if self.width is not None else Inches(1)
+        table = super(_Cell, self).add_table_from_data(data, width, style)
+        self.add_paragraph()
+        return table
+
     def merge(self, other_cell):
         """
         Return a merged cell created by spanning the rectangular region
@@ -233,6 +299,7 @@ class _Cell(BlockItemContainer):
         """
         tc, tc_2 = self._tc, other_cell._tc
         merged_tc = tc.merge(tc_2)
+        self._parent._layout_changed()
         return _Cell(merged_tc, self._parent)
 
     @property
@@ -258,7 +325,7 @@ class _Cell(BlockItemContainer):
         a string to this property replaces all existing content with a single
         paragraph containing the assigned text in a single run.
         """
-        return '\n'.join(p.text for p in self.paragraphs)
+        return '\n'.join([p.text for p in self._tc.p_lst])
 
     @text.setter
     def text(self, text):
@@ -9,10 +9,10 @@ from __future__ import (
 )
 
 from ..dml.color import ColorFormat
-from ..shared import ElementProxy
+from ..shared import FormatProxy
 
 
-class Font(ElementProxy):
+class Font(FormatProxy):
     """
     Proxy object wrapping the parent of a ``<w:rPr>`` element and providing
     access to character properties such as font name, font size, bold, and
@@ -49,7 +49,7 @@ class Font(ElementProxy):
         A |ColorFormat| object providing a way to get and set the text color
         for this font.
         """
-        return ColorFormat(self._element)
+        return ColorFormat(self._element, self._parent)
 
     @property
     def complex_script(self):
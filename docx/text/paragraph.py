@@ -9,7 +9,10 @@ from __future__ import (
 )
 
 from ..enum.style import WD_STYLE_TYPE
+from ..oxml import OxmlElement
+from ..oxml.ns import qn
 from .parfmt import ParagraphFormat
+from .comment import Comment
 from .run import Run
 from ..shared import Parented
 
@@ -17,9 +20,14 @@ from ..shared import Parented
 from docx.text.insert import Insert
 from docx.text.delete import Delete
 
+from bisect import bisect_left, bisect_right
+from copy import deepcopy
 from datetime import datetime
 import re
 
+_HEADING_NAME = re.compile(r'.*Heading (\d+)$')
+
+
 class Paragraph(Parented):
     """
     Proxy object wrapping ``<w:p>`` element.
@@ -27,6 +35,7 @@ class Paragraph(Parented):
     def __init__(self, p, parent):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
+        self._offsets = None
 
     def add_run(self, text=None, style=None):
         """
@@ -40,9 +49,10 @@ class Paragraph(Parented):
         r = self._p.add_r()
         run = Run(r, self)
         if text:
-            run.text = text
+            r.text = text
         if style:
             run.style = style
+        self._text_changed()
         return run
     
     def delete(self):
@@ -51,261 +61,288 @@ class Paragraph(Parented):
         """
         self._p.getparent().remove(self._p)
         self._p = self._element = None
+        self._reset_run_offsets()
+        text_index = self._container_text_index
+        if text_index is not None:
+            text_index._paragraphs_changed()
     
     def add_comment(self, text, author='python-docx', initials='pd', dtime=None ,rangeStart=0, rangeEnd=0, comment_part=None):
+        """
+        Return a ``<w:comment>`` element newly added to *comment_part*, the
+        comments part of this document when |None|, having *text* and
+        referenced from a new run at the end of this paragraph.
+        *comment_part* can also be the ``<w:comments>`` element of that
+        part, which is replaced by the part so the comment id is allocated
+        the same way. Raises |ValueError| for any other ``<w:comments>``
+        element, whose ids are not tracked by this document.
+        """
         if comment_part is None:
-            comment_part = self.part._comments_part.element
+            comment_part = self.part._comments_part
+        elif getattr(comment_part, 'tag', None) == qn('w:comments'):
+            comments_part = self.part._comments_part
+            if comment_part is not comments_part.element:
+                raise ValueError(
+                    'comment_part must be the comments part of this document'
+                )
+            comment_part = comments_part
         if dtime is None:
             dtime = str( datetime.now() ).replace(' ', 'T')
         comment =  self._p.add_comm(author, comment_part, initials, dtime, text, rangeStart, rangeEnd)
+        self._reset_run_offsets()
 
         return comment
     
     def get_matched_run_info(self , query_text):
-
-        run_text_ranges = []
-        text_counter = 0
-        for run in self.runs:
-            run_text_ranges.append([text_counter,len(run.text)+ text_counter])
-            text_counter += len(run.text)
-
-        query_text_range = [self.text.index(query_text)
-                            ,self.text.index(query_text)+len(query_text)] 
-
-        begin_run_idx = -1
-        begin_run_offset = 0
-        end_run_idx = -1
-        end_run_offset = 0
-        for idx, run_text_range in enumerate(run_text_ranges):
-            if run_text_range[0] <= query_text_range[0] and run_text_range[1] > query_text_range[0]:
-                begin_run_idx = idx
-                begin_run_offset = query_text_range[0] - run_text_range[0]
-            if run_text_range[0] < query_text_range[1] and run_text_range[1] >= query_text_range[1]:
-                end_run_idx = idx
-                end_run_offset = query_text_range[1] - run_text_range[0]
-                continue
-        if begin_run_idx == -1 or end_run_idx == -1:
-            raise ValueError('query text not found in paragraph')
-        return begin_run_idx, begin_run_offset, end_run_idx, end_run_offset
+        """
+        Return a ``(begin_run_idx, begin_run_offset, end_run_idx,
+        end_run_offset)`` 4-tuple locating the first occurrence of
+        *query_text* in the runs of this paragraph. Raises |ValueError| if
+        *query_text* does not appear in the paragraph text.
+        """
+        start = self._run_offsets.text.index(query_text)
+        return self._get_range_run_info(start, start + len(query_text))
 
     def add_comment_by_text(self, text, author='Wayen', initials='W', dtime=None,query_text="WenShuTech Comment TEST"):
         begin_run_idx, begin_run_offset, end_run_idx, end_run_offset \
                 = self.get_matched_run_info(query_text)
-        new_run = self.reconstruct_paragraph(query_text, begin_run_idx, begin_run_offset, end_run_idx, end_run_offset)
-        comment = new_run.add_comment(text, author, initials, dtime)
-
-        return comment
+        first_idx, last_idx = self._isolate_run_range(
+            begin_run_idx, begin_run_offset, end_run_idx, end_run_offset
+        )
+        return self._add_comment_to_runs(first_idx, last_idx, text, author, initials, dtime)
 
     def add_comment_by_range(self, text, author='Wayen', initials='W', dtime=None ,rangeStart=0, rangeEnd=0):
-        paragraph_text = self.text
         if dtime is None:
             dtime = str( datetime.now() ).replace(' ', 'T')
 
         if rangeStart == rangeEnd:
             raise ValueError('rangeStart and rangeEnd can not be equal')
 
-        qury_text = paragraph_text[rangeStart:rangeEnd]
+        qury_text = self._run_offsets.text[rangeStart:rangeEnd]
         begin_run_idx, begin_run_offset, end_run_idx, end_run_offset \
-                = self.get_matched_run_info(qury_text)
-        new_run = self.reconstruct_paragraph(qury_text, begin_run_idx, begin_run_offset, end_run_idx, end_run_offset)
-        comment = new_run.add_comment(text, author, initials, dtime)
-
-        return comment
+                = self._get_range_run_info(rangeStart, rangeEnd)
+        first_idx, last_idx = self._isolate_run_range(
+            begin_run_idx, begin_run_offset, end_run_idx, end_run_offset
+        )
+        return self._add_comment_to_runs(first_idx, last_idx, text, author, initials, dtime)
        
     def add_insert_by_range(self, text, author='Wayen', initials='W', dtime=None ,ins_index = 0):
-        paragraph_text = self.text
-
-        # get run text ranges, e.g. [[0,3],[3,6],[6,9]]
-        run_text_ranges = []
-        text_counter = 0
-        for run in self.runs:
-            run_text_ranges.append([text_counter,len(run.text)+ text_counter])
-            text_counter += len(run.text)
-        
+        """
+        Return an |Insert| object for a new ``<w:ins>`` revision containing
+        *text*, placed at character offset *ins_index* of the paragraph
+        text. A run containing *ins_index* is split in two and the inserted
+        text takes on the formatting of the run it is inserted after.
+        """
+        offsets = self._run_offsets
         if dtime is None:
             dtime = str( datetime.now() ).replace(' ', 'T')
 
-        if ins_index < 0 or ins_index > len(paragraph_text):
+        if ins_index < 0 or ins_index > len(offsets):
             raise ValueError('ins_index should be in range of paragraph')
 
-        print('run_text_ranges',run_text_ranges)
-        # if ins_index not in the middle of a run, then insert a new run
+        nins = self._p._new_ins()
+        nins._id = self.part.next_revision_id()
+        nins.author = author
+        nins.date = dtime
+        nr = nins.add_r(text)
+        New_Insert = Insert(nins,self._p)
+
+        # if ins_index is not at a run boundary, split the run containing it
         if ins_index == 0:
-            nins = self._p._new_ins()
-            nins._id = 1
-            nins.author = author
-            nins.date = dtime
-            nins.add_r(text)
-            New_Insert = Insert(nins,self._p)
-            self._p.insert(0,nins)
-        elif ins_index in [run_text_range[1] for run_text_range in run_text_ranges]:
-            run_idx = [run_text_range[1] 
-                       for run_text_range in run_text_ranges].index(ins_index)
-            run = self.runs[run_idx]
-            nins = self._p._new_ins()
-            nins._id = 1
-            nins.author = author
-            nins.date = dtime
-            nins.add_r(text)
-            New_Insert = Insert(nins,self._p)
-            run._r.addnext(nins)
-        # if ins_index in the middle of a run, then split the run
+            pPr = self._p.pPr
+            if pPr is None:
+                self._p.insert(0, nins)
+            else:
+                pPr.addnext(nins)
+            return New_Insert
+        run_idx, run_offset = offsets.run_ending_at(ins_index)
+        anchor_Run = offsets.runs[run_idx]
+        if run_offset < len(anchor_Run.text):
+            self._split_run(run_idx, run_offset)
+        _copy_rPr(anchor_Run._r, nr)
+        anchor_Run._r.addnext(nins)
+        return New_Insert
+
+    def apply_annotations(self, annotations, author='Wayen', initials='W', dtime=None):
+        """
+        Apply each of *annotations* to this paragraph in a single pass and
+        return a list of the objects created, in the order given. Each
+        annotation is a ``(start, end, kind, payload)`` 4-tuple where
+        *start* and *end* are character offsets into the paragraph text as
+        it is before any of the annotations are applied, so they can be
+        given in any order. *kind* is one of:
+
+        ``'comment'``
+            A comment having text *payload* anchored to the text between
+            *start* and *end*. The new ``<w:comment>`` element is returned.
+        ``'insert'``
+            An ``<w:ins>`` revision of text *payload* at *start*, which
+            must equal *end*. An |Insert| object is returned.
+        ``'delete'``
+            An ``<w:del>`` revision removing the text between *start* and
+            *end*; *payload* is ignored. A |Delete| object is returned.
+            Deleted ranges may not overlap each other or contain an
+            insertion point. Comment markers and comment reference runs
+            in a deleted range are kept out of the deletion, which is
+            split around them into several ``<w:del>`` elements; the
+            |Delete| object is for the first of these.
+
+        All required run splits are made in one pass over the runs.
+        """
+        offsets = self._run_offsets
+        text_len = len(offsets)
+        if dtime is None:
+            dtime = str( datetime.now() ).replace(' ', 'T')
+
+        for start, end, kind, payload in annotations:
+            if kind not in ('comment', 'insert', 'delete'):
+                raise ValueError('unsupported annotation kind %r' % kind)
+            if not 0 <= start <= end <= text_len:
+                raise ValueError('annotation range out of range of paragraph')
+            if (kind == 'insert') != (start == end):
+                raise ValueError(
+                    'insert annotations require start == end, others start < end'
+                )
+        deletes = sorted(
+            (start, end) for start, end, kind, _ in annotations if kind == 'delete'
+        )
+        for (_, prev_end), (start, _) in zip(deletes, deletes[1:]):
+            if start < prev_end:
+                raise ValueError('deleted ranges can not overlap')
+        for start, _, kind, _ in annotations:
+            if kind == 'insert':
+                idx = bisect_left(deletes, (start,))
+                if idx and deletes[idx - 1][1] > start:
+                    raise ValueError('can not insert inside a deleted range')
+
+        self._split_runs_at(sorted(set(
+            offset for start, end, _, _ in annotations for offset in (start, end)
+            if 0 < offset < text_len
+        )))
+
+        # ---collect markers at each offset: range ends (each followed by its
+        # ---comment reference), then insertions, then range starts
+        results = [None] * len(annotations)
+        ends, inserts, starts = {}, {}, {}
+        order = sorted(
+            range(len(annotations)),
+            key=lambda i: (annotations[i][0], -annotations[i][1])
+        )
+        comment_part = None
+        for i in order:
+            start, end, kind, payload = annotations[i]
+            if kind == 'comment':
+                if comment_part is None:
+                    comment_part = self.part._comments_part
+                comment = comment_part.add_comment(author, initials, dtime)
+                comment._add_p(payload)
+                ref_r = self._p._new_r()
+                ref_r.add_comment_reference(comment._id)
+                rStart = OxmlElement('w:commentRangeStart')
+                rStart._id = comment._id
+                rEnd = OxmlElement('w:commentRangeEnd')
+                rEnd._id = comment._id
+                starts.setdefault(start, []).append(rStart)
+                ends.setdefault(end, [])[:0] = [rEnd, ref_r]
+                results[i] = comment
+            elif kind == 'insert':
+                nins = self._p._new_ins()
+                nins._id = self.part.next_revision_id()
+                nins.author = author
+                nins.date = dtime
+                nr = nins.add_r(payload)
+                if start > 0:
+                    run_idx, _ = offsets.run_ending_at(start)
+                    _copy_rPr(offsets.runs[run_idx]._r, nr)
+                inserts.setdefault(start, []).append(nins)
+                results[i] = Insert(nins, self._p)
+
+        runs, run_starts = offsets.runs, offsets.starts
+        for offset in sorted(set(ends) | set(inserts) | set(starts)):
+            markers = ends.get(offset, []) + inserts.get(offset, []) + starts.get(offset, [])
+            run_idx = bisect_left(run_starts, offset, 0, len(runs))
+            if run_idx < len(runs):
+                anchor = runs[run_idx]._r
+                for marker in markers:
+                    anchor.addprevious(marker)
+            elif runs:
+                anchor = runs[-1]._r
+                for marker in reversed(markers):
+                    anchor.addnext(marker)
+            else:
+                for marker in markers:
+                    self._p.append(marker)
+
+        for i, (start, end, kind, _) in enumerate(annotations):
+            if kind != 'delete':
+                continue
+            first = runs[bisect_left(run_starts, start, 0, len(runs))]._r
+            last = runs[bisect_left(run_starts, end, 0, len(runs)) - 1]._r
+            # ---only runs are deleted; markers and comment reference runs
+            #    stay outside, splitting the deletion around them---
+            dels, ndel = [], None
+            child, sibling = None, first
+            while child is not last:
+                child, sibling = sibling, sibling.getnext()
+                if child.tag != qn('w:r') or child.find(qn('w:commentReference')) is not None:
+                    ndel = None
+                    continue
+                if ndel is None:
+                    ndel = self._p._new_dele()
+                    ndel._id = self.part.next_revision_id()
+                    ndel.author = author
+                    ndel.date = dtime
+                    child.addprevious(ndel)
+                    dels.append(ndel)
+                ndel.append(child)
+                child.convert_t_to_dele_t()
+            results[i] = Delete(dels[0], self._p)
+
+        if deletes:
+            self._text_changed()
         else:
-            for idx, run_text_range in enumerate(run_text_ranges):
-                if run_text_range[0] <= ins_index and run_text_range[1] > ins_index:
-                    run_idx = idx
-                    run_offset = ins_index - run_text_range[0]
-                    break
-            # split run
-            anchor_Run = self.runs[run_idx]
-            nrun = self._p._new_r()
-            nrun.text = anchor_Run.text[run_offset:]
-            anchor_Run.text = anchor_Run.text[:run_offset]
-            New_Run = Run(nrun,self._p)
-            nins = self._p._new_ins()
-            nins._id = 1
-            nins.author = author
-            nins.date = dtime
-            nins.add_r(text)
-            New_Insert = Insert(nins,self._p)
-            anchor_Run._r.addnext(nins)
-            nins.addnext(nrun)
-
-            # alian font
-            New_Run.bold = anchor_Run.bold
-            New_Run.italic = anchor_Run.italic
-            New_Run.underline = anchor_Run.underline
-            New_Run.font.name = anchor_Run.font.name
-            New_Run.font.size = anchor_Run.font.size
-            New_Run.font.color.rgb = anchor_Run.font.color.rgb
-
-            New_Insert.bold = anchor_Run.bold
-            New_Insert.italic = anchor_Run.italic
-            New_Insert.underline = anchor_Run.underline
-            New_Insert.font.name = anchor_Run.font.name
-            New_Insert.font.size = anchor_Run.font.size
-            New_Insert.font.color.rgb = anchor_Run.font.color.rgb
+            self._reset_run_offsets()
+        return results
 
     def add_cross_paragraph_comment_start_by_textidx(self, author, initials, dtime, comment_text, text_idx):
-        run_text_ranges = []
-        text_counter = 0
-        comment_part = self.part._comments_part._element
-        for run in self.runs:
-            run_text_ranges.append([text_counter,len(run.text)+ text_counter])
-            text_counter += len(run.text)
-        # split run by text_idx
-        for idx , run_text_range in enumerate(run_text_ranges):
-            if text_idx >= run_text_range[0] and text_idx < run_text_range[1]:
-                run_idx = idx
-                break
-        run = self.runs[run_idx]
-        run_text = run.text
-        run_text_idx = text_idx - run_text_range[0]
-        run_text_splited = [run_text[:run_text_idx],run_text[run_text_idx:]]
-        run.text = run_text_splited[0]
-        nrun = self._element._new_r()
-        run._r.addnext(nrun)
-        nrun.text = run_text_splited[1]
+        comment_part = self.part._comments_part
+        run = self._run_starting_at(text_idx)
 
         comment = comment_part.add_comment(author, initials, dtime)
         comment._add_p(comment_text)
         _r = self._element.add_r()
         _r.add_comment_reference(comment._id)
-        self._p.push_overflow_comment(comment._id, rangeStart= run_idx+2)   
+        self._run_offsets.insert_run(len(self._run_offsets.runs), Run(_r, self))
+        rangeStart = len(self._p) - 1 if run is None else self._p.index(run._r)
+        self._p.push_overflow_comment(comment._id, rangeStart=rangeStart)
         return comment ,comment._id
 
     def add_cross_paragraph_comment_end_by_textidx(self,comment_id,text_idx):
-        run_text_ranges = []
-        text_counter = 0
-        for run in self.runs:
-            run_text_ranges.append([text_counter,len(run.text)+ text_counter])
-            text_counter += len(run.text)
-        # split run by text_idx
-        for idx , run_text_range in enumerate(run_text_ranges):
-            if text_idx >= run_text_range[0] and text_idx < run_text_range[1]:
-                run_idx = idx
-                break
-        run = self.runs[run_idx]
-        run_text = run.text
-        run_text_idx = text_idx - run_text_range[0]
-        run_text_splited = [run_text[:run_text_idx],run_text[run_text_idx:]]
-        run.text = run_text_splited[0]
-        nrun = self._element._new_r()
-        run._r.addnext(nrun)
-        nrun.text = run_text_splited[1]
-
-        self._p.pull_overflow_comment(comment_id, rangeEnd= run_idx+1)   
+        run = self._run_starting_at(text_idx)
+        rangeEnd = 0 if run is None else self._p.index(run._r)
+        self._p.pull_overflow_comment(comment_id, rangeEnd=rangeEnd)
         return comment_id
-        
-
-
-
 
-
-
-        
-        
     def reconstruct_paragraph(self ,query_text, begin_run_idx, begin_run_offset, end_run_idx, end_run_offset):
-        if begin_run_idx == end_run_idx:
-            runs = self.runs
-            original_text = runs[begin_run_idx].text
-            anchor_run = runs[begin_run_idx]
-            nrun_middle= self._element._new_r()
-            nrun_end = self._element._new_r()
-            new_run_middle = Run(nrun_middle, anchor_run._parent)
-            new_run_end = Run(nrun_end, anchor_run._parent)
-            anchor_run._element.addnext(nrun_middle)
-            new_run_middle._element.addnext(nrun_end)
-            if end_run_idx + 1 < len(runs) :
-                print('add next')
-                new_run_end._element.addnext(runs[end_run_idx + 1]._element)
-
-            anchor_run.text = anchor_run.text[:begin_run_offset]
-            new_run_middle.text =  query_text
-            new_run_end.text = original_text[end_run_offset:]
-
-            # alian font
-            new_run_middle.bold = anchor_run.bold
-            new_run_middle.italic = anchor_run.italic
-            new_run_middle.underline = anchor_run.underline
-            new_run_middle.font.name = anchor_run.font.name
-            new_run_middle.font.size = anchor_run.font.size
-            new_run_middle.font.color.rgb = anchor_run.font.color.rgb
-
-            new_run_end.bold = anchor_run.bold
-            new_run_end.italic = anchor_run.italic
-            new_run_end.underline = anchor_run.underline
-            new_run_end.font.name = anchor_run.font.name
-            new_run_end.font.size = anchor_run.font.size
-            new_run_end.font.color.rgb = anchor_run.font.color.rgb
-
-            return new_run_middle
-
-        elif begin_run_idx < end_run_idx:
-
-            runs = self.runs
-            anchor_run = runs[begin_run_idx]
-            nrun= self._element._new_r()
-            new_run = Run(nrun, anchor_run._parent)
-            runs[begin_run_idx]._element.addnext(nrun)
-            new_run._element.addnext(runs[end_run_idx]._element)
-            new_run.text =  query_text
-            runs[begin_run_idx].text = runs[begin_run_idx].text[:begin_run_offset]
-            runs[end_run_idx].text = runs[end_run_idx].text[end_run_offset:]
-            
-            # alian font
-            new_run.bold = anchor_run.bold
-            new_run.italic = anchor_run.italic
-            new_run.underline = anchor_run.underline
-            new_run.font.name = anchor_run.font.name
-            new_run.font.size = anchor_run.font.size
-            new_run.font.color.rgb = anchor_run.font.color.rgb
-
-            return new_run  
-    
+        """
+        Return a |Run| spanning exactly the text located by *begin_run_idx*,
+        *begin_run_offset*, *end_run_idx* and *end_run_offset*, as returned
+        by :meth:`get_matched_run_info`. Runs are split at both ends of the
+        range as required and runs wholly inside the range are merged into
+        the returned run, which takes the formatting of the first of them.
+        Runs are merged only when they are adjacent and hold nothing but
+        text; otherwise, such as when a picture or a footnote reference lies
+        in the range, they are left in place and the first of them is
+        returned.
+        """
+        first_idx, last_idx = self._isolate_run_range(
+            begin_run_idx, begin_run_offset, end_run_idx, end_run_offset
+        )
+        return self._run_offsets.runs[first_idx]
+
     def add_footnote(self, text):
-        footnotes_part = self.part._footnotes_part.element
+        footnotes_part = self.part._footnotes_part
         footnote = self._p.add_fn(text, footnotes_part)
+        self._reset_run_offsets()
 
         return footnote
 
@@ -317,6 +354,7 @@ class Paragraph(Parented):
         self.add_run(' ')
         for run in runs:
             self._p.append(run._r)
+        self._text_changed()
             
     
     @property
@@ -340,6 +378,7 @@ class Paragraph(Parented):
         Paragraph-level formatting, such as style, is preserved.
         """
         self._p.clear_content()
+        self._text_changed()
         return self
 
     def insert_paragraph_before(self, text=None, style=None):
@@ -356,6 +395,18 @@ class Paragraph(Parented):
             paragraph.style = style
         return paragraph
 
+    def normalize_runs(self):
+        """
+        Merge adjacent runs having the same character formatting into one
+        run, after removing the proofing-error markers and revision save ids
+        Word scatters through a paragraph. Runs holding anything but text,
+        tabs and breaks are left as they are. The text of the paragraph is
+        unchanged. Return the number of runs merged away.
+        """
+        merged = self._p.normalize_runs()
+        self._text_changed()
+        return merged
+
     @property
     def paragraph_format(self):
         """
@@ -364,6 +415,20 @@ class Paragraph(Parented):
         """
         return ParagraphFormat(self._element)
 
+    @property
+    def effective_paragraph_format(self):
+        """
+        A read-only |ParagraphFormat| object reporting the paragraph
+        formatting in effect for this paragraph, resolved from its direct
+        formatting, its style and the styles that style is based on, and
+        the document defaults. The object is a snapshot over a copy of the
+        resolved formatting, so it does not reflect later changes to this
+        paragraph, and changing it affects neither this paragraph nor any
+        other.
+        """
+        formatting_cascade = self.part.formatting_cascade
+        return ParagraphFormat(deepcopy(formatting_cascade.paragraph_properties(self._p)))
+
     @property
     def runs(self):
         """
@@ -409,10 +474,7 @@ class Paragraph(Parented):
         Paragraph-level formatting, such as style, is preserved. All
         run-level formatting, such as bold or italic, is removed.
         """
-        text = ''
-        for run in self.runs:
-            text += run.text
-        return text
+        return self._p.text
 
     @property
     def header_level(self):
@@ -420,11 +482,9 @@ class Paragraph(Parented):
         input Paragraph Object
         output Paragraph level in case of header or returns None
         '''
-        headerPattern = re.compile(".*Heading (\d+)$")
-        level = 0
-        if headerPattern.match(self.style.name):
-            level = int(self.style.name.lower().split('heading')[-1].strip())
-        return level
+        name = self.style.name
+        match = _HEADING_NAME.match(name) if name else None
+        return int(match.group(1)) if match else 0
     
     @property
     def NumId(self):
@@ -464,7 +524,7 @@ class Paragraph(Parented):
     
     @property
     def full_text(self):
-        return u"".join([r.text for r in self.all_runs])
+        return self._p.full_text
     
     @property
     def footnotes(self):
@@ -475,18 +535,270 @@ class Paragraph(Parented):
 
     @property
     def comments(self):
-        runs_comments = [run.comments for run in self.runs]
-        return [comment for comments in runs_comments for comment in comments]
+        """
+        List of |Comment| objects for the comments referenced from the runs
+        of this paragraph, in reference order.
+        """
+        comments_part = self.part._comments_part
+        ids = self._p.xpath('./w:r/w:commentReference/@w:id')
+        coms = [comments_part.get_comment_by_id(int(_id)) for _id in ids]
+        return [Comment(com, comments_part.element) for com in coms if com is not None]
 
     @text.setter
     def text(self, text):
         self.clear()
         self.add_run(text)
 
+    @property
+    def _container_text_index(self):
+        """
+        The |DocumentTextIndex| of the block item container holding this
+        paragraph, or |None| if it has not been created.
+        """
+        return getattr(self._parent, '_text_index', None)
+
+    def _add_comment_to_runs(self, first_idx, last_idx, text, author, initials, dtime):
+        """
+        Return a new comment having *text*, anchored to the runs from
+        *first_idx* to *last_idx* inclusive. A single run gets the comment
+        as by :meth:`.Run.add_comment`; a range of runs is enclosed in the
+        comment range markers, followed by a run holding the comment
+        reference.
+        """
+        runs = self._run_offsets.runs
+        if first_idx == last_idx:
+            return runs[first_idx].add_comment(text, author, initials, dtime)
+        if dtime is None:
+            dtime = str( datetime.now() ).replace(' ', 'T')
+        comment = self.part._comments_part.add_comment(author, initials, dtime)
+        comment._add_p(text)
+        rStart = OxmlElement('w:commentRangeStart')
+        rStart._id = comment._id
+        rEnd = OxmlElement('w:commentRangeEnd')
+        rEnd._id = comment._id
+        ref_r = self._p._new_r()
+        ref_r.add_comment_reference(comment._id)
+        runs[first_idx]._r.addprevious(rStart)
+        last_r = runs[last_idx]._r
+        last_r.addnext(rEnd)
+        rEnd.addnext(ref_r)
+        self._reset_run_offsets()
+        return comment
+
+    def _get_range_run_info(self, start, end):
+        """
+        Return a ``(begin_run_idx, begin_run_offset, end_run_idx,
+        end_run_offset)`` 4-tuple locating the text between character
+        offsets *start* and *end* of this paragraph.
+        """
+        offsets = self._run_offsets
+        if not 0 <= start < end <= len(offsets):
+            raise ValueError('query text not found in paragraph')
+        begin_run_idx, begin_run_offset = offsets.run_at(start)
+        end_run_idx, end_run_offset = offsets.run_ending_at(end)
+        return begin_run_idx, begin_run_offset, end_run_idx, end_run_offset
+
     def _insert_paragraph_before(self):
         """
         Return a newly created paragraph, inserted directly before this
         paragraph.
         """
         p = self._p.add_p_before()
+        text_index = self._container_text_index
+        if text_index is not None:
+            text_index._paragraphs_changed()
         return Paragraph(p, self._parent)
+
+    def _isolate_run_range(self, begin_run_idx, begin_run_offset, end_run_idx, end_run_offset):
+        """
+        Split runs so the range located by *begin_run_idx*,
+        *begin_run_offset*, *end_run_idx* and *end_run_offset* begins and
+        ends on run boundaries, merge the runs in it into one when they are
+        adjacent and hold nothing but text, and return the ``(first_idx,
+        last_idx)`` indices of the runs now spanning it.
+        """
+        from ..oxml.text.paragraph import _merge_key, _merge_runs
+        offsets = self._run_offsets
+        if end_run_offset < len(offsets.runs[end_run_idx].text):
+            self._split_run(end_run_idx, end_run_offset)
+        if begin_run_offset > 0:
+            self._split_run(begin_run_idx, begin_run_offset)
+            begin_run_idx += 1
+            end_run_idx += 1
+        if end_run_idx == begin_run_idx:
+            return begin_run_idx, end_run_idx
+        rs = [run._r for run in offsets.runs[begin_run_idx:end_run_idx + 1]]
+        mergeable = all(
+            _merge_key(r) is not None and (r is rs[-1] or r.getnext() is rs[i + 1])
+            for i, r in enumerate(rs)
+        )
+        if not mergeable:
+            return begin_run_idx, end_run_idx
+        _merge_runs(self._p, rs)
+        offsets.merge_runs(begin_run_idx, end_run_idx)
+        return begin_run_idx, begin_run_idx
+
+    def _reset_run_offsets(self):
+        """
+        Discard the cached run offset index, causing it to be rebuilt from
+        the XML on next use.
+        """
+        self._offsets = None
+
+    def _text_changed(self):
+        """
+        Discard cached offsets after the text of this paragraph changes,
+        including those of any |DocumentTextIndex| it belongs to.
+        """
+        self._offsets = None
+        text_index = self._container_text_index
+        if text_index is not None:
+            text_index._paragraph_text_changed(self)
+
+    def _run_starting_at(self, text_idx):
+        """
+        Return the |Run| whose text starts at character offset *text_idx* of
+        this paragraph, splitting the run containing *text_idx* if required.
+        Returns |None| when *text_idx* is the end of the paragraph text.
+        """
+        offsets = self._run_offsets
+        if text_idx == len(offsets):
+            return None
+        run_idx, run_offset = offsets.run_at(text_idx)
+        if run_offset == 0:
+            return offsets.runs[run_idx]
+        return self._split_run(run_idx, run_offset)
+
+    @property
+    def _run_offsets(self):
+        """
+        |_RunOffsets| index of the runs in this paragraph, built on first
+        use and kept up to date by the range-based editing methods.
+        """
+        if self._offsets is None:
+            self._offsets = _RunOffsets([Run(r, self) for r in self._p.r_lst])
+        return self._offsets
+
+    def _split_runs_at(self, text_idxs):
+        """
+        Split runs in a single pass such that each character offset in
+        sorted sequence *text_idxs* falls on a run boundary. Each new run has
+        the same formatting as the run it was split from.
+        """
+        offsets = self._run_offsets
+        text_idxs = list(text_idxs)
+        runs, starts = [], []
+        idx = 0
+        for run, start, end in zip(offsets.runs, offsets.starts, offsets.starts[1:]):
+            runs.append(run)
+            starts.append(start)
+            while idx < len(text_idxs) and text_idxs[idx] <= start:
+                idx += 1
+            cuts = []
+            while idx < len(text_idxs) and text_idxs[idx] < end:
+                cuts.append(text_idxs[idx])
+                idx += 1
+            if not cuts:
+                continue
+            run_text = offsets.text[start:end]
+            run._r.text = run_text[:cuts[0] - start]
+            prev_r = run._r
+            for cut, next_cut in zip(cuts, cuts[1:] + [end]):
+                nrun = self._p._new_r()
+                _copy_rPr(run._r, nrun)
+                prev_r.addnext(nrun)
+                nrun.text = run_text[cut - start:next_cut - start]
+                runs.append(Run(nrun, self))
+                starts.append(cut)
+                prev_r = nrun
+        starts.append(len(offsets))
+        offsets.runs, offsets.starts = runs, starts
+
+    def _split_run(self, run_idx, run_offset):
+        """
+        Split the run at *run_idx* in two at character *run_offset* within
+        it and return the new |Run| holding the trailing text. The new run
+        has the same formatting as the original.
+        """
+        offsets = self._run_offsets
+        run = offsets.runs[run_idx]
+        run_text = run.text
+        nrun = self._p._new_r()
+        _copy_rPr(run._r, nrun)
+        run._r.addnext(nrun)
+        nrun.text = run_text[run_offset:]
+        run._r.text = run_text[:run_offset]
+        new_run = Run(nrun, self)
+        offsets.insert_run(run_idx + 1, new_run, offsets.starts[run_idx] + run_offset)
+        return new_run
+
+
+class _RunOffsets(object):
+    """
+    Index of the runs in a paragraph by character offset. *starts* is the
+    prefix sum of run text lengths, the offset at which each run begins in
+    the paragraph text, followed by the total text length, such that the
+    text of ``runs[i]`` occupies ``text[starts[i]:starts[i+1]]``.
+    """
+    def __init__(self, runs):
+        self.runs = runs
+        texts = [run.text for run in runs]
+        self.text = ''.join(texts)
+        starts = [0]
+        for text in texts:
+            starts.append(starts[-1] + len(text))
+        self.starts = starts
+
+    def __len__(self):
+        return self.starts[-1]
+
+    def insert_run(self, run_idx, run, start=None):
+        """
+        Record *run* at position *run_idx*, beginning at character offset
+        *start*. *start* defaults to the offset of the run it displaces, as
+        for an empty run; the paragraph text is unchanged either way.
+        """
+        if start is None:
+            start = self.starts[run_idx]
+        self.runs.insert(run_idx, run)
+        self.starts.insert(run_idx, start)
+
+    def merge_runs(self, first_idx, last_idx):
+        """
+        Drop the runs following *first_idx* up to and including *last_idx*,
+        whose text has been merged into the run at *first_idx*.
+        """
+        del self.runs[first_idx + 1:last_idx + 1]
+        del self.starts[first_idx + 1:last_idx + 1]
+
+    def run_at(self, offset):
+        """
+        Return ``(run_idx, run_offset)`` pair for the run containing the
+        character at *offset*. Raises |ValueError| if *offset* is outside the
+        paragraph text.
+        """
+        if not 0 <= offset < len(self):
+            raise ValueError('text index out of range of paragraph')
+        run_idx = bisect_right(self.starts, offset) - 1
+        return run_idx, offset - self.starts[run_idx]
+
+    def run_ending_at(self, offset):
+        """
+        Return ``(run_idx, run_offset)`` pair for the run containing the
+        character immediately before *offset*, such that *run_offset* is the
+        position just past that character in the run text.
+        """
+        if not 0 < offset <= len(self):
+            raise ValueError('text index out of range of paragraph')
+        run_idx = bisect_left(self.starts, offset) - 1
+        return run_idx, offset - self.starts[run_idx]
+
+
+def _copy_rPr(r, new_r):
+    """
+    Give *new_r* a copy of the run properties of *r*, if it has any.
+    """
+    rPr = r.rPr
+    if rPr is not None:
+        new_r._remove_rPr()
+        new_r._insert_rPr(deepcopy(rPr))
@@ -9,11 +9,11 @@ from __future__ import (
 )
 
 from ..enum.text import WD_LINE_SPACING
-from ..shared import ElementProxy, Emu, lazyproperty, Length, Pt, Twips
+from ..shared import Emu, FormatProxy, lazyproperty, Length, Pt, Twips
 from .tabstops import TabStops
 
 
-class ParagraphFormat(ElementProxy):
+class ParagraphFormat(FormatProxy):
     """
     Provides access to paragraph formatting such as justification,
     indentation, line spacing, space before and after, and widow/orphan
@@ -251,7 +251,7 @@ class ParagraphFormat(ElementProxy):
         paragraph format.
         """
         pPr = self._element.get_or_add_pPr()
-        return TabStops(pPr)
+        return TabStops(pPr, self._parent)
 
     @property
     def widow_control(self):
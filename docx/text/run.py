@@ -5,6 +5,7 @@ Run-related proxy objects for python-docx, Run in particular.
 """
 
 from __future__ import absolute_import, print_function, unicode_literals
+from copy import deepcopy
 from datetime import datetime
 
 from docx.oxml.ns import qn
@@ -52,6 +53,7 @@ class Run(Parented):
             br.type = type_
         if clear is not None:
             br.clear = clear
+        self._text_changed()
 
     def add_picture(self, image_path_or_stream, width=None, height=None):
         """
@@ -76,6 +78,7 @@ class Run(Parented):
         interprets as a tab character.
         """
         self._r._add_tab()
+        self._text_changed()
 
     def add_text(self, text):
         """
@@ -85,10 +88,11 @@ class Run(Parented):
         :attr:`Run.text` property.
         """
         t = self._r.add_t(text)
+        self._text_changed()
         return _Text(t)
 
     def add_comment(self, text, author='python-docx', initials='pd', dtime=None):
-        comment_part = self.part._comments_part.element
+        comment_part = self.part._comments_part
         if dtime is None:
             dtime = str(datetime.now()).replace(' ', 'T')
         comment = self._r.add_comm(author, comment_part, initials, dtime, text)
@@ -112,6 +116,7 @@ class Run(Parented):
         formatting is preserved.
         """
         self._r.clear_content()
+        self._text_changed()
         return self
 
     @property
@@ -122,6 +127,19 @@ class Run(Parented):
         """
         return Font(self._element)
 
+    @property
+    def effective_font(self):
+        """
+        A read-only |Font| object reporting the character formatting in
+        effect for this run, resolved from its direct formatting, its
+        character style, the style of its paragraph and the document
+        defaults. A property is |None| only when no level of the style
+        hierarchy specifies it. The object is a snapshot over a copy of the
+        resolved formatting, so it does not reflect later changes to this
+        run, and changing it affects neither this run nor any other.
+        """
+        return Font(deepcopy(self.part.formatting_cascade.run_properties(self._r)))
+
     @property
     def italic(self):
         """
@@ -176,6 +194,7 @@ class Run(Parented):
     @text.setter
     def text(self, text):
         self._r.text = text
+        self._text_changed()
 
     @property
     def underline(self):
@@ -201,8 +220,7 @@ class Run(Parented):
         _id = self._r.footnote_id
 
         if _id is not None:
-            footnotes_part = self._parent._parent.part._footnotes_part.element
-            footnote = footnotes_part.get_footnote_by_id(_id)
+            footnote = self.part._footnotes_part.get_footnote_by_id(_id)
             return footnote.paragraph.text
         else:
             return None
@@ -238,11 +256,15 @@ class Run(Parented):
 
     @property
     def comments(self):
-        comment_part = self._parent._parent.part._comments_part.element
         comment_refs = self._element.findall(qn('w:commentReference'))
-        ids = [int(ref.get(qn('w:id'))) for ref in comment_refs]
-        coms = [com for com in comment_part if com._id in ids]
-        return [Comment(com, comment_part) for com in coms]
+        if not comment_refs:
+            return []
+        comments_part = self.part._comments_part
+        coms = [
+            comments_part.get_comment_by_id(int(ref.get(qn('w:id'))))
+            for ref in comment_refs
+        ]
+        return [Comment(com, comments_part.element) for com in coms if com is not None]
 
     def add_ole_object_to_run(self, ole_object_path):
         """
@@ -258,7 +280,7 @@ class Run(Parented):
             blob = f.read()
         target_part = Part(partname=partname, content_type=content_type, blob=blob)
         rel_id: str = self.part.rels._next_rId
-        self.part.rels.add_relationship(reltype=reltype, target=target_part, rId=rel_id)
+        self.part.load_rel(reltype, target_part, rel_id)
         return rel_id
 
     def add_fldChar(self, fldCharType, fldLock: bool = False, dirty: bool = False):
@@ -280,6 +302,17 @@ class Run(Parented):
         else:
             self._r._remove_instr_text()
 
+    def _text_changed(self):
+        """
+        Report a change to the text of this run to the paragraph holding it,
+        which discards the run offsets cached for it and the text index of
+        its block item container. Runs parented by other objects have no
+        cached offsets to discard.
+        """
+        text_changed = getattr(self._parent, '_text_changed', None)
+        if text_changed is not None:
+            text_changed()
+
 
 class _Text(object):
     """
@@ -8,11 +8,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from ..shared import ElementProxy
+from ..shared import FormatProxy
 from docx.enum.text import WD_TAB_ALIGNMENT, WD_TAB_LEADER
 
 
-class TabStops(ElementProxy):
+class TabStops(FormatProxy):
     """
     A sequence of |TabStop| objects providing access to the tab stops of
     a paragraph or paragraph style. Supports iteration, indexed access, del,
@@ -23,8 +23,8 @@ class TabStops(ElementProxy):
 
     __slots__ = ('_pPr')
 
-    def __init__(self, element):
-        super(TabStops, self).__init__(element, None)
+    def __init__(self, element, parent=None):
+        super(TabStops, self).__init__(element, parent)
         self._pPr = element
 
     def __delitem__(self, idx):
@@ -39,6 +39,7 @@ class TabStops(ElementProxy):
 
         if len(tabs) == 0:
             self._pPr.remove(tabs)
+        self._formatting_changed()
 
     def __getitem__(self, idx):
         """
@@ -48,7 +49,7 @@ class TabStops(ElementProxy):
         if tabs is None:
             raise IndexError('TabStops object is empty')
         tab = tabs.tab_lst[idx]
-        return TabStop(tab)
+        return TabStop(tab, self._parent)
 
     def __iter__(self):
         """
@@ -58,7 +59,7 @@ class TabStops(ElementProxy):
         tabs = self._pPr.tabs
         if tabs is not None:
             for tab in tabs.tab_lst:
-                yield TabStop(tab)
+                yield TabStop(tab, self._parent)
 
     def __len__(self):
         tabs = self._pPr.tabs
@@ -79,16 +80,18 @@ class TabStops(ElementProxy):
         """
         tabs = self._pPr.get_or_add_tabs()
         tab = tabs.insert_tab_in_order(position, alignment, leader)
-        return TabStop(tab)
+        self._formatting_changed()
+        return TabStop(tab, self._parent)
 
     def clear_all(self):
         """
         Remove all custom tab stops.
         """
         self._pPr._remove_tabs()
+        self._formatting_changed()
 
 
-class TabStop(ElementProxy):
+class TabStop(FormatProxy):
     """
     An individual tab stop applying to a paragraph or style. Accessed using
     list semantics on its containing |TabStops| object.
@@ -96,8 +99,8 @@ class TabStop(ElementProxy):
 
     __slots__ = ('_tab')
 
-    def __init__(self, element):
-        super(TabStop, self).__init__(element, None)
+    def __init__(self, element, parent=None):
+        super(TabStop, self).__init__(element, parent)
         self._tab = element
 
     @property
@@ -0,0 +1,208 @@
+# encoding: utf-8
+
+"""
+|DocumentTextIndex| object, mapping offsets in the text of a block item
+container to the paragraphs holding them.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import re
+
+from .text.paragraph import Paragraph
+
+
+class DocumentTextIndex(object):
+    """
+    Index of the text of the paragraphs in a block item container such as
+    the document body. The *text* of the index is the text of each
+    paragraph concatenated in document order, and a global offset into it
+    is mapped to a ``(paragraph, offset)`` pair by bisection over the start
+    offset of each paragraph.
+
+    Runs, paragraphs and block item containers report edits made through
+    them to the index of their container, so it stays valid across edits
+    made through the library. Paragraph offsets are recomputed on next use after
+    a paragraph's text changes and the paragraph list is re-read after
+    a paragraph is added or removed.
+    """
+    def __init__(self, container):
+        self._container = container
+        self._paragraphs = None
+        self._paragraph_for = {}
+        self._paragraphs_stale = False
+        self._starts = None
+        self._text = None
+
+    def __len__(self):
+        return self._paragraph_starts[-1]
+
+    def add_comment(self, start, end, text, author='Wayen', initials='W', dtime=None):
+        """
+        Return a new ``<w:comment>`` element having *text*, anchored to the
+        text between global offsets *start* and *end*. The range may span
+        any number of paragraphs.
+        """
+        if not 0 <= start < end <= len(self):
+            raise ValueError('comment range out of range of document text')
+        if dtime is None:
+            dtime = str(datetime.now()).replace(' ', 'T')
+        para_begin, begin_offset = self.locate(start)
+        para_end, end_offset = self.locate_end(end)
+        if para_begin is para_end:
+            return para_begin.add_comment_by_range(
+                text, author, initials, dtime, begin_offset, end_offset
+            )
+        comment, comment_id = para_begin.add_cross_paragraph_comment_start_by_textidx(
+            author, initials, dtime, text, begin_offset
+        )
+        para_end.add_cross_paragraph_comment_end_by_textidx(comment_id, end_offset)
+        return comment
+
+    def add_insert(self, offset, text, author='Wayen', initials='W', dtime=None):
+        """
+        Return an |Insert| object for a new ``<w:ins>`` revision containing
+        *text* at global *offset*. An offset falling between two paragraphs
+        inserts at the start of the latter.
+        """
+        if not 0 <= offset <= len(self) or not self.paragraphs:
+            raise ValueError('ins_index should be in range of document text')
+        if offset == len(self):
+            paragraph = self.paragraphs[-1]
+            return paragraph.add_insert_by_range(
+                text, author, initials, dtime, len(paragraph._run_offsets)
+            )
+        paragraph, local_offset = self.locate(offset)
+        return paragraph.add_insert_by_range(
+            text, author, initials, dtime, local_offset
+        )
+
+    def find(self, query, start=0, ignore_case=False, regex=False):
+        """
+        Return ``(start, end)`` global offsets of the first match of *query*
+        at or after *start*, or |None| if there is no match. *query* is
+        a regular expression when *regex* is |True|.
+        """
+        if not (ignore_case or regex):
+            idx = self.text.find(query, start)
+            return None if idx == -1 else (idx, idx + len(query))
+        match = self._pattern(query, ignore_case, regex).search(self.text, start)
+        return None if match is None else match.span()
+
+    def find_all(self, query, ignore_case=False, regex=False):
+        """
+        Return a list of ``(start, end)`` global offsets of each
+        non-overlapping, non-empty match of *query* in document order.
+        """
+        pattern = self._pattern(query, ignore_case, regex)
+        return [
+            match.span() for match in pattern.finditer(self.text)
+            if match.end() > match.start()
+        ]
+
+    def locate(self, offset):
+        """
+        Return ``(paragraph, offset)`` pair for the paragraph containing the
+        character at global *offset* and its offset within that paragraph.
+        """
+        starts = self._paragraph_starts
+        if not 0 <= offset < starts[-1]:
+            raise ValueError('text index out of range of document text')
+        idx = bisect_right(starts, offset) - 1
+        return self.paragraphs[idx], offset - starts[idx]
+
+    def locate_end(self, offset):
+        """
+        Return ``(paragraph, offset)`` pair for the paragraph containing the
+        character immediately before global *offset* and the offset just
+        past that character within the paragraph.
+        """
+        starts = self._paragraph_starts
+        if not 0 < offset <= starts[-1]:
+            raise ValueError('text index out of range of document text')
+        idx = bisect_left(starts, offset) - 1
+        return self.paragraphs[idx], offset - starts[idx]
+
+    @property
+    def paragraphs(self):
+        """
+        List of the |Paragraph| objects indexed, in document order.
+        """
+        if self._paragraphs is None or self._paragraphs_stale:
+            container = self._container
+            known = self._paragraph_for
+            self._paragraphs = [
+                known.get(p) or Paragraph(p, container)
+                for p in container._element.p_lst
+            ]
+            self._paragraph_for = dict((para._p, para) for para in self._paragraphs)
+            self._paragraphs_stale = False
+        return self._paragraphs
+
+    @property
+    def text(self):
+        """
+        The text of all indexed paragraphs, concatenated without separator.
+        """
+        if self._text is None:
+            self._index_text()
+        return self._text
+
+    def _paragraph_text_changed(self, paragraph):
+        """
+        Called by *paragraph* after its text changes. *paragraph* need not
+        be the paragraph object held by this index for the same ``<w:p>``.
+        """
+        self._starts = None
+        self._text = None
+        indexed = self._paragraph_for.get(paragraph._p)
+        if indexed is not None and indexed is not paragraph:
+            indexed._reset_run_offsets()
+
+    def _runs_changed(self):
+        """
+        Called after the runs of indexed paragraphs are restructured without
+        a change to their text, such as by :meth:`Document.normalize_runs`.
+        """
+        for paragraph in self._paragraph_for.values():
+            paragraph._reset_run_offsets()
+
+    def _paragraphs_changed(self):
+        """
+        Called after a paragraph is added to or removed from the container.
+        Paragraph objects already handed out are reused when the paragraph
+        list is next read.
+        """
+        self._paragraphs_stale = True
+        self._starts = None
+        self._text = None
+
+    @property
+    def _paragraph_starts(self):
+        """
+        Prefix sum of paragraph text lengths; the global offset at which
+        each paragraph begins, followed by the total text length.
+        """
+        if self._starts is None:
+            self._index_text()
+        return self._starts
+
+    def _index_text(self):
+        """
+        Compute the index text and paragraph start offsets in one pass over
+        the paragraphs, reading paragraph text directly from the XML rather
+        than through the run offsets of each paragraph.
+        """
+        texts = [paragraph._p.text for paragraph in self.paragraphs]
+        starts = [0]
+        for text in texts:
+            starts.append(starts[-1] + len(text))
+        self._text = ''.join(texts)
+        self._starts = starts
+
+    @staticmethod
+    def _pattern(query, ignore_case, regex):
+        flags = re.IGNORECASE if ignore_case else 0
+        return re.compile(query if regex else re.escape(query), flags)
@@ -0,0 +1,124 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.image.image module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import hashlib
+import io
+import os
+import zipfile
+
+import pytest
+
+import docx
+from docx.image.image import Image, ImageCache
+
+from ..unitutil import png_bytes
+
+
+class DescribeImage(object):
+
+    def it_parses_the_header_of_an_image_file(self, path):
+        image = Image.from_file(path)
+
+        assert (image.px_width, image.px_height) == (3, 2)
+        assert image.content_type == 'image/png'
+        assert image.filename == 'picture.png'
+        assert image.blob == png_bytes(3, 2)
+        assert image.blob_path is None
+
+    def it_can_keep_an_image_file_by_reference(self, path):
+        image = Image.from_file(path, keep_file=True)
+
+        assert image._blob is None
+        assert image.blob_path == path
+        assert (image.px_width, image.px_height) == (3, 2)
+        assert image.sha1 == hashlib.sha1(png_bytes(3, 2)).hexdigest()
+        assert image.blob == png_bytes(3, 2)
+
+    def it_reads_an_image_kept_by_reference_only_to_save_it(self, path):
+        document = docx.Document()
+        document.add_picture(Image.from_file(path, keep_file=True))
+        image_part = next(iter(document.part.package.image_parts))
+        stream = io.BytesIO()
+
+        document.save(stream)
+
+        assert image_part._blob_bytes is None
+        with zipfile.ZipFile(stream) as zipf:
+            assert zipf.read('word/media/image1.png') == png_bytes(3, 2)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def path(self, tmpdir):
+        path = str(tmpdir.join('picture.png'))
+        with open(path, 'wb') as f:
+            f.write(png_bytes(3, 2))
+        return path
+
+
+class DescribeImageCache(object):
+
+    def it_returns_the_cached_image_for_an_unchanged_file(self, path):
+        cache = ImageCache()
+
+        image = cache.image_for(path)
+
+        assert cache.image_for(path) is image
+        assert image.blob == png_bytes(2, 2)
+        assert len(cache) == 1
+
+    def it_loads_a_file_again_once_it_changes(self, path):
+        cache = ImageCache()
+        image = cache.image_for(path)
+        with open(path, 'wb') as f:
+            f.write(png_bytes(4, 4))
+        os.utime(path, (0, 0))
+
+        changed = cache.image_for(path)
+
+        assert changed is not image
+        assert changed.px_width == 4
+
+    def it_returns_the_cached_image_for_a_stream_of_the_same_bytes(self):
+        cache = ImageCache()
+
+        image = cache.image_for(io.BytesIO(png_bytes(shade=7)))
+
+        assert cache.image_for(io.BytesIO(png_bytes(shade=7))) is image
+        assert cache.image_for(io.BytesIO(png_bytes(shade=8))) is not image
+        assert image.sha1 == hashlib.sha1(png_bytes(shade=7)).hexdigest()
+
+    def it_evicts_the_least_recently_used_image(self):
+        cache = ImageCache(max_images=2)
+        streams = [io.BytesIO(png_bytes(shade=shade)) for shade in (1, 2, 3)]
+        first = cache.image_for(streams[0])
+        second = cache.image_for(streams[1])
+        cache.image_for(streams[0])
+
+        cache.image_for(streams[2])
+
+        assert len(cache) == 2
+        assert cache.image_for(streams[0]) is first
+        assert cache.image_for(streams[1]) is not second
+
+    def it_does_not_cache_when_a_limit_is_zero(self):
+        cache = ImageCache(max_bytes=0)
+
+        image = cache.image_for(io.BytesIO(png_bytes()))
+
+        assert len(cache) == 0
+        assert cache.image_for(io.BytesIO(png_bytes())) is not image
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def path(self, tmpdir):
+        path = str(tmpdir.join('picture.png'))
+        with open(path, 'wb') as f:
+            f.write(png_bytes(2, 2))
+        return path
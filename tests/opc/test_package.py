@@ -0,0 +1,108 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.opc.package module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.opc.package import OpcPackage
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+
+RT_A = 'http://example.com/a'
+RT_B = 'http://example.com/b'
+HEADER = '/word/header%d.xml'
+
+
+class DescribeOpcPackage(object):
+
+    def it_generates_each_part_once_in_depth_first_order(self, package, parts):
+        a, b, c = parts
+
+        assert list(package.iter_parts()) == [a, b, c]
+        assert package.parts == [a, b, c]
+
+    def it_generates_each_relationship_once(self, package, parts):
+        rels = list(package.iter_rels())
+
+        assert len(rels) == 6
+        assert len(set(id(rel) for rel in rels)) == 6
+
+    def it_indexes_its_parts_by_partname(self, package, parts):
+        assert package._parts_by_partname == dict((p.partname, p) for p in parts)
+
+    def it_indexes_the_parts_related_once_indexed(self, package, parts):
+        b = parts[1]
+        package._parts_by_partname
+        header = _Part(package, HEADER % 1)
+        footer = _Part(package, '/word/footer1.xml')
+
+        b.relate_to(header, RT_A)
+        header.load_rel(RT_A, footer, 'rId1')
+
+        assert package._parts_by_partname[HEADER % 1] is header
+        assert package._parts_by_partname['/word/footer1.xml'] is footer
+        assert package.next_partname(HEADER) == HEADER % 2
+
+    def it_ignores_relationships_between_unreachable_parts(self, package, parts):
+        package._parts_by_partname
+        orphan = _Part(package, '/word/orphan.xml')
+
+        orphan.relate_to(_Part(package, HEADER % 1), RT_A)
+
+        assert package.next_partname(HEADER) == HEADER % 1
+
+    def it_rebuilds_its_index_after_a_relationship_is_dropped(self, package, parts):
+        b = parts[1]
+        header = _Part(package, HEADER % 1)
+        rId = b.relate_to(header, RT_A)
+        assert package.next_partname(HEADER) == HEADER % 2
+
+        b.drop_rel(rId)
+
+        assert package.next_partname(HEADER) == HEADER % 1
+        assert header not in package.parts
+
+    def it_rebuilds_its_index_after_a_part_is_renamed(self, package, parts):
+        c = parts[2]
+        assert package.next_partname('/word/c%d.xml') == '/word/c2.xml'
+
+        c.partname = PackURI('/word/d.xml')
+
+        assert package.next_partname('/word/c%d.xml') == '/word/c1.xml'
+        assert package._parts_by_partname['/word/d.xml'] is c
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def package(self):
+        return OpcPackage()
+
+    @pytest.fixture
+    def parts(self, package):
+        """
+        Parts *a*, *b* and *c*, where the package relates to *a*, *a* to *b*
+        and *c*, and *b* back to *a* and on to *c*.
+        """
+        a, b, c = (_Part(package, '/word/%s1.xml' % name) for name in 'abc')
+        package.relate_to(a, RT_A)
+        a.relate_to(b, RT_A)
+        a.relate_to(c, RT_B)
+        b.relate_to(a, RT_A)
+        b.relate_to(c, RT_B)
+        c.relate_to(b, RT_A)
+        return a, b, c
+
+
+class _Part(Part):
+    """
+    Part with no XML, so no relationship of it counts as referenced.
+    """
+    def __init__(self, package, partname):
+        super(_Part, self).__init__(PackURI(partname), 'application/xml', b'', package)
+
+    def _rel_ref_count(self, rId):
+        return 0
@@ -0,0 +1,73 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.opc.phys_pkg module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+import zipfile
+
+import pytest
+
+from docx.opc import phys_pkg
+from docx.opc.packuri import PackURI
+from docx.opc.phys_pkg import PhysPkgReader, PhysPkgWriter
+
+
+class Describe_ZipPkgWriter(object):
+
+    def it_copies_a_member_still_compressed(self, source):
+        copied = self._copy_members(source)
+
+        for membername, (compress_type, blob) in self.MEMBERS.items():
+            zinfo = copied.getinfo(membername)
+            assert zinfo.compress_type == compress_type
+            assert copied.read(membername) == blob
+        assert copied.testzip() is None
+
+    def it_recompresses_a_member_without_the_zipfile_internals(
+        self, source, monkeypatch
+    ):
+        monkeypatch.setattr(
+            phys_pkg, '_ZIPFILE_INTERNALS', ('_no_such_attribute',)
+        )
+
+        copied = self._copy_members(source)
+
+        for membername, (compress_type, blob) in self.MEMBERS.items():
+            zinfo = copied.getinfo(membername)
+            assert zinfo.compress_type == compress_type
+            assert copied.read(membername) == blob
+        assert copied.testzip() is None
+
+    # helpers --------------------------------------------------------
+
+    MEMBERS = {
+        'word/document.xml': (zipfile.ZIP_DEFLATED, b'<w:document/>' * 10000),
+        'word/media/image1.png': (zipfile.ZIP_STORED, bytes(bytearray(range(256))) * 400),
+    }
+
+    def _copy_members(self, source):
+        phys_reader = PhysPkgReader(source)
+        stream = io.BytesIO()
+        phys_writer = PhysPkgWriter(stream)
+        for membername in sorted(self.MEMBERS):
+            pack_uri = PackURI('/%s' % membername)
+            assert phys_writer.copy_member(phys_reader, pack_uri, pack_uri) is True
+        phys_writer.close()
+        phys_reader.close()
+        stream.seek(0)
+        return zipfile.ZipFile(stream)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def source(self):
+        stream = io.BytesIO()
+        with zipfile.ZipFile(stream, 'w') as zipf:
+            for membername, (compress_type, blob) in sorted(self.MEMBERS.items()):
+                zipf.writestr(membername, blob, compress_type=compress_type)
+        stream.seek(0)
+        return stream
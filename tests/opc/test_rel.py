@@ -0,0 +1,66 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.opc.rel module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.opc.rel import Relationships, _Relationship
+
+RT_A = 'http://example.com/a'
+RT_B = 'http://example.com/b'
+
+
+class DescribeRelationships(object):
+
+    def it_indexes_a_relationship_set_directly(self, rels):
+        part = object()
+
+        rels['rId9'] = _Relationship('rId9', RT_B, part, '/')
+
+        assert rels.part_with_reltype(RT_B) is part
+        assert rels.get_or_add(RT_B, part).rId == 'rId9'
+        assert rels.related_parts['rId9'] is part
+
+    def it_unindexes_a_relationship_replaced_directly(self, rels):
+        part = object()
+
+        rels['rId1'] = _Relationship('rId1', RT_B, part, '/')
+
+        assert rels.part_with_reltype(RT_A) is rels['rId2'].target_part
+        assert rels.part_with_reltype(RT_B) is part
+        assert list(rels) == ['rId1', 'rId2']
+
+    def it_indexes_relationships_added_by_update(self, rels):
+        part, other = object(), object()
+
+        rels.update({'rId5': _Relationship('rId5', RT_B, part, '/')})
+        rels.setdefault('rId6', _Relationship('rId6', RT_B, other, '/'))
+
+        assert rels.get_or_add(RT_B, part).rId == 'rId5'
+        assert rels.get_or_add(RT_B, other).rId == 'rId6'
+
+    def it_unindexes_relationships_removed_by_popitem_and_clear(self, rels):
+        rId, rel = rels.popitem()
+
+        assert rId == 'rId2'
+        assert rels.get_or_add(RT_A, rel.target_part).rId == 'rId2'
+
+        rels.clear()
+
+        assert rels.related_parts == {}
+        with pytest.raises(KeyError):
+            rels.part_with_reltype(RT_A)
+        assert rels.get_or_add(RT_B, object()).rId == 'rId1'
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def rels(self):
+        rels = Relationships('/')
+        rels.add_relationship(RT_A, object(), 'rId1')
+        rels.add_relationship(RT_A, object(), 'rId2')
+        return rels
@@ -0,0 +1,129 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.oxml.text.paragraph module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml.text.paragraph import _merge_key, _merge_runs
+
+
+def _p(runs_xml):
+    return parse_xml('<w:p %s>%s</w:p>' % (nsdecls('w'), runs_xml))
+
+
+class DescribeCT_P(object):
+
+    def it_knows_the_text_of_its_runs(self):
+        p = _p(
+            '<w:pPr><w:pStyle w:val="Body"/></w:pPr>'
+            '<w:r><w:rPr><w:b/></w:rPr><w:t>a</w:t><w:tab/><w:t>b</w:t></w:r>'
+            '<w:r><w:br/><w:t xml:space="preserve"> c </w:t><w:cr/></w:r>'
+            '<w:r><w:noBreakHyphen/><w:lastRenderedPageBreak/><w:t>d</w:t></w:r>'
+        )
+        assert p.text == 'a\tb\n c \n-d'
+        assert p.text == ''.join(r.text for r in p.r_lst)
+
+    def it_leaves_out_runs_nested_in_other_elements_from_its_text(self):
+        p = _p(
+            '<w:r><w:t>a</w:t></w:r>'
+            '<w:hyperlink><w:r><w:t>b</w:t></w:r></w:hyperlink>'
+            '<w:ins w:id="1"><w:r><w:t>c</w:t></w:r></w:ins>'
+        )
+        assert p.text == 'a'
+        assert p.full_text == 'abc'
+
+    def it_has_no_text_without_runs(self):
+        assert _p('<w:pPr/>').text == ''
+        assert _p('<w:pPr/>').full_text == ''
+
+
+class DescribeCT_R(object):
+
+    def it_knows_its_text(self):
+        r = _p(
+            '<w:r><w:rPr><w:i/></w:rPr><w:t>a</w:t><w:tab/><w:br/><w:cr/>'
+            '<w:noBreakHyphen/><w:footnoteReference w:id="2"/><w:t>b</w:t></w:r>'
+        )[0]
+        assert r.text == 'a\t\n\n-b'
+
+    def it_round_trips_text_with_tabs_and_line_breaks(self):
+        r = _p('<w:r/>')[0]
+        r.text = 'a\tb\nc'
+        assert [child.tag for child in r] == [
+            qn('w:t'), qn('w:tab'), qn('w:t'), qn('w:br'), qn('w:t')
+        ]
+        assert r.text == 'a\tb\nc'
+
+
+class Describe_merge_key(object):
+
+    def it_is_the_same_for_runs_of_the_same_format(self):
+        p = _p(
+            '<w:r><w:rPr><w:b/><w:sz w:val="24"/></w:rPr><w:t>a</w:t></w:r>'
+            '<w:r><w:rPr><w:b/><w:sz w:val="24"/></w:rPr><w:tab/><w:t>b</w:t>'
+            '<w:lastRenderedPageBreak/></w:r>'
+        )
+        assert _merge_key(p[0]) == _merge_key(p[1])
+
+    def it_differs_for_runs_of_different_format(self):
+        p = _p(
+            '<w:r><w:rPr><w:sz w:val="24"/></w:rPr><w:t>a</w:t></w:r>'
+            '<w:r><w:rPr><w:sz w:val="28"/></w:rPr><w:t>b</w:t></w:r>'
+            '<w:r><w:t>c</w:t></w:r>'
+        )
+        keys = [_merge_key(r) for r in p]
+        assert len(set(keys)) == 3
+        assert keys[2] == ()
+
+    def it_is_None_for_a_run_holding_more_than_text(self):
+        p = _p(
+            '<w:r><w:t>a</w:t><w:footnoteReference w:id="1"/></w:r>'
+            '<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+        )
+        assert [_merge_key(r) for r in p] == [None, None]
+
+
+class Describe_merge_runs(object):
+
+    def it_moves_the_content_of_later_runs_into_the_first(self):
+        p = _p(
+            '<w:r><w:rPr><w:b/></w:rPr><w:t>Hello</w:t></w:r>'
+            '<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve"> big </w:t></w:r>'
+            '<w:r><w:rPr><w:b/></w:rPr><w:tab/><w:t>world</w:t></w:r>'
+        )
+
+        merged = _merge_runs(p, list(p))
+
+        assert merged == 2
+        assert len(p) == 1
+        r = p[0]
+        assert [child.tag for child in r] == [
+            qn('w:rPr'), qn('w:t'), qn('w:tab'), qn('w:t')
+        ]
+        assert r[1].text == 'Hello big '
+        assert r[1].get(qn('xml:space')) == 'preserve'
+
+    def it_keeps_only_the_first_last_rendered_page_break(self):
+        p = _p(
+            '<w:r><w:lastRenderedPageBreak/><w:t>a</w:t></w:r>'
+            '<w:r><w:lastRenderedPageBreak/><w:t>b</w:t></w:r>'
+            '<w:r><w:t>c</w:t><w:lastRenderedPageBreak/></w:r>'
+        )
+
+        _merge_runs(p, list(p))
+
+        r = p[0]
+        assert [child.tag for child in r] == [
+            qn('w:lastRenderedPageBreak'), qn('w:t')
+        ]
+        assert r[1].text == 'abc'
+
+    def it_leaves_a_single_run_alone(self):
+        p = _p('<w:r><w:t>a</w:t></w:r>')
+
+        assert _merge_runs(p, list(p)) == 0
+        assert len(p) == 1
@@ -0,0 +1,49 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.styles.style module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import docx
+from docx.enum.text import WD_TAB_ALIGNMENT
+from docx.shared import Inches, Pt, RGBColor
+
+
+class DescribeParagraphStyle(object):
+
+    def it_keeps_resolved_formatting_when_its_formatting_is_read(self):
+        document = docx.Document()
+        run = document.add_paragraph('text').runs[0]
+        run.effective_font.size
+        cascade = document.part.formatting_cascade
+
+        for _ in range(3):
+            document.styles['Normal'].font.size
+            document.styles['Normal'].paragraph_format.space_after
+
+        assert len(cascade._runs) == 1
+
+    def it_discards_resolved_formatting_when_a_held_font_is_changed(self):
+        document = docx.Document()
+        font = document.styles['Normal'].font
+        run = document.add_paragraph('text').runs[0]
+        run.effective_font.size
+
+        font.size = Pt(9)
+        font.color.rgb = RGBColor(1, 2, 3)
+
+        assert run.effective_font.size == Pt(9)
+        assert run.effective_font.color.rgb == RGBColor(1, 2, 3)
+
+    def it_discards_resolved_formatting_when_a_tab_stop_is_added(self):
+        document = docx.Document()
+        tab_stops = document.styles['Normal'].paragraph_format.tab_stops
+        paragraph = document.add_paragraph('text')
+        assert len(paragraph.effective_paragraph_format.tab_stops) == 0
+
+        tab_stops.add_tab_stop(Inches(1), WD_TAB_ALIGNMENT.CENTER)
+
+        effective_tab_stops = paragraph.effective_paragraph_format.tab_stops
+        assert [t.position for t in effective_tab_stops] == [Inches(1)]
@@ -0,0 +1,37 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.styles.styles module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from copy import deepcopy
+
+import docx
+from docx.oxml.ns import qn
+
+
+class DescribeStyles(object):
+
+    def it_finds_a_style_inserted_into_the_xml_directly(self):
+        styles = docx.Document().styles
+        assert 'Heading 1' in styles
+        assert 'Custom' not in styles
+
+        style = deepcopy(styles['Heading 1'].element)
+        style.set(qn('w:styleId'), 'Custom')
+        style.name_val = 'Custom'
+        styles.element.append(style)
+
+        assert 'Custom' in styles
+        assert styles['Custom'].style_id == 'Custom'
+
+    def it_drops_a_style_removed_from_the_xml_directly(self):
+        styles = docx.Document().styles
+        assert 'Heading 1' in styles
+
+        style = styles['Heading 1'].element
+        styles.element.remove(style)
+
+        assert 'Heading 1' not in styles
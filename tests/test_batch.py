@@ -0,0 +1,85 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.batch module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+
+import pytest
+
+import docx
+from docx.batch import process_documents
+
+
+def first_text(document):
+    return document.paragraphs[0].text
+
+
+def fail_on_bad(document):
+    if document.paragraphs[0].text == 'bad':
+        raise ValueError('bad document')
+    return 'ok'
+
+
+def return_document(document):
+    return document
+
+
+_opened = []
+
+
+def keep_document(document):
+    _opened.append(document)
+    document.add_paragraph('added')
+
+
+class DescribeProcessDocuments(object):
+
+    def it_returns_results_in_the_order_of_the_paths(self, paths):
+        summary = process_documents(first_text, paths, processes=2)
+
+        assert [r.path for r in summary] == paths
+        assert [r.value for r in summary] == ['doc 0', 'doc 1', 'bad', 'doc 3']
+        assert summary.succeeded == 4
+
+    def it_records_an_error_without_stopping_the_batch(self, paths):
+        summary = process_documents(fail_on_bad, paths, processes=2)
+
+        assert [r.ok for r in summary] == [True, True, False, True]
+        assert 'bad document' in summary.failures[0].error
+        assert summary.results[2].value is None
+
+    def it_records_a_value_that_cannot_be_pickled_as_an_error(self, paths):
+        summary = process_documents(return_document, paths[:2], processes=2)
+
+        assert [r.ok for r in summary] == [False, False]
+        assert all('pickle' in r.error for r in summary)
+
+    def it_closes_each_document_read_lazily(self, paths, tmpdir):
+        output_dir = str(tmpdir.join('out'))
+        del _opened[:]
+
+        summary = process_documents(
+            keep_document, paths[:2], output_dir, processes=0, lazy=True
+        )
+
+        assert summary.succeeded == 2
+        assert [d.part.package._pkg_reader for d in _opened] == [None, None]
+        saved = docx.Document(os.path.join(output_dir, 'doc1.docx'))
+        assert [p.text for p in saved.paragraphs] == ['doc 1', 'added']
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def paths(self, tmpdir):
+        paths = []
+        for idx, text in enumerate(('doc 0', 'doc 1', 'bad', 'doc 3')):
+            document = docx.Document()
+            document.add_paragraph(text)
+            path = str(tmpdir.join('doc%d.docx' % idx))
+            document.save(path)
+            paths.append(path)
+        return paths
@@ -0,0 +1,114 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.document module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+import zipfile
+
+import docx
+
+from .unitutil import png_bytes
+
+
+class DescribeDocument(object):
+
+    def it_releases_a_lazily_read_file_when_closed(self, tmpdir):
+        path = str(tmpdir.join('source.docx'))
+        docx.Document().save(path)
+
+        with docx.Document(path, lazy=True) as document:
+            document.add_paragraph('foo')
+            package = document.part.package
+            zipf = package._pkg_reader._phys_reader._zipf
+            document.save(str(tmpdir.join('saved.docx')))
+
+        assert zipf.fp is None
+        assert package._pkg_reader is None
+        saved = docx.Document(str(tmpdir.join('saved.docx')))
+        assert [p.text for p in saved.paragraphs] == ['foo']
+
+    def it_can_close_a_document_read_in_full(self):
+        document = docx.Document()
+
+        document.close()
+
+        assert document.paragraphs == []
+
+    def it_saves_at_the_given_compress_level(self):
+        document = docx.Document()
+        for _ in range(50):
+            document.add_paragraph('The quick brown fox jumps over the lazy dog.')
+        fastest, smallest = io.BytesIO(), io.BytesIO()
+
+        document.save(fastest, compress_level=0)
+        document.save(smallest, compress_level=9)
+
+        assert len(fastest.getvalue()) > len(smallest.getvalue())
+        saved = docx.Document(io.BytesIO(fastest.getvalue()))
+        assert len(saved.paragraphs) == 50
+
+    def it_stores_media_uncompressed_when_asked(self):
+        document = docx.Document()
+        document.add_picture(io.BytesIO(png_bytes(64, 64)))
+        default, stored = io.BytesIO(), io.BytesIO()
+
+        document.save(default)
+        document.save(stored, store_media=True)
+
+        assert _compress_types(default)['word/media/image1.png'] == zipfile.ZIP_DEFLATED
+        compress_types = _compress_types(stored)
+        assert compress_types['word/media/image1.png'] == zipfile.ZIP_STORED
+        assert compress_types['word/document.xml'] == zipfile.ZIP_DEFLATED
+
+    def it_can_save_to_a_stream_that_cannot_seek(self):
+        document = docx.Document()
+        document.add_paragraph('foo')
+        stream = _WriteOnlyStream()
+
+        document.save(stream)
+
+        saved = docx.Document(io.BytesIO(b''.join(stream.chunks)))
+        assert [p.text for p in saved.paragraphs] == ['foo']
+
+    def it_can_generate_its_saved_bytes_in_chunks(self):
+        document = docx.Document()
+        document.add_paragraph('foo')
+        document.add_picture(io.BytesIO(png_bytes()))
+        saved_whole = io.BytesIO()
+        document.save(saved_whole)
+
+        chunks = list(document.iter_save_chunks())
+
+        assert len(chunks) > 1
+        saved = docx.Document(io.BytesIO(b''.join(chunks)))
+        assert [p.text for p in saved.paragraphs][0] == 'foo'
+        assert len(saved.inline_shapes) == 1
+        assert _compress_types(io.BytesIO(b''.join(chunks))) == _compress_types(saved_whole)
+
+
+class _WriteOnlyStream(object):
+    """
+    File-like object that can only be written to, like a pipe or socket.
+    """
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def _compress_types(stream):
+    """
+    Dict mapping each member name of the zip archive in *stream* to its
+    compression method.
+    """
+    with zipfile.ZipFile(io.BytesIO(stream.getvalue())) as zipf:
+        return dict((info.filename, info.compress_type) for info in zipf.infolist())
@@ -0,0 +1,74 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.package module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+
+import docx
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.packuri import PackURI
+from docx.package import ImageParts
+from docx.parts.image import ImagePart
+
+from .unitutil import png_bytes
+
+
+class DescribeImageParts(object):
+
+    def it_reuses_the_part_of_an_image_added_again(self):
+        document = docx.Document()
+
+        document.add_picture(io.BytesIO(png_bytes(shade=1)))
+        document.add_picture(io.BytesIO(png_bytes(shade=1)))
+
+        image_parts = list(document.part.package.image_parts)
+        assert len(image_parts) == 1
+        rIds = [shape._inline.graphic.graphicData.pic.blipFill.blip.embed
+                for shape in document.inline_shapes]
+        assert rIds[0] == rIds[1]
+
+    def it_numbers_new_image_parts_in_order(self):
+        image_parts = ImageParts()
+
+        partnames = [
+            image_parts.get_or_add_image_part(io.BytesIO(png_bytes(shade=shade))).partname
+            for shade in (2, 3, 2, 4)
+        ]
+
+        assert partnames == [
+            '/word/media/image1.png', '/word/media/image2.png',
+            '/word/media/image1.png', '/word/media/image3.png',
+        ]
+
+    def it_uses_the_lowest_number_not_taken_by_a_loaded_part(self):
+        image_parts = ImageParts()
+        for n in (1, 3):
+            image_parts.append(_image_part(n, png_bytes(shade=n)))
+
+        first = image_parts.get_or_add_image_part(io.BytesIO(png_bytes(shade=10)))
+        second = image_parts.get_or_add_image_part(io.BytesIO(png_bytes(shade=11)))
+
+        assert (first.partname, second.partname) == (
+            '/word/media/image2.png', '/word/media/image4.png'
+        )
+
+    def it_finds_a_loaded_part_by_the_digest_of_its_image(self):
+        image_parts = ImageParts()
+        loaded = _image_part(1, png_bytes(shade=5))
+        image_parts.append(loaded)
+
+        image_part = image_parts.get_or_add_image_part(io.BytesIO(png_bytes(shade=5)))
+
+        assert image_part is loaded
+        assert len(image_parts) == 1
+
+
+def _image_part(n, blob):
+    """
+    An |ImagePart| numbered *n* as if loaded from a package, holding *blob*.
+    """
+    return ImagePart(PackURI('/word/media/image%d.png' % n), CT.PNG, blob)
@@ -0,0 +1,41 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.sdt module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import docx
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.sdt import StructuredDocumentTag
+from docx.shared import Inches
+
+
+class DescribeStructuredDocumentTag(object):
+
+    def it_leaves_a_content_control_without_content_unchanged_when_read(self):
+        document = docx.Document()
+        sdt = parse_xml('<w:sdt %s><w:sdtPr/></w:sdt>' % nsdecls('w'))
+        document.element.body.insert(0, sdt)
+
+        sdt_ = StructuredDocumentTag(sdt, document._body)
+
+        assert sdt_.paragraphs == []
+        assert sdt_.tables == []
+        assert list(sdt_.iter_block_items()) == []
+        assert sdt.sdtContent is None
+
+    def it_adds_the_content_element_when_a_paragraph_is_added(self):
+        document = docx.Document()
+        sdt = parse_xml('<w:sdt %s><w:sdtPr/></w:sdt>' % nsdecls('w'))
+        document.element.body.insert(0, sdt)
+        sdt_ = StructuredDocumentTag(sdt, document._body)
+
+        sdt_.add_paragraph('foo')
+        sdt_.add_table(1, 1, Inches(1))
+
+        assert [child.tag for child in sdt] == [qn('w:sdtPr'), qn('w:sdtContent')]
+        assert [p.text for p in sdt_.paragraphs] == ['foo']
+        assert len(sdt_.tables) == 1
@@ -0,0 +1,140 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.stream module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+import docx
+from docx.stream import (
+    ParagraphRecord, StreamingDocument, StreamReader, TableRecord
+)
+
+
+class DescribeStreamReader(object):
+
+    def it_generates_a_record_for_each_block_in_order(self, path):
+        with StreamReader(path) as reader:
+            blocks = list(reader.iter_blocks())
+
+        assert [type(b) for b in blocks] == [
+            ParagraphRecord, ParagraphRecord, TableRecord, ParagraphRecord
+        ]
+        heading, body, table, last = blocks
+        assert heading.text == 'Title'
+        assert heading.style_id == 'Heading1'
+        assert body.text == 'plain bold'
+        assert [(r.text, r.bold) for r in body.runs if r.text] == [
+            ('plain ', None), ('bold', True)
+        ]
+        assert [[c.text for c in row] for row in table.rows] == [['a', 'b'], ['c', 'd']]
+        assert last.text == 'end'
+
+    def it_generates_the_paragraphs_in_table_cells_too(self, path):
+        with StreamReader(path) as reader:
+            texts = [p.text for p in reader.iter_paragraphs()]
+
+        assert texts == ['Title', 'plain bold', 'a', 'b', 'c', 'd', 'end']
+
+    def it_can_iterate_its_blocks_more_than_once(self, path):
+        with StreamReader(path) as reader:
+            first = [b.text for b in reader.iter_paragraphs()]
+            second = [b.text for b in reader.iter_paragraphs()]
+
+        assert first == second
+
+    def it_generates_a_record_for_each_comment(self, path):
+        with StreamReader(path) as reader:
+            comments = list(reader.iter_comments())
+            body = list(reader.iter_blocks())[1]
+
+        assert [(c.text, c.author, c.initials) for c in comments] == [
+            ('check this', 'Reviewer', 'RV')
+        ]
+        assert body.comment_ids == [comments[0].id]
+
+    def it_generates_no_comments_for_a_document_without_any(self, tmpdir):
+        path = str(tmpdir.join('plain.docx'))
+        docx.Document().save(path)
+
+        with StreamReader(path) as reader:
+            assert list(reader.iter_comments()) == []
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def path(self, tmpdir):
+        path = str(tmpdir.join('source.docx'))
+        document = docx.Document()
+        document.add_heading('Title', level=1)
+        paragraph = document.add_paragraph('plain ')
+        paragraph.add_run('bold').bold = True
+        paragraph.add_comment('check this', author='Reviewer', initials='RV')
+        table = document.add_table(rows=2, cols=2)
+        for cell, text in zip(table._cells, 'abcd'):
+            cell.text = text
+        document.add_paragraph('end')
+        document.save(path)
+        return path
+
+
+class DescribeStreamingDocument(object):
+
+    def it_writes_the_blocks_added_to_it(self, tmpdir):
+        path = str(tmpdir.join('streamed.docx'))
+
+        with StreamingDocument(path) as document:
+            document.add_heading('Results', level=1)
+            document.add_paragraph('first')
+            table = document.add_table(rows=1, cols=2)
+            table.cell(0, 0).text = 'x'
+            document.add_paragraph('last', style='Heading 2')
+
+        saved = docx.Document(path)
+        assert [(p.text, p.style.name) for p in saved.paragraphs] == [
+            ('Results', 'Heading 1'), ('first', 'Normal'), ('last', 'Heading 2')
+        ]
+        assert saved.tables[0].cell(0, 0).text == 'x'
+        assert saved.element.body[-1].tag == saved.element.body.sectPr.tag
+
+    def it_holds_only_the_last_block_in_memory(self, tmpdir):
+        document = StreamingDocument(str(tmpdir.join('streamed.docx')))
+        body = document.document.element.body
+
+        document.add_paragraph('first')
+        document.add_paragraph('second')
+
+        assert [child.tag for child in body] == [body.sectPr.tag]
+        document.close()
+
+    def it_starts_with_the_body_of_its_template(self, tmpdir):
+        template = str(tmpdir.join('template.docx'))
+        source = docx.Document()
+        source.add_paragraph('preamble')
+        source.save(template)
+        path = str(tmpdir.join('streamed.docx'))
+
+        with StreamingDocument(path, template=template) as document:
+            document.add_paragraph('added')
+
+        assert [p.text for p in docx.Document(path).paragraphs] == ['preamble', 'added']
+
+    def it_writes_the_other_parts_on_close(self, tmpdir):
+        path = str(tmpdir.join('streamed.docx'))
+
+        with StreamingDocument(path) as document:
+            paragraph = document.add_paragraph('reviewed')
+            paragraph.add_comment('looks fine', author='Reviewer')
+
+        with StreamReader(path) as reader:
+            assert [c.text for c in reader.iter_comments()] == ['looks fine']
+
+    def it_refuses_blocks_once_closed(self, tmpdir):
+        document = StreamingDocument(str(tmpdir.join('streamed.docx')))
+        document.close()
+
+        with pytest.raises(ValueError):
+            document.add_paragraph('late')
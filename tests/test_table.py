@@ -0,0 +1,80 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.table module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import docx
+from docx.oxml.ns import qn
+
+
+class DescribeTable(object):
+
+    def it_can_be_built_from_rows_of_values(self):
+        document = docx.Document()
+
+        table = document.add_table_from_data(
+            [('Name', 'Qty'), ('apple', 3), ('pear', None, 'ripe')], style='Table Grid'
+        )
+
+        assert [[c.text for c in row.cells] for row in table.rows] == [
+            ['Name', 'Qty', ''], ['apple', '3', ''], ['pear', '', 'ripe'],
+        ]
+        assert table.style.name == 'Table Grid'
+        assert document.tables[0]._tbl is table._tbl
+
+    def it_maps_tabs_and_line_breaks_in_values_as_run_text_does(self):
+        table = docx.Document().add_table_from_data([('a\tb\nc',)])
+
+        r = table.cell(0, 0).paragraphs[0].runs[0]._r
+
+        assert [child.tag for child in r] == [
+            qn('w:t'), qn('w:tab'), qn('w:t'), qn('w:br'), qn('w:t')
+        ]
+        assert table.cell(0, 0).text == 'a\tb\nc'
+
+    def it_can_add_a_table_from_data_in_a_cell(self):
+        outer = docx.Document().add_table(rows=1, cols=1)
+
+        inner = outer.cell(0, 0).add_table_from_data([(1, 2)])
+
+        assert [c.text for c in inner.rows[0].cells] == ['1', '2']
+        assert outer.cell(0, 0).tables[0]._tbl is inner._tbl
+
+    def it_keeps_its_cell_grid_up_to_date_as_rows_are_added(self):
+        table = docx.Document().add_table_from_data([('a', 'b')])
+        table.cell(0, 0)
+
+        row = table.add_row()
+        row.cells[1].text = 'd'
+
+        assert table.cell(1, 1).text == 'd'
+        assert table.cell(1, 1)._tc is row.cells[1]._tc
+
+    def it_rebuilds_its_cell_grid_after_columns_change(self):
+        document = docx.Document()
+        table = document.add_table_from_data([('a', 'b'), ('c', 'd')])
+        table.cell(0, 0)
+
+        table.add_column(document._block_width)
+        table.cell(1, 2).text = 'x'
+
+        assert table.cell(1, 2).text == 'x'
+        assert [c.text for c in table.rows[1].cells] == ['c', 'd', 'x']
+
+    def it_rebuilds_its_cell_grid_after_cells_are_merged(self):
+        table = docx.Document().add_table_from_data([('a', 'b'), ('c', 'd')])
+        table.cell(0, 0)
+
+        table.cell(0, 0).merge(table.cell(0, 1))
+
+        assert table.cell(0, 1)._tc is table.cell(0, 0)._tc
+        assert table.cell(1, 1).text == 'd'
+
+    def it_can_iterate_the_text_of_its_rows(self):
+        table = docx.Document().add_table_from_data([('a', 'b'), ('c', 'd')])
+        table.cell(0, 0).merge(table.cell(0, 1))
+
+        assert list(table.iter_rows_values()) == [('a\nb', 'a\nb'), ('c', 'd')]
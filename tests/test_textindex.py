@@ -0,0 +1,41 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.textindex module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import docx
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+
+class DescribeDocumentTextIndex(object):
+
+    def it_reindexes_after_a_run_is_edited(self):
+        document = docx.Document()
+        document.add_paragraph('Hello world')
+        assert document.text_index.text == 'Hello world'
+
+        document.paragraphs[0].runs[0].text = 'XXXXXX Hello world'
+        document.add_comment('a', 'b', '2020', 'world', 'c')
+
+        assert document.text_index.text == 'XXXXXX Hello world'
+        runs = document.paragraphs[0].runs
+        assert [r.text for r in runs] == ['XXXXXX Hello ', 'world']
+        assert runs[1]._r.getprevious().tag == qn('w:commentRangeStart')
+
+    def it_reindexes_after_a_run_of_another_paragraph_object_is_edited(self):
+        document = docx.Document()
+        document.add_paragraph('one')
+        document.add_paragraph('two')
+        text_index = document.text_index
+        assert text_index.find('two') == (3, 6)
+
+        paragraph = Paragraph(document.element.body[1], document._body)
+        paragraph.runs[0].add_text(' three')
+
+        assert text_index.text == 'onetwo three'
+        assert text_index.find('three') == (7, 12)
+        assert text_index.locate(7)[1] == 4
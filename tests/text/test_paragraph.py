@@ -0,0 +1,199 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.text.paragraph module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import io
+
+import pytest
+
+import docx
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from ..unitutil import png_bytes
+
+
+def _commented_text(paragraph, comment_id):
+    """
+    Text of the runs between the range start and end markers of the comment
+    having *comment_id* in *paragraph*.
+    """
+    text, inside = [], False
+    for child in paragraph._p.iterchildren():
+        if child.tag in (qn('w:commentRangeStart'), qn('w:commentRangeEnd')):
+            if child.get(qn('w:id')) == str(comment_id):
+                if inside:
+                    break
+                inside = True
+        elif inside and child.tag == qn('w:r'):
+            text.append(child.text)
+    return ''.join(text)
+
+
+class DescribeParagraph(object):
+
+    def it_rebuilds_its_run_offsets_after_a_run_is_edited(self):
+        paragraph = docx.Document().add_paragraph('Hello world')
+        paragraph.add_comment_by_range('c1', rangeStart=0, rangeEnd=5)
+
+        paragraph.runs[-1].text = ' brave new world'
+        comment = paragraph.add_comment_by_text('c2', query_text='new')
+
+        assert paragraph.text == 'Hello brave new world'
+        assert _commented_text(paragraph, comment._id) == 'new'
+
+    def it_rebuilds_its_run_offsets_after_run_content_is_added(self):
+        paragraph = docx.Document().add_paragraph('Hello')
+        paragraph.get_matched_run_info('Hello')
+
+        run = paragraph.runs[0]
+        run.add_tab()
+        run.add_text('big')
+        run.add_break()
+        run.add_text('world')
+        comment = paragraph.add_comment_by_text('c', query_text='world')
+
+        assert paragraph.text == 'Hello\tbig\nworld'
+        assert _commented_text(paragraph, comment._id) == 'world'
+
+    def it_rebuilds_its_run_offsets_after_a_run_is_cleared(self):
+        paragraph = docx.Document().add_paragraph('Hello ')
+        paragraph.add_run('world')
+        paragraph.get_matched_run_info('world')
+
+        paragraph.runs[0].clear()
+        comment = paragraph.add_comment_by_range('c', rangeStart=0, rangeEnd=3)
+
+        assert _commented_text(paragraph, comment._id) == 'wor'
+
+    def it_allocates_comment_ids_two_apart(self):
+        paragraph = docx.Document().add_paragraph('Hello')
+
+        comments = [paragraph.add_comment('note') for _ in range(3)]
+
+        assert [comment._id for comment in comments] == [0, 2, 4]
+
+    def it_adds_a_comment_to_the_comments_element_of_its_document(self):
+        document = docx.Document()
+        paragraph = document.add_paragraph('Hello')
+        first = paragraph.add_comment('note')
+        comments = document.part._comments_part.element
+
+        comment = paragraph.add_comment('note', comment_part=comments)
+        last = paragraph.add_comment('note')
+
+        assert [first._id, comment._id, last._id] == [0, 2, 4]
+
+    def it_rejects_a_comments_element_of_another_document(self):
+        paragraph = docx.Document().add_paragraph('Hello')
+        comments = parse_xml('<w:comments %s/>' % nsdecls('w'))
+
+        with pytest.raises(ValueError):
+            paragraph.add_comment('note', comment_part=comments)
+
+    def it_gives_each_revision_mark_a_unique_id(self):
+        document = docx.Document()
+        paragraph = document.add_paragraph('Hello brave new world')
+        first = paragraph.add_insert_by_range('Oh, ', ins_index=0)
+
+        paragraph.apply_annotations([
+            (6, 12, 'delete', None),
+            (21, 21, 'insert', '!'),
+        ])
+        document.add_paragraph('Again').add_insert_by_range(' and again', ins_index=5)
+
+        body = document.element.body
+        ids = body.xpath('.//w:ins/@w:id | .//w:del/@w:id')
+        assert first._ins._id == 1
+        assert sorted(int(id_) for id_ in ids) == [1, 2, 3, 4]
+
+    def it_keeps_a_picture_inside_a_commented_range(self):
+        document = docx.Document()
+        paragraph = document.add_paragraph('Hello ')
+        paragraph.add_run().add_picture(io.BytesIO(png_bytes()))
+        paragraph.add_run('world')
+
+        comment = paragraph.add_comment_by_range('c', rangeStart=3, rangeEnd=9)
+
+        assert len(document.inline_shapes) == 1
+        assert paragraph.text == 'Hello world'
+        assert _commented_text(paragraph, comment._id) == 'lo wor'
+
+    def it_keeps_a_footnote_reference_inside_a_commented_range(self):
+        document = docx.Document()
+        paragraph = document.add_paragraph('Hello')
+        paragraph.add_footnote('note')
+        paragraph.add_run(' world')
+
+        comment = paragraph.add_comment_by_text('c', query_text='Hello world')
+
+        assert len(paragraph._p.xpath('.//w:footnoteReference')) == 1
+        assert _commented_text(paragraph, comment._id) == 'Hello world'
+
+    def it_merges_the_text_runs_of_a_commented_range(self):
+        paragraph = docx.Document().add_paragraph('Hello ')
+        paragraph.add_run('brave ').bold = True
+        paragraph.add_run('world')
+
+        comment = paragraph.add_comment_by_text('c', query_text='lo brave wo')
+
+        assert [r.text for r in paragraph.runs] == ['Hel', 'lo brave wo', 'rld']
+        assert _commented_text(paragraph, comment._id) == 'lo brave wo'
+
+    def it_keeps_comment_anchors_out_of_an_overlapping_deletion(self):
+        paragraph = docx.Document().add_paragraph('Hello brave new world')
+
+        comment, _ = paragraph.apply_annotations([
+            (0, 11, 'comment', 'c'),
+            (6, 16, 'delete', None),
+        ])
+
+        dels = paragraph._p.xpath('./w:del')
+        assert paragraph._p.xpath('./w:del//w:commentReference') == []
+        assert paragraph._p.xpath('./w:del/w:commentRangeEnd') == []
+        assert ''.join(paragraph._p.xpath('./w:del/w:r/w:delText/text()')) == 'brave new '
+        assert len(dels) == 2
+        assert len(set(d.get(qn('w:id')) for d in dels)) == 2
+        assert paragraph._p.xpath('./w:commentRangeEnd/@w:id') == [str(comment._id)]
+
+    def it_numbers_revision_marks_across_the_parts_of_its_document(self):
+        document = docx.Document()
+        header = document.sections[0].header.paragraphs[0]
+        header.add_run('Header')
+        header._p.append(parse_xml(
+            '<w:ins %s w:id="7" w:author="a"><w:r><w:t> text</w:t></w:r></w:ins>'
+            % nsdecls('w')
+        ))
+        body = document.add_paragraph('Body')
+
+        body_ins = body.add_insert_by_range(' text', ins_index=4)
+        header_ins = header.add_insert_by_range('!', ins_index=0)
+
+        assert [body_ins._ins._id, header_ins._ins._id] == [8, 9]
+
+    def it_keeps_changes_to_its_effective_paragraph_format_to_itself(self):
+        document = docx.Document()
+        paragraph_a = document.add_paragraph('a')
+        paragraph_b = document.add_paragraph('b')
+        assert paragraph_a.effective_paragraph_format.keep_together is None
+
+        paragraph_a.effective_paragraph_format.keep_together = True
+
+        assert paragraph_a.effective_paragraph_format.keep_together is None
+        assert paragraph_b.effective_paragraph_format.keep_together is None
+        assert paragraph_a.paragraph_format.keep_together is None
+
+    def it_merges_runs_holding_a_last_rendered_page_break(self):
+        paragraph = docx.Document().add_paragraph('Hello ')
+        paragraph._p.append(parse_xml(
+            '<w:r %s><w:lastRenderedPageBreak/><w:t>world</w:t></w:r>'
+            % nsdecls('w')
+        ))
+
+        paragraph.normalize_runs()
+
+        assert [r.text for r in paragraph.runs] == ['Hello world']
@@ -0,0 +1,24 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.text.run module
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import docx
+
+
+class DescribeRun(object):
+
+    def it_keeps_changes_to_its_effective_font_to_itself(self):
+        document = docx.Document()
+        run_a = document.add_paragraph('a').runs[0]
+        run_b = document.add_paragraph('b').runs[0]
+        assert run_a.effective_font.bold is None
+
+        run_a.effective_font.bold = True
+
+        assert run_a.effective_font.bold is None
+        assert run_b.effective_font.bold is None
+        assert run_a.font.bold is None
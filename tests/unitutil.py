@@ -0,0 +1,26 @@
+# encoding: utf-8
+
+"""
+Utility functions for the test suite.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import struct
+import zlib
+
+
+def png_bytes(width=1, height=1, shade=0):
+    """
+    Return the bytes of a grayscale PNG image of *width* x *height* pixels,
+    each of gray level *shade*, so images of different *shade* differ.
+    """
+    def chunk(kind, data):
+        crc = zlib.crc32(kind + data) & 0xffffffff
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', crc)
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0)
+    rows = (b'\x00' + bytes(bytearray([shade])) * width) * height
+    return (
+        b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', ihdr) +
+        chunk(b'IDAT', zlib.compress(rows)) + chunk(b'IEND', b'')
+    )